@@ -0,0 +1,104 @@
+import flet as ft
+from backend.nodos_ast import ASTNode, etiqueta_nodo
+
+class ArbolAST():
+    """Vista del AST como un árbol desplegable.
+
+    Empieza con todos los nodos cerrados y cada nodo arma las filas de sus hijos
+    recién la primera vez que se despliega (de a HIJOS_POR_PAGINA), así el costo
+    depende de lo que el usuario abre y no del tamaño del árbol.
+
+    Solo las instrucciones y los miembros guardan su posición; los demás nodos
+    (expresiones, valores) muestran la del ancestro más cercano que la tiene,
+    marcada con "en".
+    """
+
+    HIJOS_POR_PAGINA = 100
+    SANGRIA = 20
+
+    def __init__(self, page):
+        self.page = page
+        self.nodos = ft.Column(spacing=0, scroll=ft.ScrollMode.AUTO, expand=True)
+
+    def mostrar(self, ast):
+        """Reemplaza el árbol que se muestra (None lo vacía); la página se actualiza aparte"""
+        self.nodos.controls = [self.fila_nodo(ast)] if ast is not None else []
+
+    def fila_nodo(self, nodo, posicion_padre=None):
+        """Fila de un nodo (o de un valor que no es nodo) con el lugar para sus hijos.
+
+        posicion_padre es la posición del ancestro más cercano que tiene una, que se
+        muestra si el nodo no tiene la suya.
+        """
+        propia = nodo.posicion if isinstance(nodo, ASTNode) else None
+        posicion_hijos = propia or posicion_padre
+        if propia:
+            posicion = f"línea {propia[0]}, columna {propia[1]}"
+        elif posicion_padre:
+            posicion = f"en línea {posicion_padre[0]}, columna {posicion_padre[1]}"
+        else:
+            posicion = ""
+
+        if isinstance(nodo, ASTNode):
+            texto = etiqueta_nodo(nodo.tipo, nodo.valor)
+            desplegable = bool(nodo.hijos)
+        else:
+            texto = etiqueta_nodo("Valor", nodo)
+            desplegable = False
+
+        hijos = ft.Column(spacing=0, visible=False)
+        fila = ft.Column(spacing=0)
+
+        if desplegable:
+            boton = ft.IconButton(icon=ft.icons.ARROW_RIGHT, icon_color="black", icon_size=18)
+
+            def alternar(e):
+                if hijos.data is None:
+                    hijos.data = list(nodo.hijos_grafico())  # Se arman recién al desplegar por primera vez
+                    self.agregar_hijos(hijos, 0, posicion_hijos)
+                hijos.visible = not hijos.visible
+                boton.icon = ft.icons.ARROW_DROP_DOWN if hijos.visible else ft.icons.ARROW_RIGHT
+                fila.update()
+
+            boton.on_click = alternar
+        else:
+            boton = ft.Container(width=40)  # Lo que ocupa el botón, para alinear las hojas
+
+        fila.controls = [
+            ft.Row(
+                controls=[
+                    boton,
+                    ft.Text(texto, color="black", selectable=True),
+                    ft.Text(posicion, color="gray", size=12, italic=not propia),
+                ],
+                spacing=5,
+            ),
+            ft.Container(content=hijos, padding=ft.padding.only(left=self.SANGRIA)),
+        ]
+        return fila
+
+    def agregar_hijos(self, hijos, inicio, posicion_padre=None):
+        """Agrega a la columna hijos las filas de sus nodos desde inicio, de a una página"""
+        fin = inicio + self.HIJOS_POR_PAGINA
+        hijos.controls.extend(self.fila_nodo(hijo, posicion_padre) for hijo in hijos.data[inicio:fin])
+
+        restantes = len(hijos.data) - fin
+        if restantes > 0:
+            def mostrar_mas(e):
+                hijos.controls.remove(boton_mas)
+                self.agregar_hijos(hijos, fin, posicion_padre)
+                hijos.update()
+
+            boton_mas = ft.TextButton(f"Mostrar {min(restantes, self.HIJOS_POR_PAGINA)} más de {restantes}", on_click=mostrar_mas)
+            hijos.controls.append(boton_mas)
+
+    def arbolAST_component(self):
+        return ft.Container(
+            content=self.nodos,
+            bgcolor="white",
+            border=ft.border.all(1, "gray"),
+            border_radius=10,
+            padding=10,
+            width=800,
+            height=400,
+        )
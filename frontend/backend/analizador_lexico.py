@@ -1,78 +1,630 @@
+import hashlib
+import mmap
+import os
 import re
+from array import array
+from bisect import bisect_left, bisect_right
+from enum import IntEnum
+from types import MappingProxyType
+
+from .indice_lineas import IndiceLineas
+
+# Palabras reservadas: el lexer reconoce un identificador una sola vez y luego lo
+# clasifica con esta tabla, en lugar de probar un patrón \b(...)\b por grupo.
+PALABRAS_POR_TIPO = [
+    ("Tipo de dato", ("int", "float", "double", "boolean", "char", "string", "String", "long", "short", "byte")),
+    ("Condicional", ("if", "else")),
+    ("Bucle", ("for", "while", "do")),
+    ("Excepción", ("try", "catch", "throw", "finally")),
+    ("Token de Acceso", ("public", "private", "protected", "static", "final", "abstract")),
+    ("Estructura de Datos", ("array", "list", "set", "map", "queue", "stack")),
+    ("Palabra Reservada", ("class", "void", "return", "new", "this", "super", "instanceof", "switch", "case", "default", "break", "continue")),
+    ("Literal Booleano", ("true", "false")),
+    ("Literal Nulo", ("null",)),
+]
+
+PALABRAS_CLAVE = MappingProxyType({palabra: tipo for tipo, palabras in PALABRAS_POR_TIPO for palabra in palabras})
 
 # Definimos los patrones de tokens
 TOKEN_PATTERNS = [
     ("Comentario", r"//.*|/\*[\s\S]*?\*/"),
-    ("Tipo de dato", r"\b(int|float|double|boolean|char|string|String|long|short|byte)\b"),
-    ("Condicional", r"\b(if|else)\b"),
-    ("Bucle", r"\b(for|while|do)\b"),
-    ("Excepción", r"\b(try|catch|throw|finally)\b"),
-    ("Token de Acceso", r"\b(public|private|protected|static|final|abstract)\b"),
-    ("Estructura de Datos", r"\b(array|list|set|map|queue|stack)\b"),
+    ("ERROR", r"/\*[\s\S]*"),  # Comentario sin cerrar: un solo token hasta el final
     ("Imprimir", r"\b(System.out.print|System.out.println|System.out.printf)\b"),
     ("String Literal", r'"([^"\\]*(\\.[^"\\]*)*)"'),
+    ("ERROR", r'"[^"\\]*(?:\\.[^"\\]*)*'),  # String sin cerrar: un solo token hasta el final
     ("Número", r"\b\d+(\.\d+)?(e[+-]?\d+)?\b"),  # Incluye notación científica
-    ("Palabra Reservada", r"\b(class|void|return|new|this|super|instanceof|switch|case|default|break|continue)\b"),
-    ("Identificador", r"\b[a-zA-Z_][a-zA-Z0-9_]*\b"),
-    ("Operador Lógico", r"(&&|\|\||!)"),
-    ("Operador Relacional", r"(==|!=|<|>|<=|>=)"),
+    ("Identificador", r"\b[a-zA-Z_][a-zA-Z0-9_]*\b"),  # Se clasifica luego con PALABRAS_CLAVE
+    ("Operador Lógico", r"(&&|\|\||!(?!=))"),
+    ("Operador Relacional", r"(==|!=|<=|>=|<(?!<)|>(?!>))"),  # "<<" y ">>" son de bits o compuestos
     ("Operador de Asignación", r"="),
      ("Operador Compuesto", r"(\+=|-=|\*=|/=|%=|&=|\|=|\^=|<<=|>>=|>>>=)"),
     ("Operador de Incremento/Decremento", r"(\+\+|--)"),
     ("Operador Aritmético", r"[+\-*/%]"),
-    ("Operador de Bits", r"(&|\||\^|~|<<|>>|>>>)"),
+    ("Operador de Bits", r"(>>>|<<|>>|&|\||\^|~)"),
     ("Delimitador", r"[;{}(),:]"),
     ("Corchete Abierto", r"\["),
     ("Corchete Cerrado", r"\]"),
     ("Salto de Linea", r"\n"),
     ("WHITESPACE", r"[ \t]+"),
-    ("Literal Booleano", r"\b(true|false)\b"),
-    ("Literal Nulo", r"\b(null)\b"),
     ("ERROR", r".")  # Captura cualquier carácter inesperado
 ]
 
 TOKEN_REGEX = [(name, re.compile(pattern)) for name, pattern in TOKEN_PATTERNS] #Se compilan las expresiones regulares una sola vez antes del bucle
 
+# Expresión maestra: una sola alternancia con un grupo con nombre por patrón.
+# La alternancia se prueba de izquierda a derecha, así que respeta el mismo
+# orden de prioridad que TOKEN_PATTERNS. Los grupos se llaman T0, T1, ... porque
+# los nombres de los tokens no son identificadores válidos de Python.
+MASTER_REGEX = re.compile("|".join(f"(?P<T{i}>{pattern})" for i, (_, pattern) in enumerate(TOKEN_PATTERNS)))
+TIPOS_POR_GRUPO = {f"T{i}": name for i, (name, _) in enumerate(TOKEN_PATTERNS)}
+
+# Motores disponibles: "maestro" (una sola expresión) y "secuencial" (el original, patrón por patrón)
+MOTORES = ("maestro", "secuencial")
+MOTOR_POR_DEFECTO = "maestro"
+
+# Versión de la tabla de tokens: cambia sola al editar los patrones o las palabras
+# reservadas, así los resultados guardados en cache de una versión anterior no se usan.
+VERSION_LEXICO = hashlib.sha1(repr((TOKEN_PATTERNS, PALABRAS_POR_TIPO)).encode("utf-8")).hexdigest()[:12]
+
+# Tokens que el lexer reconoce pero no entrega
+TIPOS_IGNORADOS = frozenset(("WHITESPACE", "Salto de Linea", "Comentario"))
+
+# Tamaño de cada lectura cuando la fuente es un archivo
+TAMANO_BLOQUE = 64 * 1024
+
+# Por debajo de este tamaño lexer_paralelo analiza en el proceso actual
+TAMANO_MINIMO_PARALELO = 1024 * 1024
+
+# Caracteres que un token puede necesitar ver después de su final para decidir
+# su coincidencia (el patrón más largo de longitud fija es "System.out.println").
+# Un token que termina a menos de esta distancia del final del bloque leído se
+# vuelve a intentar con más texto.
+MARGEN_ANTICIPACION = 64
+
+# Tipos de token como enteros, en el mismo orden que NOMBRES_TIPO
+class TipoToken(IntEnum):
+    TIPO_DATO = 0
+    CONDICIONAL = 1
+    BUCLE = 2
+    EXCEPCION = 3
+    TOKEN_ACCESO = 4
+    ESTRUCTURA_DATOS = 5
+    IMPRIMIR = 6
+    STRING_LITERAL = 7
+    NUMERO = 8
+    PALABRA_RESERVADA = 9
+    IDENTIFICADOR = 10
+    OPERADOR_LOGICO = 11
+    OPERADOR_RELACIONAL = 12
+    OPERADOR_ASIGNACION = 13
+    OPERADOR_COMPUESTO = 14
+    OPERADOR_INCREMENTO = 15
+    OPERADOR_ARITMETICO = 16
+    OPERADOR_BITS = 17
+    DELIMITADOR = 18
+    CORCHETE_ABIERTO = 19
+    CORCHETE_CERRADO = 20
+    LITERAL_BOOLEANO = 21
+    LITERAL_NULO = 22
+    ERROR = 23
+
+# Nombre de cada tipo tal como aparece en las tuplas de tokens
+NOMBRES_TIPO = (
+    "Tipo de dato", "Condicional", "Bucle", "Excepción", "Token de Acceso", "Estructura de Datos",
+    "Imprimir", "String Literal", "Número", "Palabra Reservada", "Identificador",
+    "Operador Lógico", "Operador Relacional", "Operador de Asignación", "Operador Compuesto",
+    "Operador de Incremento/Decremento", "Operador Aritmético", "Operador de Bits",
+    "Delimitador", "Corchete Abierto", "Corchete Cerrado", "Literal Booleano", "Literal Nulo", "ERROR",
+)
+TIPO_POR_NOMBRE = MappingProxyType({nombre: TipoToken(i) for i, nombre in enumerate(NOMBRES_TIPO)})
+
+# Versiones en bytes para lexer_mmap. Solo se usan con archivos ASCII, donde \b,
+# \s y \d significan lo mismo que en la versión str.
+MASTER_REGEX_BYTES = re.compile(MASTER_REGEX.pattern.encode("ascii"))
+TIPOS_POR_GRUPO_BYTES = {grupo: TIPO_POR_NOMBRE[nombre] for grupo, nombre in TIPOS_POR_GRUPO.items() if nombre not in TIPOS_IGNORADOS}
+PALABRAS_CLAVE_BYTES = MappingProxyType({palabra.encode("ascii"): TIPO_POR_NOMBRE[tipo] for palabra, tipo in PALABRAS_CLAVE.items()})
+# Bytes que obligan a usar el camino str: no ASCII, o "\r" (el modo texto convierte "\r\n" en "\n")
+REQUIERE_TEXTO_BYTES = re.compile(rb"[\r\x80-\xff]")
+
+
+class TokenBuffer:
+    """Tokens guardados por columnas en arrays: tipo, inicio y fin.
+
+    Cada token ocupa 9 bytes en lugar de una tupla con dos strings. El valor se
+    obtiene recortando el código fuente y la (línea, columna) se calcula con un
+    IndiceLineas compartido, ambos solo cuando se piden. Indexar el buffer
+    devuelve un TokenView, que se comporta como la tupla (tipo, valor, línea, columna).
+    """
+
+    __slots__ = ("codigo", "tipos", "inicios", "fines", "_indice")
+
+    def __init__(self, codigo, indice=None):
+        self.codigo = codigo
+        self.tipos = array("B")
+        self.inicios = array("I")
+        self.fines = array("I")
+        self._indice = indice
+
+    @property
+    def indice(self):
+        """IndiceLineas del código, construido la primera vez que se necesita."""
+        if self._indice is None:
+            self._indice = IndiceLineas(self.codigo)
+        return self._indice
+
+    def agregar(self, tipo, inicio, fin):
+        self.tipos.append(tipo)
+        self.inicios.append(inicio)
+        self.fines.append(fin)
+
+    def tipo(self, indice):
+        """Tipo del token como entero (comparable con TipoToken)."""
+        return self.tipos[indice]
+
+    def valor(self, indice):
+        valor = self.codigo[self.inicios[indice]:self.fines[indice]]
+        if not isinstance(valor, str):
+            # Buffer sobre bytes o mmap (lexer_mmap): se decodifica solo este token
+            valor = valor.decode("ascii")
+        return valor
+
+    def posicion(self, indice):
+        """(línea, columna) donde empieza el token."""
+        return self.indice.posicion(self.inicios[indice])
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [TokenView(self, i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de token fuera de rango")
+        return TokenView(self, indice)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield TokenView(self, i)
+
+    def tuplas(self):
+        """Lista de tuplas (tipo, valor, línea, columna), igual a la que retorna lexer().
+
+        Recorre los tokens y las líneas a la vez, sin una búsqueda por token.
+        """
+        inicios_linea = self.indice.inicios
+        total_lineas = len(inicios_linea)
+        valor = self.valor
+        resultado = []
+        linea = 1
+        for i, (tipo, inicio) in enumerate(zip(self.tipos, self.inicios)):
+            while linea < total_lineas and inicios_linea[linea] <= inicio:
+                linea += 1
+            resultado.append((NOMBRES_TIPO[tipo], valor(i), linea, inicio - inicios_linea[linea - 1] + 1))
+        return resultado
+
+    def __repr__(self):
+        return repr([tuple(token) for token in self])
+
+    def cerrar(self):
+        """Cierra el mmap de lexer_mmap, si el buffer tiene uno.
+
+        El buffer sigue funcionando: el código pasa a ser el texto decodificado
+        (un archivo de lexer_mmap es ASCII, así los offsets no cambian). Hay que
+        llamarlo antes de guardar el buffer por mucho tiempo, porque cada mmap
+        abierto ocupa un descriptor de archivo.
+        """
+        codigo = self.codigo
+        if isinstance(codigo, mmap.mmap):
+            self.codigo = codigo[:].decode("ascii")
+            codigo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def __getstate__(self):
+        # Un mmap no se puede serializar: se envía el texto decodificado
+        codigo = self.codigo
+        if not isinstance(codigo, str):
+            codigo = codigo[:].decode("ascii")
+        return codigo, self.tipos, self.inicios, self.fines
+
+    def __setstate__(self, estado):
+        self.codigo, self.tipos, self.inicios, self.fines = estado
+        self._indice = None
+
+
+class TokenView:
+    """Vista de un token de un TokenBuffer con acceso estilo tupla."""
+
+    __slots__ = ("buffer", "indice")
+
+    def __init__(self, buffer, indice):
+        self.buffer = buffer
+        self.indice = indice
+
+    @property
+    def tipo(self):
+        return self.buffer.tipos[self.indice]
+
+    def __getitem__(self, campo):
+        if campo == 0:
+            return NOMBRES_TIPO[self.buffer.tipos[self.indice]]
+        if campo == 1:
+            return self.buffer.valor(self.indice)
+        return tuple(self)[campo]
+
+    def __iter__(self):
+        buffer, i = self.buffer, self.indice
+        yield NOMBRES_TIPO[buffer.tipos[i]]
+        yield buffer.valor(i)
+        yield from buffer.posicion(i)
+
+    def __len__(self):
+        return 4
+
+    def __eq__(self, otro):
+        if isinstance(otro, (tuple, TokenView)):
+            return tuple(self) == tuple(otro)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+
 #Función para análisis del código
-def lexer(code):
-    tokens = []
-    position = 0
-    line = 1  # Iniciar en la línea 1
-    column = 1  # Iniciar en la columna 1
-
-    while position < len(code):
-        match = None
-        for token_type, regex in TOKEN_REGEX:
-            match = regex.match(code, position)
-            
-            if match:
-
-                value = match.group(0)
-                token_length = len(value)  # Longitud del token encontrado
-
-                if token_type != "WHITESPACE" and token_type != "Salto de Linea" and token_type != "Comentario":  # Ignorar espacios
-                    tokens.append((token_type, value, line, column))
-
-                # Actualizar la posición, línea y columna
-                position = match.end()
-                # Contar saltos de línea en el token
-                newlines = value.count("\n")
-                if newlines > 0:
-                    line += newlines
-                    column = len(value.split("\n")[-1]) + 1  # Columna después del salto
-                else:
-                    column += token_length
-                break
+def lexer(code, motor=MOTOR_POR_DEFECTO):
+    """Analiza el código y retorna la lista de tokens (tipo, valor, línea, columna).
+
+    El parámetro motor permite elegir entre el motor "maestro" y el "secuencial"
+    para comparar ambos; los dos producen exactamente los mismos tokens.
+    """
+    return list(iter_tokens(code, motor))
+
+def lexer_compacto(code, motor=MOTOR_POR_DEFECTO):
+    """Analiza el código y retorna los tokens en un TokenBuffer."""
+    tokens = TokenBuffer(code)
+    agregar = tokens.agregar
+    for token_type, _, _, _, inicio, fin in _escanear(code, motor, TAMANO_BLOQUE, True):
+        agregar(TIPO_POR_NOMBRE[token_type], inicio, fin)
+    return tokens
+
+def lexer_mmap(ruta):
+    """Analiza un archivo directamente sobre un mmap de sus bytes.
+
+    No lee ni decodifica el archivo completo: el TokenBuffer guarda el mmap y cada
+    valor se decodifica al pedirlo. Si el archivo tiene bytes fuera de ASCII o
+    saltos "\r\n" se usa el camino normal, abriendo el archivo en modo texto.
+    El mmap queda abierto hasta TokenBuffer.cerrar() (o el final de un bloque
+    with sobre el buffer).
+    """
+    with open(ruta, "rb") as archivo:
+        try:
+            datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Archivo vacío
+            return TokenBuffer("")
+
+    if REQUIERE_TEXTO_BYTES.search(datos):
+        datos.close()
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            return lexer_compacto(archivo.read())
+
+    tokens = TokenBuffer(datos)
+    try:
+        agregar = tokens.agregar
+        match_at = MASTER_REGEX_BYTES.match
+        position = 0
+        longitud = len(datos)
+
+        while position < longitud:
+            match = match_at(datos, position)
+            if not match:
+                linea, columna = tokens.indice.posicion(position)
+                raise SyntaxError(
+                    f"Invalid character '{datos[position:position + 1].decode('ascii')}' at line {linea}, column {columna}. "
+                    f"Expected a valid Java token."
+                )
+
+            fin = match.end()
+            tipo = TIPOS_POR_GRUPO_BYTES.get(match.lastgroup)
+            if tipo is not None:  # None: espacios, saltos y comentarios
+                if tipo == TipoToken.IDENTIFICADOR:
+                    tipo = PALABRAS_CLAVE_BYTES.get(datos[position:fin], tipo)
+                agregar(tipo, position, fin)
+            position = fin
+    except BaseException:
+        datos.close()
+        raise
+
+    return tokens
+
+def lexer_paralelo(code, trabajadores=None):
+    """Igual que lexer(), pero repartiendo un código grande entre varios procesos."""
+    return lexer_paralelo_compacto(code, trabajadores).tuplas()
+
+def lexer_paralelo_compacto(code, trabajadores=None):
+    """Analiza un código grande en varios procesos y retorna un TokenBuffer.
+
+    El código se corta en fragmentos justo después de un salto de línea y cada
+    proceso analiza un fragmento por separado. Un corte solo es válido si el
+    fragmento anterior termina en un salto de línea que no forma parte de ningún
+    token (no está dentro de un comentario de bloque ni de un string); en el
+    primer corte inválido se descartan los fragmentos que faltan y se analiza de
+    una vez desde el inicio de ese fragmento hasta el final del código. Como cada
+    fragmento empieza en una línea nueva, las columnas no cambian y las líneas
+    salen del IndiceLineas del código completo.
+    """
+    trabajadores = trabajadores or os.cpu_count() or 1
+    if trabajadores == 1 or len(code) < TAMANO_MINIMO_PARALELO:
+        return lexer_compacto(code)
+
+    # Import diferido: concurrent.futures carga multiprocessing, que el lexer secuencial no usa
+    from concurrent.futures import ProcessPoolExecutor
+
+    cortes = _cortes_en_lineas(code, trabajadores)
+    fragmentos = [code[inicio:fin] for inicio, fin in zip(cortes, cortes[1:])]
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        resultados = list(pool.map(_lexer_fragmento, fragmentos))
+
+    tokens = TokenBuffer(code)
+    for i, (tipos, inicios, fines) in enumerate(resultados):
+        inicio = cortes[i]
+        # El último token no puede llegar al final del fragmento (salvo en el último).
+        # Si llega, el token sigue en los fragmentos siguientes y sus tokens no sirven:
+        # se analiza una sola vez el resto del código, en lugar de ir uniendo
+        # fragmentos de a uno y volver a analizar todo lo unido cada vez
+        if i + 1 < len(fragmentos) and fines and fines[-1] == cortes[i + 1] - inicio:
+            tipos, inicios, fines = _lexer_fragmento(code[inicio:])
+            ultimo = True
+        else:
+            ultimo = False
+        tokens.tipos.extend(tipos)
+        tokens.inicios.extend(array("I", [x + inicio for x in inicios]))
+        tokens.fines.extend(array("I", [x + inicio for x in fines]))
+        if ultimo:
+            break
+    return tokens
+
+def _cortes_en_lineas(code, partes):
+    """Offsets de corte en partes de tamaño parecido, cada uno justo después de un "\n".
+
+    Incluye 0 y len(code); nunca repite un offset.
+    """
+    cortes = [0]
+    for k in range(1, partes):
+        salto = code.find("\n", max(len(code) * k // partes, cortes[-1]))
+        if salto == -1:
+            break
+        if salto + 1 > cortes[-1]:
+            cortes.append(salto + 1)
+    if cortes[-1] < len(code):
+        cortes.append(len(code))
+    return cortes
+
+def _lexer_fragmento(fragmento):
+    """Trabajo de cada proceso de lexer_paralelo: solo los arrays, que se envían rápido."""
+    tokens = lexer_compacto(fragmento)
+    return tokens.tipos, tokens.inicios, tokens.fines
+
+def iter_tokens(fuente, motor=MOTOR_POR_DEFECTO, tamano_bloque=TAMANO_BLOQUE):
+    """Genera los tokens (tipo, valor, línea, columna) uno a uno.
+
+    La fuente puede ser un string o un archivo abierto en modo texto; el archivo se
+    lee en bloques de tamano_bloque caracteres, así que la memoria depende del
+    tamaño del bloque y del token más largo, no del tamaño del archivo. Los tokens
+    que cruzan el borde de un bloque (comentarios, strings, identificadores) se
+    reconocen completos porque se vuelve a intentar con el bloque siguiente.
+    """
+    return _escanear(fuente, motor, tamano_bloque, False)
+
+def _escanear(fuente, motor, tamano_bloque, con_offsets, posicion=0, linea=1, inicio_linea=0):
+    """Generador base de iter_tokens; con con_offsets agrega el inicio y fin absolutos.
+
+    Con una fuente string se puede empezar en cualquier posición que sea un límite
+    entre tokens, indicando la línea y el offset donde empieza esa línea.
+    """
+    coincidir = _funcion_coincidencia(motor)
+
+    if isinstance(fuente, str):
+        bloques = iter(())
+        buffer = fuente
+        fin_fuente = True
+    else:
+        bloques = iter(lambda: fuente.read(tamano_bloque), "")
+        buffer = ""
+        fin_fuente = False
+
+    base = 0  # Offset absoluto del inicio del buffer
+    position = posicion
+    line = linea  # Línea actual, empieza en 1
+    # inicio_linea: offset absoluto donde empieza la línea actual
+
+    while True:
+        if position >= len(buffer):
+            if fin_fuente:
+                return
+            base += position
+            buffer, position, fin_fuente = _leer_bloque(bloques, buffer, position)
+            base -= position
+            continue
+
+        token_type, match = coincidir(buffer, position)
 
         if not match:
             # Carácter inválido encontrado
-            invalid_char = code[position]
+            invalid_char = buffer[position]
+            column = base + position - inicio_linea + 1
             raise SyntaxError(
                 f"Invalid character '{invalid_char}' at line {line}, column {column}. "
                 f"Expected a valid Java token."
             )
-        
-    print(tokens)
-    return tokens
 
+        # Sin el resto de la fuente no se puede saber si el token está completo.
+        # Se lee al menos tanto texto como el que ya tiene el token pendiente: así el
+        # buffer se duplica en cada reintento y un token que cruza muchos bloques
+        # (un comentario sin cerrar) se vuelve a reconocer O(log n) veces, no una por bloque
+        if not fin_fuente and _requiere_mas_texto(buffer, position, token_type, match):
+            base += position
+            buffer, position, fin_fuente = _leer_bloque(bloques, buffer, position, len(buffer) - position)
+            base -= position
+            continue
+
+        value = match.group()
+
+        if token_type == "Identificador":
+            token_type = PALABRAS_CLAVE.get(value, token_type)
+
+        if token_type not in TIPOS_IGNORADOS:  # Ignorar espacios, saltos y comentarios
+            column = base + position - inicio_linea + 1
+            if con_offsets:
+                yield (token_type, value, line, column, base + position, base + match.end())
+            else:
+                yield (token_type, value, line, column)
+
+        # Actualizar la posición y, si el token tiene saltos, la línea actual
+        newlines = value.count("\n")
+        if newlines > 0:
+            line += newlines
+            inicio_linea = base + position + value.rindex("\n") + 1
+        position = match.end()
+
+def _leer_bloque(bloques, buffer, position, minimo=0):
+    """Descarta lo ya consumido del buffer y le agrega bloques de la fuente.
+
+    Agrega al menos un bloque y sigue leyendo hasta sumar minimo caracteres o
+    llegar al final de la fuente. Se conserva el carácter anterior a la posición
+    porque los patrones con \\b lo miran para decidir si hay un límite de palabra.
+    """
+    inicio = max(position - 1, 0)
+    nuevos = []
+    leidos = 0
+    while True:
+        bloque = next(bloques, "")
+        if not bloque:
+            return buffer[inicio:] + "".join(nuevos), position - inicio, True
+        nuevos.append(bloque)
+        leidos += len(bloque)
+        if leidos >= minimo:
+            return buffer[inicio:] + "".join(nuevos), position - inicio, False
+
+def _requiere_mas_texto(buffer, position, token_type, match):
+    """Indica si la coincidencia podría cambiar al leer más texto de la fuente.
+
+    Un comentario o string sin cerrar en el buffer es un token ERROR que llega hasta
+    el final del buffer, así que también cae dentro del margen y se reintenta.
+    """
+    return match.end() + MARGEN_ANTICIPACION > len(buffer)
+
+def _funcion_coincidencia(motor):
+    """Retorna una función (código, posición) -> (tipo, match) para el motor pedido."""
+    if motor == "maestro":
+        return _coincidir_maestro
+    if motor == "secuencial":
+        return _coincidir_secuencial
+    raise ValueError(f"Motor léxico desconocido '{motor}'. Opciones: {', '.join(MOTORES)}")
+
+def _coincidir_maestro(code, position):
+    """Reconoce el token con un solo intento de MASTER_REGEX."""
+    match = MASTER_REGEX.match(code, position)
+    if match:
+        return TIPOS_POR_GRUPO[match.lastgroup], match
+    return None, None
+
+def _coincidir_secuencial(code, position):
+    """Motor original: prueba cada patrón de TOKEN_REGEX en orden."""
+    for token_type, regex in TOKEN_REGEX:
+        match = regex.match(code, position)
+        if match:
+            return token_type, match
+    return None, None
+
+
+# ---------------------------------------------------------------------------
+# Re-análisis incremental
+# ---------------------------------------------------------------------------
+
+def relexer_incremental(tokens, offset, eliminados, insertado, motor=MOTOR_POR_DEFECTO):
+    """Aplica una edición al código de un TokenBuffer y retorna el TokenBuffer nuevo.
+
+    La edición reemplaza eliminados caracteres desde offset por el texto insertado.
+    Solo se vuelve a analizar desde el último punto seguro antes de la edición hasta
+    que un token nuevo empieza donde empezaba un token viejo después de la edición;
+    desde ahí el resto de los tokens viejos se reutiliza desplazado.
+    """
+    anterior = tokens.codigo
+    codigo = anterior[:offset] + insertado + anterior[offset + eliminados:]
+    delta = len(insertado) - eliminados
+    fin_edicion = offset + eliminados
+
+    # Tokens viejos que se conservan sin cambios y posición desde donde se reanaliza
+    conservados = _tokens_conservados(tokens, offset)
+    reinicio = tokens.fines[conservados - 1] if conservados else 0
+    linea, _ = tokens.indice.posicion(reinicio)
+    inicio_linea = tokens.indice.inicios[linea - 1]
+
+    nuevo = TokenBuffer(codigo)
+    nuevo.tipos = tokens.tipos[:conservados]
+    nuevo.inicios = tokens.inicios[:conservados]
+    nuevo.fines = tokens.fines[:conservados]
+
+    viejos_inicios = tokens.inicios
+    reutilizar_desde = len(tokens)
+    for token_type, _, _, _, inicio, fin in _escanear(codigo, motor, TAMANO_BLOQUE, True, reinicio, linea, inicio_linea):
+        inicio_viejo = inicio - delta
+        # Estrictamente después de la edición: \b también mira el carácter anterior
+        if inicio_viejo > fin_edicion:
+            j = bisect_left(viejos_inicios, inicio_viejo)
+            if j < len(viejos_inicios) and viejos_inicios[j] == inicio_viejo:
+                # Mismo texto desde aquí hasta el final: los tokens viejos siguen valiendo
+                reutilizar_desde = j
+                break
+        nuevo.agregar(TIPO_POR_NOMBRE[token_type], inicio, fin)
+
+    if reutilizar_desde < len(tokens):
+        nuevo.tipos.extend(tokens.tipos[reutilizar_desde:])
+        nuevo.inicios.extend(array("I", [x + delta for x in tokens.inicios[reutilizar_desde:]]))
+        nuevo.fines.extend(array("I", [x + delta for x in tokens.fines[reutilizar_desde:]]))
+    return nuevo
+
+def _tokens_conservados(tokens, offset):
+    """Cantidad de tokens iniciales que la edición en offset no puede modificar.
+
+    Un token se conserva si termina al menos MARGEN_ANTICIPACION caracteres antes
+    de la edición, porque su coincidencia no miró más allá. Los comentarios y
+    strings sin cerrar, que miran hasta el final del código, son tokens ERROR que
+    llegan hasta el final, así que nunca quedan antes de la edición.
+    """
+    return bisect_right(tokens.fines, offset - MARGEN_ANTICIPACION)
+
+def calcular_edicion(anterior, nuevo):
+    """Retorna (offset, eliminados, insertado) que transforma anterior en nuevo."""
+    limite = min(len(anterior), len(nuevo))
+
+    # Prefijo común más largo (búsqueda binaria comparando rebanadas)
+    bajo, alto = 0, limite
+    while bajo < alto:
+        medio = (bajo + alto + 1) // 2
+        if anterior[:medio] == nuevo[:medio]:
+            bajo = medio
+        else:
+            alto = medio - 1
+    prefijo = bajo
+
+    # Sufijo común más largo que no se superponga con el prefijo
+    bajo, alto = 0, limite - prefijo
+    while bajo < alto:
+        medio = (bajo + alto + 1) // 2
+        if anterior[len(anterior) - medio:] == nuevo[len(nuevo) - medio:]:
+            bajo = medio
+        else:
+            alto = medio - 1
+    sufijo = bajo
 
+    return prefijo, len(anterior) - prefijo - sufijo, nuevo[prefijo:len(nuevo) - sufijo]
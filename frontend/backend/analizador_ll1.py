@@ -0,0 +1,202 @@
+from collections import deque
+
+from .analizador_lexico import NOMBRES_TIPO
+from .analizador_sintactico import Parser
+from .cursor_tokens import FIN
+from .generador_tablas import BASE_EXTERNO, BASE_LEXEMA, BASE_NO_TERMINAL, TAMANO_FILA, cargar_tablas, nombre_terminal
+from .nodos_ast import (
+    NodoBloque, NodoBreak, NodoCase, NodoClase, NodoDeclaracion, NodoDefault, NodoDoWhile, NodoFor,
+    NodoFuncion, NodoIf, NodoPrint, NodoSwitch, NodoTryCatch, NodoWhile,
+)
+
+# Marca en la pila de símbolos: terminó la producción de la última entrada de marcas
+REDUCIR = -1
+
+# Método del parser que analiza cada símbolo externo de la gramática
+EXTERNOS = {
+    "expresion": "parse_expresion",
+    "expresion_sentencia": "parse_expresion",
+}
+
+
+# Acciones de la gramática: reciben la lista de valores de los símbolos de la
+# producción (el texto de los terminales, el valor de los no terminales) y
+# retornan el valor del no terminal. Arman los mismos nodos que Parser.
+
+def _lista(valores):
+    # Las listas se arman desde el final: el resto ya está completo cuando se agrega el elemento
+    elemento, resto = valores
+    if elemento is not None:
+        resto.appendleft(elemento)
+    return resto
+
+
+def _con_modificadores(valores):
+    modificadores, nodo = valores
+    if not isinstance(nodo, (NodoDeclaracion, NodoFuncion, NodoClase)):
+        return nodo  # Como en Parser, las demás sentencias ignoran los modificadores
+    modificadores = list(modificadores)
+    if isinstance(nodo, NodoFuncion):
+        if "abstract" in modificadores and "final" in modificadores:
+            raise SyntaxError("Error: Un método no puede ser 'abstract' y 'final' al mismo tiempo.")
+        if "abstract" in modificadores and "static" in modificadores:
+            raise SyntaxError("Error: Un método no puede ser 'abstract' y 'static' al mismo tiempo.")
+    nodo.modificadores = modificadores
+    return nodo
+
+
+def _declaracion(valores):
+    tipo_dato, identificador, inicializacion = valores
+    if isinstance(inicializacion, list):
+        return NodoDeclaracion([], tipo_dato, identificador, valor_inicial=inicializacion[1])  # ['=', valor]
+    return NodoDeclaracion([], tipo_dato, identificador, delimitador=inicializacion)
+
+
+def _switch(valores):
+    casos = [caso for caso in valores[5] if isinstance(caso, NodoCase)]
+    defaults = [caso for caso in valores[5] if isinstance(caso, NodoDefault)]
+    # Como en Parser, el último default es el que queda y va después de los case
+    return NodoSwitch(valores[2], casos, defaults[-1] if defaults else None)
+
+
+ACCIONES = {
+    "nada": lambda valores: None,
+    "primero": lambda valores: valores[0],
+    "segundo": lambda valores: valores[1],
+    "vacia": lambda valores: deque(),
+    "lista": _lista,
+    "lista_de_uno": lambda valores: deque(valores),
+    "con_modificadores": _con_modificadores,
+    "asignacion_inicial": lambda valores: [valores[0], valores[1]],
+    "parametro": lambda valores: (valores[0], valores[1]),
+    "Bloque": lambda valores: NodoBloque(list(valores[0])),
+    "Declaracion": _declaracion,
+    "If": lambda valores: NodoIf(valores[2], valores[5], valores[7]),
+    "While": lambda valores: NodoWhile(valores[2], valores[5]),
+    "DoWhile": lambda valores: NodoDoWhile(valores[2], valores[6]),
+    "For": lambda valores: NodoFor(valores[2], valores[3], valores[5], valores[8]),
+    "Funcion": lambda valores: NodoFuncion([], valores[0], valores[1], list(valores[3]), valores[6]),
+    "Clase": lambda valores: NodoClase([], valores[1], list(valores[3])),
+    "TryCatch": lambda valores: NodoTryCatch(valores[2], valores[6], valores[7], valores[10]),
+    "Switch": _switch,
+    "Case": lambda valores: NodoCase(valores[1], valores[3]),
+    "Default": lambda valores: NodoDefault(valores[2]),
+    "Break": lambda valores: NodoBreak(),
+    "Print": lambda valores: NodoPrint(valores[0], list(valores[2])),
+}
+
+
+class TablasLL1:
+    """Las tablas de generador_tablas preparadas para ParserLL1.
+
+    Cada fila de la tabla es una lista indexada por código de terminal (-1 donde
+    no hay producción), así elegir la producción es una sola indexación. Los
+    símbolos de cada producción se guardan invertidos, en el orden en que se apilan.
+    """
+
+    __slots__ = ("inicio", "filas", "esperados", "simbolos", "acciones", "con_posicion", "externos")
+
+    def __init__(self, tablas):
+        faltantes = {accion for _, _, accion in tablas["producciones"]} - ACCIONES.keys()
+        faltantes |= set(tablas["externos"]) - EXTERNOS.keys()
+        if faltantes:
+            raise ValueError(f"La gramática usa acciones o externos sin definir: {', '.join(sorted(faltantes))}")
+
+        self.inicio = tablas["inicio"]
+        self.filas = []
+        self.esperados = []
+        for entradas in tablas["tabla"]:
+            fila = [-1] * TAMANO_FILA
+            for terminal, produccion in entradas:
+                fila[terminal] = produccion
+            self.filas.append(fila)
+            self.esperados.append(", ".join(nombre_terminal(terminal) for terminal, _ in entradas))
+
+        con_posicion = set(tablas["posicion"])
+        self.simbolos = [tuple(reversed(simbolos)) for _, simbolos, _ in tablas["producciones"]]
+        self.acciones = [ACCIONES[accion] for _, _, accion in tablas["producciones"]]
+        self.con_posicion = [no_terminal in con_posicion for no_terminal, _, _ in tablas["producciones"]]
+        self.externos = [EXTERNOS[nombre] for nombre in tablas["externos"]]
+
+
+_tablas = None
+
+
+def tablas_ll1():
+    """Tablas de gramatica.txt, cargadas (o regeneradas) una sola vez por proceso."""
+    global _tablas
+    if _tablas is None:
+        _tablas = TablasLL1(cargar_tablas())
+    return _tablas
+
+
+class ParserLL1(Parser):
+    """Parser predictivo dirigido por la tabla LL(1) generada desde gramatica.txt.
+
+    Produce los mismos nodos que Parser. Cada no terminal elige su producción
+    indexando la fila de la tabla con el lexema del token actual y, si ese lexema
+    no tiene entrada, con su tipo. Las expresiones las sigue analizando
+    Parser.parse_expresion (son los símbolos externos de la gramática). La pila
+    de símbolos es explícita, así que el anidamiento no usa la pila de Python.
+    """
+
+    def __init__(self, tokens, tablas=None):
+        super().__init__(tokens)
+        self.tablas = tablas or tablas_ll1()
+
+    def _programa(self):
+        tablas = self.tablas
+        cursor = self.cursor
+        tipos = cursor.tipos
+        lexemas = cursor.lexemas
+        filas = tablas.filas
+        externos = [getattr(self, metodo) for metodo in tablas.externos]
+
+        pila = [FIN, tablas.inicio]
+        valores = []
+        marcas = []  # (producción, inicio de sus valores, índice de su primer token)
+        while pila:
+            simbolo = pila.pop()
+
+            if simbolo >= BASE_EXTERNO:
+                valores.append(externos[simbolo - BASE_EXTERNO]())
+
+            elif simbolo >= BASE_NO_TERMINAL:
+                indice = cursor.indice
+                fila = filas[simbolo - BASE_NO_TERMINAL]
+                produccion = fila[BASE_LEXEMA + lexemas[indice]]
+                if produccion < 0:
+                    produccion = fila[tipos[indice]]
+                    if produccion < 0:
+                        raise SyntaxError(self._inesperado(tablas.esperados[simbolo - BASE_NO_TERMINAL]))
+                marcas.append((produccion, len(valores), indice))
+                pila.append(REDUCIR)
+                pila.extend(tablas.simbolos[produccion])
+
+            elif simbolo == REDUCIR:
+                produccion, base, inicio = marcas.pop()
+                valor = tablas.acciones[produccion](valores[base:])
+                del valores[base:]
+                if valor is not None and tablas.con_posicion[produccion]:
+                    valor.posicion = cursor.posicion(inicio)
+                valores.append(valor)
+
+            else:
+                indice = cursor.indice
+                if simbolo >= BASE_LEXEMA:
+                    coincide = lexemas[indice] == simbolo - BASE_LEXEMA
+                else:
+                    coincide = tipos[indice] == simbolo
+                if not coincide:
+                    raise SyntaxError(self._inesperado(nombre_terminal(simbolo)))
+                if simbolo != FIN:
+                    valores.append(cursor.advance())
+
+        return valores[0]
+
+    def _inesperado(self, esperados):
+        """Mensaje de error para el token actual cuando se esperaba alguno de los terminales indicados."""
+        cursor = self.cursor
+        if cursor.fin():
+            return f"Se esperaba {esperados} pero no hay más tokens."
+        return f"Token inesperado '{NOMBRES_TIPO[cursor.peek()]}: {cursor.valor()}'{cursor.ubicacion()}. Se esperaba {esperados}."
@@ -1,3 +1,9 @@
+from .nodos_ast import (
+    ASTNode, NodoAsignacion, NodoBinaria, NodoBloque, NodoClase, NodoDeclaracion, NodoDoWhile, NodoFor,
+    NodoFuncion, NodoIdentificador, NodoIf, NodoSwitch, NodoTryCatch, NodoValor, NodoWhile,
+)
+
+
 class SymbolTable:
     def __init__(self):
         self.scopes = [{}]  # Stack of scopes, starting with global scope
@@ -77,67 +83,29 @@ class SemanticAnalyzer:
         if node is None:
             return
         
-        # Process node based on its type
-        if node.tipo == "Bloque":
-            self._analyze_block(node)
-        elif node.tipo == "Declaracion":
-            self._analyze_declaration(node)
-        elif node.tipo == "Asignacion":
-            self._analyze_assignment(node)
-        elif node.tipo == "Expresion":
-            self._analyze_expression(node)
-        elif node.tipo == "If" or node.tipo == "IfElse":
-            self._analyze_if_statement(node)
-        elif node.tipo == "While":
-            self._analyze_while_statement(node)
-        elif node.tipo == "DoWhile":
-            self._analyze_do_while_statement(node)
-        elif node.tipo == "For":
-            self._analyze_for_statement(node)
-        elif node.tipo == "Funcion":
-            self._analyze_function(node)
-        elif node.tipo == "Clase":
-            self._analyze_class(node)
-        elif node.tipo == "TryCatch":
-            self._analyze_try_catch(node)
-        elif node.tipo == "Switch":
-            self._analyze_switch(node)
+        # Process node based on its class
+        handler = self._handlers.get(type(node))
+        if handler is not None:
+            handler(self, node)
         else:
             # Process children for other node types
-            if isinstance(node.hijos, list):
-                for hijo in node.hijos:
-                    if hijo is not None:
-                        self._analyze_node(hijo)
+            for hijo in node.hijos:
+                if isinstance(hijo, ASTNode):
+                    self._analyze_node(hijo)
 
     def _analyze_block(self, node):
         """Analyze a block of code."""
         self.symbol_table.enter_scope()
         
-        for hijo in node.hijos:
-            self._analyze_node(hijo)
+        for instruccion in node.instrucciones:
+            self._analyze_node(instruccion)
         
         self.symbol_table.exit_scope()
 
     def _analyze_declaration(self, node):
         """Analyze a variable declaration."""
-        tipo_dato = node.valor  # Type of the variable
-        
-        # Extract information from the declaration
-        modificadores = []
-        identificador = None
-        valor_inicial = None
-        
-        for hijo in node.hijos:
-            if isinstance(hijo, list) and all(isinstance(item, str) for item in hijo):
-                modificadores = hijo
-            elif hijo is not None and hasattr(hijo, 'tipo') and hijo.tipo == "Identificador":
-                identificador = hijo.valor
-            elif hijo is not None and hasattr(hijo, 'tipo') and hijo.tipo in ["Expresion", "Asignacion"]:
-                valor_inicial = hijo
-        
-        if identificador is None:
-            self.errors.append(f"Error semántico: Declaración sin identificador")
-            return
+        tipo_dato = node.tipo_dato  # Type of the variable
+        valor_inicial = node.valor_inicial
         
         # Check if the type is valid
         if tipo_dato not in self.java_to_python_types and tipo_dato != "void":
@@ -145,14 +113,14 @@ class SemanticAnalyzer:
             return
         
         # Check if it's a constant
-        is_constant = "final" in modificadores
+        is_constant = "final" in node.modificadores
         
         # Declare the variable in the symbol table
-        line = column = None  # In a real implementation, you'd get these from the token
+        line, column = node.posicion or (None, None)
         is_initialized = valor_inicial is not None
         
         self.symbol_table.declare(
-            identificador, 
+            node.nombre, 
             tipo_dato, 
             line, 
             column, 
@@ -165,7 +133,7 @@ class SemanticAnalyzer:
             self._analyze_node(valor_inicial)
             
             # Check type compatibility for initialization
-            if hasattr(valor_inicial, 'tipo') and valor_inicial.tipo == "Expresion":
+            if isinstance(valor_inicial, (NodoBinaria, NodoValor)):
                 valor_tipo = self._get_expression_type(valor_inicial)
                 if not self._are_types_compatible(tipo_dato, valor_tipo):
                     self.errors.append(
@@ -174,157 +142,92 @@ class SemanticAnalyzer:
 
     def _analyze_assignment(self, node):
         """Analyze an assignment statement."""
-        # The left side should be an identifier
-        left_node = None
-        right_node = None
-        
-        if len(node.hijos) >= 2:
-            left_node = node.hijos[0]
-            right_node = node.hijos[1]
-        
-        if left_node is None or not hasattr(left_node, 'tipo') or left_node.tipo != "Identificador":
-            self.errors.append(f"Error semántico: El lado izquierdo de la asignación debe ser un identificador")
-            return
-        
-        # Check if the variable exists
-        var_name = left_node.valor
+        # Check if the variable exists (the parser only accepts an identifier on the left side)
+        var_name = node.nombre
         var_info = self.symbol_table.lookup(var_name)
         
         if var_info is None:
-            self.errors.append(f"Error semántico: Variable '{var_name}' no declarada")
+            self.errors.append(f"Error semántico: Variable '{var_name}' no declarada{self._location(node)}")
             return
         
         # Check if it's a constant that's already initialized
         if var_info['constant'] and var_info['initialized']:
-            self.errors.append(f"Error semántico: No se puede modificar la constante '{var_name}'")
+            self.errors.append(f"Error semántico: No se puede modificar la constante '{var_name}'{self._location(node)}")
             return
         
         # Analyze the right side
-        if right_node is not None:
-            self._analyze_node(right_node)
-            
-            # Check type compatibility
-            right_type = self._get_expression_type(right_node)
-            if not self._are_types_compatible(var_info['type'], right_type):
-                self.errors.append(
-                    f"Error semántico: No se puede asignar valor de tipo '{right_type}' a variable de tipo '{var_info['type']}'"
-                )
+        self._analyze_node(node.expresion)
+        
+        # Check type compatibility
+        right_type = self._get_expression_type(node.expresion)
+        if not self._are_types_compatible(var_info['type'], right_type):
+            self.errors.append(
+                f"Error semántico: No se puede asignar valor de tipo '{right_type}' a variable de tipo '{var_info['type']}'"
+            )
         
         # Mark the variable as initialized
         self.symbol_table.update(var_name)
 
     def _analyze_expression(self, node):
-        """Analyze an expression."""
-        # Process all operands in the expression
-        if isinstance(node.hijos, list):
-            for hijo in node.hijos:
-                self._analyze_node(hijo)
+        """Analyze a binary expression."""
+        # Process both operands in the expression
+        self._analyze_node(node.izquierda)
+        self._analyze_node(node.derecha)
+
+    def _check_condition(self, condition, statement):
+        """Analyze a condition and check that it is a boolean expression."""
+        self._analyze_node(condition)
         
-        # If it's a variable reference, check if it's declared and initialized
-        if node.tipo == "Identificador":
-            var_name = node.valor
-            var_info = self.symbol_table.lookup(var_name)
-            
-            if var_info is None:
-                self.errors.append(f"Error semántico: Variable '{var_name}' no declarada")
-            elif not var_info['initialized']:
-                self.errors.append(f"Error semántico: Variable '{var_name}' usada antes de ser inicializada")
+        condition_type = self._get_expression_type(condition)
+        if condition_type != "boolean" and condition_type is not None:
+            self.errors.append(f"Error semántico: La condición del {statement} debe ser de tipo boolean, no '{condition_type}'")
 
     def _analyze_if_statement(self, node):
         """Analyze an if statement."""
-        # Analyze the condition
-        if len(node.hijos) >= 1:
-            condition = node.hijos[0]
-            self._analyze_node(condition)
-            
-            # Check if the condition is a boolean expression
-            condition_type = self._get_expression_type(condition)
-            if condition_type != "boolean" and condition_type is not None:
-                self.errors.append(f"Error semántico: La condición del if debe ser de tipo boolean, no '{condition_type}'")
+        self._check_condition(node.condicion, "if")
         
         # Analyze the if block
-        if len(node.hijos) >= 2:
-            self._analyze_node(node.hijos[1])
+        self._analyze_node(node.cuerpo)
         
-        # Analyze the else block if present
-        if len(node.hijos) >= 3 and node.tipo == "IfElse":
-            self._analyze_node(node.hijos[2])
+        # Analyze the else block (or the else-if statement) if present
+        if node.sino is not None:
+            self._analyze_node(node.sino)
 
     def _analyze_while_statement(self, node):
         """Analyze a while statement."""
-        # Analyze the condition
-        if len(node.hijos) >= 1:
-            condition = node.hijos[0]
-            self._analyze_node(condition)
-            
-            # Check if the condition is a boolean expression
-            condition_type = self._get_expression_type(condition)
-            if condition_type != "boolean" and condition_type is not None:
-                self.errors.append(f"Error semántico: La condición del while debe ser de tipo boolean, no '{condition_type}'")
+        self._check_condition(node.condicion, "while")
         
         # Analyze the loop body
-        if len(node.hijos) >= 2:
-            self._analyze_node(node.hijos[1])
+        self._analyze_node(node.cuerpo)
 
     def _analyze_do_while_statement(self, node):
         """Analyze a do-while statement."""
         # Analyze the loop body
-        if len(node.hijos) >= 1:
-            self._analyze_node(node.hijos[0])
+        self._analyze_node(node.cuerpo)
         
-        # Analyze the condition
-        if len(node.hijos) >= 2:
-            condition = node.hijos[1]
-            self._analyze_node(condition)
-            
-            # Check if the condition is a boolean expression
-            condition_type = self._get_expression_type(condition)
-            if condition_type != "boolean" and condition_type is not None:
-                self.errors.append(f"Error semántico: La condición del do-while debe ser de tipo boolean, no '{condition_type}'")
+        self._check_condition(node.condicion, "do-while")
 
     def _analyze_for_statement(self, node):
         """Analyze a for statement."""
         self.symbol_table.enter_scope()
         
         # Analyze initialization
-        if len(node.hijos) >= 1:
-            self._analyze_node(node.hijos[0])
+        self._analyze_node(node.inicializacion)
         
-        # Analyze condition
-        if len(node.hijos) >= 2:
-            condition = node.hijos[1]
-            self._analyze_node(condition)
-            
-            # Check if the condition is a boolean expression
-            condition_type = self._get_expression_type(condition)
-            if condition_type != "boolean" and condition_type is not None:
-                self.errors.append(f"Error semántico: La condición del for debe ser de tipo boolean, no '{condition_type}'")
+        self._check_condition(node.condicion, "for")
         
         # Analyze update
-        if len(node.hijos) >= 3:
-            self._analyze_node(node.hijos[2])
+        self._analyze_node(node.actualizacion)
         
         # Analyze loop body
-        if len(node.hijos) >= 4:
-            self._analyze_node(node.hijos[3])
+        self._analyze_node(node.cuerpo)
         
         self.symbol_table.exit_scope()
 
     def _analyze_function(self, node):
         """Analyze a function declaration."""
-        tipo_retorno = node.valor
-        
-        # Extract information from the function declaration
-        modificadores = []
-        nombre_funcion = None
-        parametros = []
-        cuerpo = None
-        
-        if len(node.hijos) >= 4:
-            modificadores = node.hijos[0]
-            nombre_funcion = node.hijos[1]
-            parametros = node.hijos[2]
-            cuerpo = node.hijos[3]
+        tipo_retorno = node.tipo_retorno
+        nombre_funcion = node.nombre
         
         # Save current function for return type checking
         prev_function = self.current_function
@@ -338,12 +241,11 @@ class SemanticAnalyzer:
         self.symbol_table.enter_scope()
         
         # Declare parameters in the function scope
-        for param_type, param_name in parametros:
+        for param_type, param_name in node.parametros:
             self.symbol_table.declare(param_name, param_type, None, None, True, False)
         
         # Analyze the function body
-        if cuerpo is not None:
-            self._analyze_node(cuerpo)
+        self._analyze_node(node.cuerpo)
         
         # Check if the function has a return statement if needed
         if tipo_retorno != "void" and not self.current_function['has_return']:
@@ -357,27 +259,16 @@ class SemanticAnalyzer:
 
     def _analyze_class(self, node):
         """Analyze a class declaration."""
-        # Extract information from the class declaration
-        modificadores = []
-        nombre_clase = None
-        miembros = []
-        
-        if len(node.hijos) >= 3:
-            modificadores = node.hijos[0]
-            nombre_clase = node.hijos[1]
-            miembros = node.hijos[2]
-        
         # Save current class for context
         prev_class = self.current_class
-        self.current_class = nombre_clase
+        self.current_class = node.nombre
         
         # Enter a new scope for the class
         self.symbol_table.enter_scope()
         
         # Analyze class members
-        if isinstance(miembros, list):
-            for miembro in miembros:
-                self._analyze_node(miembro)
+        for miembro in node.miembros:
+            self._analyze_node(miembro)
         
         # Exit the class scope
         self.symbol_table.exit_scope()
@@ -388,90 +279,75 @@ class SemanticAnalyzer:
     def _analyze_try_catch(self, node):
         """Analyze a try-catch statement."""
         # Analyze the try block
-        if len(node.hijos) >= 1:
-            self._analyze_node(node.hijos[0])
-        
-        # Extract exception information
-        if len(node.hijos) >= 2:
-            exception_info = node.hijos[1]
-            if isinstance(exception_info, tuple) and len(exception_info) == 2:
-                exception_type, exception_name = exception_info
-                
-                # Enter a new scope for the catch block
-                self.symbol_table.enter_scope()
-                
-                # Declare the exception variable
-                self.symbol_table.declare(exception_name, exception_type, None, None, True, False)
-                
-                # Analyze the catch block
-                if len(node.hijos) >= 3:
-                    self._analyze_node(node.hijos[2])
-                
-                # Exit the catch scope
-                self.symbol_table.exit_scope()
+        self._analyze_node(node.cuerpo_try)
+        
+        # Enter a new scope for the catch block
+        self.symbol_table.enter_scope()
+        
+        # Declare the exception variable
+        self.symbol_table.declare(node.nombre_excepcion, node.tipo_excepcion, None, None, True, False)
+        
+        # Analyze the catch block
+        self._analyze_node(node.cuerpo_catch)
+        
+        # Exit the catch scope
+        self.symbol_table.exit_scope()
 
     def _analyze_switch(self, node):
         """Analyze a switch statement."""
         # Analyze the switch expression
-        if len(node.hijos) >= 1:
-            self._analyze_node(node.hijos[0])
+        self._analyze_node(node.expresion)
         
         # Analyze case blocks
-        if len(node.hijos) >= 2:
-            casos = node.hijos[1]
-            if isinstance(casos, list):
-                for caso in casos:
-                    if isinstance(caso, tuple) and len(caso) == 2:
-                        valor, instrucciones = caso
-                        self._analyze_node(valor)
-                        self._analyze_node(instrucciones)
+        for caso in node.casos:
+            self._analyze_node(caso.expresion)
+            self._analyze_node(caso.cuerpo)
         
         # Analyze default block
-        if len(node.hijos) >= 3 and node.hijos[2] is not None:
-            self._analyze_node(node.hijos[2])
+        if node.por_defecto is not None:
+            self._analyze_node(node.por_defecto.cuerpo)
+
+    # Handler for each node class; the rest only have their children analyzed
+    _handlers = {
+        NodoBloque: _analyze_block,
+        NodoDeclaracion: _analyze_declaration,
+        NodoAsignacion: _analyze_assignment,
+        NodoBinaria: _analyze_expression,
+        NodoIf: _analyze_if_statement,
+        NodoWhile: _analyze_while_statement,
+        NodoDoWhile: _analyze_do_while_statement,
+        NodoFor: _analyze_for_statement,
+        NodoFuncion: _analyze_function,
+        NodoClase: _analyze_class,
+        NodoTryCatch: _analyze_try_catch,
+        NodoSwitch: _analyze_switch,
+    }
 
     def _get_expression_type(self, node):
         """Determine the type of an expression."""
-        if node is None:
-            return None
-        
-        if node.tipo == "Identificador":
-            var_info = self.symbol_table.lookup(node.valor)
+        if isinstance(node, NodoIdentificador):
+            var_info = self.symbol_table.lookup(node.nombre)
             return var_info['type'] if var_info else None
         
-        elif node.tipo == "Número":
-            # Determine if it's an integer or float
-            if '.' in node.valor:
-                return "float"
-            else:
-                return "int"
-        
-        elif node.tipo == "String Literal":
-            return "String"
-        
-        elif node.tipo == "Literal Booleano":
-            return "boolean"
-        
-        elif node.tipo == "Expresion":
+        if isinstance(node, NodoBinaria):
             # For binary operations, determine the result type
-            if len(node.hijos) >= 2:
-                left_type = self._get_expression_type(node.hijos[0])
-                right_type = self._get_expression_type(node.hijos[1])
-                
-                # Handle arithmetic operations
-                if node.valor in ['+', '-', '*', '/', '%']:
-                    if left_type in ["float", "double"] or right_type in ["float", "double"]:
-                        return "float"
-                    else:
-                        return "int"
-                
-                # Handle relational operations
-                elif node.valor in ['==', '!=', '<', '>', '<=', '>=']:
-                    return "boolean"
-                
-                # Handle logical operations
-                elif node.valor in ['&&', '||', '!']:
-                    return "boolean"
+            left_type = self._get_expression_type(node.izquierda)
+            right_type = self._get_expression_type(node.derecha)
+            
+            # Handle arithmetic operations
+            if node.operador in ['+', '-', '*', '/', '%']:
+                if left_type in ["float", "double"] or right_type in ["float", "double"]:
+                    return "float"
+                else:
+                    return "int"
+            
+            # Handle relational operations
+            elif node.operador in ['==', '!=', '<', '>', '<=', '>=']:
+                return "boolean"
+            
+            # Handle logical operations
+            elif node.operador in ['&&', '||', '!']:
+                return "boolean"
         
         return None
 
@@ -496,6 +372,13 @@ class SemanticAnalyzer:
         
         return False
 
+    def _location(self, node):
+        """Return ' (línea L, columna C)' for nodes that know their source position."""
+        posicion = getattr(node, 'posicion', None)
+        if posicion is None:
+            return ""
+        return f" (línea {posicion[0]}, columna {posicion[1]})"
+
     def get_errors(self):
         """Get all semantic errors."""
         return self.errors + self.symbol_table.errors
@@ -1,971 +1,1045 @@
-import matplotlib.pyplot as plt
-import networkx as nx
-import time
-
-class ASTNode:
-    def __init__(self, tipo, valor=None, hijos=None):
-        self.tipo = tipo
-        self.valor = valor
-        self.hijos = hijos or []
-
-    def __str__(self):
-        valor_str = str(self.valor) if self.valor is not None else "None"
-        if isinstance(self.hijos, list):
-            hijos_str = ", ".join(self._convertir_hijo_a_str(hijo) for hijo in self.hijos)
-        else:
-            hijos_str = self._convertir_hijo_a_str(self.hijos)
-        return f"{self.tipo}: {valor_str}, Hijos: [{hijos_str}]"
-
-    def _convertir_hijo_a_str(self, hijo):
-        if isinstance(hijo, ASTNode):
-            return str(hijo)
-        elif isinstance(hijo, list):
-            return ", ".join(self._convertir_hijo_a_str(item) for item in hijo)
-        else:
-            return str(hijo)
+import hashlib
+import re
+
+from .analizador_lexico import NOMBRES_TIPO, TIPO_POR_NOMBRE, TokenBuffer
+from .cursor_tokens import FIN, TEXTO_LEXEMA, CursorTokens, Lexema, Tipo
+from .nodos_ast import (
+    ASTNode, NodoAsignacion, NodoBinaria, NodoBloque, NodoBreak, NodoCase, NodoClase, NodoDeclaracion,
+    NodoDefault, NodoDoWhile, NodoError, NodoFor, NodoFuncion, NodoIdentificador, NodoIf, NodoOperando,
+    NodoPrint, NodoSwitch, NodoTryCatch, NodoUnaria, NodoValor, NodoWhile,
+)
+
+# Versión de la gramática; se incrementa al cambiar las reglas o la forma del AST
+# para invalidar los árboles guardados en cache.
+VERSION_GRAMATICA = 3
+
+# Modificadores que acepta cada regla (parse_declaracion_variable no acepta 'abstract')
+MODIFICADORES = frozenset((Lexema.PUBLIC, Lexema.PRIVATE, Lexema.PROTECTED, Lexema.STATIC, Lexema.FINAL, Lexema.ABSTRACT))
+MODIFICADORES_VARIABLE = MODIFICADORES - {Lexema.ABSTRACT}
+
+# Precedencia de los operadores binarios de Java (mayor número, más fuerte). Todos
+# asocian a la izquierda; la asignación va aparte porque asocia a la derecha.
+PRECEDENCIA_BINARIA = {
+    Lexema.O_LOGICO: 1,
+    Lexema.Y_LOGICO: 2,
+    Lexema.O_BITS: 3,
+    Lexema.XOR: 4,
+    Lexema.Y_BITS: 5,
+    Lexema.IGUAL: 6, Lexema.DISTINTO: 6,
+    Lexema.MENOR: 7, Lexema.MAYOR: 7, Lexema.MENOR_IGUAL: 7, Lexema.MAYOR_IGUAL: 7,
+    Lexema.DESPLAZAR_IZQ: 8, Lexema.DESPLAZAR_DER: 8, Lexema.DESPLAZAR_DER_SIN_SIGNO: 8,
+    Lexema.MAS: 9, Lexema.MENOS: 9,
+    Lexema.POR: 10, Lexema.DIVIDIDO: 10, Lexema.MODULO: 10,
+}
+# La misma tabla indexada por código de lexema, con 0 para lo que no es operador binario
+PRECEDENCIA_POR_LEXEMA = tuple(PRECEDENCIA_BINARIA.get(codigo, 0) for codigo in range(len(TEXTO_LEXEMA)))
+
+OPERADORES_UNARIOS = frozenset((Lexema.NO, Lexema.NO_BITS, Lexema.MENOS, Lexema.MAS))
+TIPOS_LITERAL = frozenset((Tipo.NUMERO, Tipo.STRING_LITERAL, Tipo.LITERAL_BOOLEANO, Tipo.LITERAL_NULO))
+
+# Tokens donde se retoma el análisis después de un error (además de ';' y '}'):
+# los que empiezan una instrucción
+LEXEMAS_SINCRONIZACION = MODIFICADORES | frozenset((
+    Lexema.IF, Lexema.WHILE, Lexema.DO, Lexema.FOR, Lexema.TRY, Lexema.SWITCH, Lexema.CASE,
+    Lexema.DEFAULT, Lexema.BREAK, Lexema.CLASS, Lexema.VOID,
+))
+TIPOS_SINCRONIZACION = frozenset((Tipo.TIPO_DATO, Tipo.IMPRIMIR))
+
+# Lexemas que ParserIncremental mira para ubicar las clases y funciones del nivel
+# superior; el resto de los tokens se salta sin pasar por Python
+PATRON_ESTRUCTURA = re.compile(b"[" + re.escape(bytes((
+    Lexema.LLAVE_ABRE, Lexema.LLAVE_CIERRA, Lexema.PUNTO_Y_COMA, Lexema.CLASS, Lexema.VOID,
+))) + b"]")
 
-    def graficar(self, parent_id=None, node_count=0, nodes=[], edges=[], level=0):
-        node_id = node_count
-        nodes.append((node_id, f"{self.tipo}: {str(self.valor) if self.valor is not None else 'None'}"))
+class Parser:
+    def __init__(self, tokens, recuperar=False):
+        self.tokens = tokens
+        self.cursor = CursorTokens(tokens)  # Tipos y lexemas como enteros para las comparaciones
+        self.ast = None
+        self.errores = []  # Mensajes de los errores encontrados por parse()
+        # Con recuperar=True parse() no se detiene en el primer error: registra cada uno
+        # y retorna el árbol con un nodo Error en lugar de cada instrucción inválida
+        self.recuperar = recuperar
+        self.errores_sintaxis = []  # {"mensaje", "indice", "posicion"} de cada error recuperado
+
+    @property
+    def current_token_index(self):
+        return self.cursor.indice
+
+    @current_token_index.setter
+    def current_token_index(self, indice):
+        self.cursor.indice = indice
+
+    def _posicion(self, indice=None):
+        """(línea, columna) del token indicado o del actual; None si no existe."""
+        return self.cursor.posicion(indice)
+
+    def _ubicacion(self, indice=None):
+        """Texto ' (línea L, columna C)' para los mensajes de error."""
+        return self.cursor.ubicacion(indice)
+
+    def _delimitador(self, lexema, mensaje):
+        """Consume el delimitador indicado o lanza SyntaxError con el mensaje."""
+        return self.cursor.expect(Tipo.DELIMITADOR, lexema, mensaje)
+
+    def _recuperar(self, error, inicio):
+        """Recuperación en modo pánico de la instrucción que empezó en el token inicio.
+
+        Registra el error con la posición del token donde se detectó y descarta
+        tokens hasta un punto de sincronización: consume el siguiente ';' o se
+        detiene antes de un '}' o de un token que empieza una instrucción. Un bloque
+        '{ ... }' que aparece mientras se descarta se salta completo, para que su
+        '}' no cierre el bloque de afuera. Retorna el nodo Error que reemplaza a la
+        instrucción.
+        """
+        cursor = self.cursor
+        indice = min(cursor.indice, cursor.total - 1)
+        self.errores.append(f"Error de sintaxis: {error}")
+        self.errores_sintaxis.append({"mensaje": str(error), "indice": indice, "posicion": self._posicion(indice)})
+
+        if cursor.indice == inicio and not cursor.fin() and cursor.lexema() != Lexema.LLAVE_ABRE:
+            cursor.advance()  # El error está en el primer token: sin esto no habría avance
+        profundidad = 0
+        while not cursor.fin():
+            lexema = cursor.lexema()
+            if lexema == Lexema.LLAVE_ABRE:
+                profundidad += 1
+            elif profundidad:
+                if lexema == Lexema.LLAVE_CIERRA:
+                    profundidad -= 1
+                    if not profundidad:
+                        cursor.advance()
+                        break
+            elif lexema == Lexema.PUNTO_Y_COMA:
+                cursor.advance()
+                break
+            elif lexema == Lexema.LLAVE_CIERRA or lexema in LEXEMAS_SINCRONIZACION or cursor.peek() in TIPOS_SINCRONIZACION:
+                break
+            cursor.advance()
+        return NodoError(str(error))
 
-        if parent_id is not None:
-            edges.append((parent_id, node_id))
+    def eat(self, expected_type):
+        """Verifica si el token actual es del tipo esperado (por nombre) y avanza al siguiente"""
+        return self.cursor.expect(TIPO_POR_NOMBRE[expected_type])
+
+    def _ejecutar(self, regla):
+        """Ejecuta una regla generadora (_regla_*) sobre una pila explícita de reglas.
+
+        Las reglas con bloques no se llaman entre sí: hacen 'yield' de la subregla
+        (por ejemplo self._regla_instrucciones()) y reciben su nodo como valor del
+        yield. Esta función apila la subregla, la avanza hasta que termina y le
+        entrega el resultado a la regla de abajo. Así el anidamiento de bloques y las
+        cadenas de else-if solo hacen crecer la lista pila, no la pila de Python.
+
+        Un SyntaxError de una subregla se lanza dentro de la regla de abajo, en su
+        yield, como si la hubiera llamado directamente.
+        """
+        pila = [regla]
+        resultado = None
+        error = None
+        while True:
+            try:
+                if error is None:
+                    subregla = pila[-1].send(resultado)
+                else:
+                    subregla = pila[-1].throw(error)
+                    error = None
+            except StopIteration as fin:
+                pila.pop()
+                if not pila:
+                    return fin.value
+                resultado = fin.value
+                error = None
+            except SyntaxError as e:
+                pila.pop()
+                if not pila:
+                    raise
+                error = e
+            else:
+                pila.append(subregla)
+                resultado = None
 
-        node_count += 1
+    def parse_expresion(self):
+        """Regla: expresión de Java (asignación, operadores binarios y unarios, paréntesis).
+
+        No consume el delimitador que termina la expresión. Un valor solo se retorna
+        como Expresion sin hijos; dentro de una operación los valores son nodos Operando.
+        """
+        expresion = self._parse_asignacion()
+        if type(expresion) is NodoOperando:
+            return NodoValor(expresion.texto)
+        return expresion
+
+    def _parse_asignacion(self):
+        """asignacion := binaria [('=' | operador compuesto) asignacion], asociativa a la derecha."""
+        cursor = self.cursor
+        inicio = cursor.indice
+        izquierda = self._parse_binaria(1)
+
+        if cursor.peek() not in (Tipo.OPERADOR_ASIGNACION, Tipo.OPERADOR_COMPUESTO):
+            return izquierda
+        if cursor.indice - inicio != 1 or cursor.tipos[inicio] != Tipo.IDENTIFICADOR:
+            raise SyntaxError(f"El lado izquierdo de la asignación debe ser un identificador{self._ubicacion()}")
+
+        operador = cursor.advance()
+        derecha = self._parse_asignacion()
+        if operador != "=":
+            # x += e se representa como x = x + e
+            derecha = NodoBinaria(operador[:-1], NodoOperando(izquierda.texto), derecha)
+        elif type(derecha) is NodoOperando:
+            derecha = NodoValor(derecha.texto)
+        return NodoAsignacion(izquierda.texto, derecha)
+
+    def _parse_binaria(self, precedencia_minima):
+        """Precedence climbing sobre PRECEDENCIA_BINARIA.
+
+        Los operadores de un mismo nivel se encadenan en el bucle (asociando a la
+        izquierda), así que la profundidad de recursión depende de la cantidad de
+        niveles de precedencia y no del largo de la expresión.
+        """
+        cursor = self.cursor
+        izquierda = self._parse_unaria()
+        while True:
+            precedencia = PRECEDENCIA_POR_LEXEMA[cursor.lexema()]
+            if precedencia < precedencia_minima:  # 0 si el token no es un operador binario
+                return izquierda
+            operador = cursor.advance()
+            derecha = self._parse_binaria(precedencia + 1)
+            izquierda = NodoBinaria(operador, izquierda, derecha)
+
+    def _parse_unaria(self):
+        """unaria := ('!' | '~' | '-' | '+')* (('++' | '--') Identificador | primaria)"""
+        cursor = self.cursor
+        operadores = []
+        while True:
+            lexema = cursor.lexema()
+            if lexema == Lexema.INCREMENTO or lexema == Lexema.DECREMENTO:
+                # Forma prefija: ++i o --i
+                operador = cursor.advance()
+                if not cursor.check(Tipo.IDENTIFICADOR):
+                    raise SyntaxError(f"Se esperaba un identificador después de '{operador}'{self._ubicacion()}")
+                operando = NodoUnaria(operador, NodoIdentificador(cursor.advance()))
+                break
+            if lexema not in OPERADORES_UNARIOS:
+                operando = self._parse_primaria()
+                break
+            operadores.append(cursor.advance())
 
-        if not isinstance(self.hijos, list):
-            self.hijos = [self.hijos]
+        for operador in reversed(operadores):
+            operando = NodoUnaria(operador, operando)
+        return operando
 
-        for hijo in self.hijos:
-            if isinstance(hijo, ASTNode):
-                node_count = hijo.graficar(parent_id=node_id, node_count=node_count, nodes=nodes, edges=edges, level=level + 1)
-            elif isinstance(hijo, list):  
-                for subhijo in hijo:
-                    if isinstance(subhijo, ASTNode):
-                        node_count = subhijo.graficar(parent_id=node_id, node_count=node_count, nodes=nodes, edges=edges, level=level + 1)
-                    else:
-                        valor_str = str(subhijo) if subhijo is not None else "None"
-                        nodes.append((node_count, f"Valor: {valor_str}"))
-                        edges.append((node_id, node_count))
-                        node_count += 1
-            else:
-                valor_str = str(hijo) if hijo is not None else "None"
-                nodes.append((node_count, f"Valor: {valor_str}"))
-                edges.append((node_id, node_count))
-                node_count += 1
-
-        return node_count
-
-    def graficar_mpl(self, output_filename=None):
-        if output_filename is None:
-            output_filename = f"arbol_sintactico_{int(time.time())}.png"
-
-        nodes = []
-        edges = []
-        self.graficar(node_count=0, nodes=nodes, edges=edges)
-
-        G = nx.DiGraph()
-        for node_id, label in nodes:
-            G.add_node(node_id, label=label)
-        for start, end in edges:
-            G.add_edge(start, end)
-
-        pos = self.crear_layout_arbol(G, nodes, edges)
-        labels = nx.get_node_attributes(G, 'label')
-
-        plt.figure(figsize=(20, 15))
-        nx.draw(G, pos, with_labels=True, labels=labels, node_size=2000, node_color='lightblue', font_size=7, font_weight='bold', arrows=True)
-        plt.title("Árbol Sintáctico Abstracto")
-        plt.tight_layout()
-        plt.savefig(output_filename, format="PNG")
-        print(f"Árbol guardado como imagen: {output_filename}")
-        return output_filename
-
-    def crear_layout_arbol(self, G, nodes, edges):
-        pos = {}
-        levels = {}
-        for node_id, label in nodes:
-            level = self.obtener_nivel(node_id, edges)
-            if level not in levels:
-                levels[level] = []
-            levels[level].append(node_id)
-
-        max_level = max(levels.keys()) if levels else 0
-        vertical_spacing = 2
-        horizontal_spacing = 4
-
-        for level in range(max_level + 1):
-            if level not in levels:
-                continue
-            level_width = len(levels[level]) * horizontal_spacing
-            x_start = -level_width / 2
-            for i, node_id in enumerate(levels[level]):
-                x = x_start + i * horizontal_spacing
-                y = -level * vertical_spacing
-                pos[node_id] = (x, y)
-
-        return pos
-
-    def obtener_nivel(self, node_id, edges):
-        parent = self.obtener_padre(node_id, edges)
-        if parent is None:
-            return 0
-        return self.obtener_nivel(parent, edges) + 1
-
-    def obtener_padre(self, node_id, edges):
-        for start, end in edges:
-            if end == node_id:
-                return start
-        return None
-
-    # Método necesario para el patrón Visitor
-    def accept(self, visitor):
-        method_name = 'visit_' + self.tipo
-        visitor_method = getattr(visitor, method_name, None)
-        if visitor_method:
-            return visitor_method(self)
-        else:
-            raise NotImplementedError(f"No se encontró el método {method_name} en el visitor.")
+    def _parse_primaria(self):
+        """primaria := Identificador ['++' | '--'] | literal | '(' asignacion ')'"""
+        cursor = self.cursor
+        token_type = cursor.peek()
 
+        if token_type == Tipo.IDENTIFICADOR:
+            identificador = cursor.advance()
+            # Posfijo: i++ o i--
+            if cursor.check(Tipo.OPERADOR_INCREMENTO):
+                operador = cursor.advance()
+                return NodoUnaria(operador + "_post", NodoIdentificador(identificador))
+            return NodoOperando(identificador)
 
+        if token_type in TIPOS_LITERAL:
+            return NodoOperando(cursor.advance())
 
-class Parser:
-    def __init__(self, tokens):
-        self.tokens = tokens
-        self.current_token_index = 0
-        self.ast = None
-    
-    def eat(self, expected_type):
-        """Verifica si el token actual es del tipo esperado y avanza al siguiente"""
-        if self.current_token_index < len(self.tokens):
-            token_type, token_value, _, _ = self.tokens[self.current_token_index]
+        if cursor.check(Tipo.DELIMITADOR, Lexema.PAREN_ABRE):
+            cursor.advance()
+            expresion = self._parse_asignacion()
+            if not cursor.check(Tipo.DELIMITADOR, Lexema.PAREN_CIERRA):
+                raise SyntaxError(f"Se esperaba ')' para cerrar el paréntesis{self._ubicacion()}.")
+            cursor.advance()
+            return expresion
 
-
-            if token_type == expected_type:
-                self.current_token_index += 1
-                # Imprimir el token actual para ver qué está siendo procesado
-                print(f"Procesando token {self.current_token_index}: {token_type}, {token_value}")
-                return token_value
-            else:
-                raise SyntaxError(f"Error: Se esperaba '{expected_type}' pero se encontró '{token_value}'")
-        else:
-            raise SyntaxError(f"Error: Se esperaba '{expected_type}' pero no hay más tokens.")
-        
-    def parse_expresion(self):
-        """Regla: Identificador | Número | Identificador Operador Identificador"""
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-
-        if token_type == "Identificador":
-            izquierda = self.eat("Identificador")
-
-            # --- Posfijo: i++ o i-- ---
-            if self.current_token_index < len(self.tokens):
-                next_type, next_value, _, _ = self.tokens[self.current_token_index]
-                if next_type == "Operador de Incremento/Decremento" and next_value in ["++", "--"]:
-                    operador = self.eat("Operador de Incremento/Decremento")
-                    return ASTNode("ExpresionUnaria", operador + "_post", [ASTNode("Identificador", izquierda, [])])
-            
-        elif token_type == "Número":
-            izquierda = self.eat("Número")
-        elif token_type == "String Literal":
-            izquierda = self.eat("String Literal")
-
-            if self.current_token_index < len(self.tokens):
-                next_type, next_value, _, _ = self.tokens[self.current_token_index]
-                if next_type == "Operador Aritmético" and next_value == "+":
-                    operador = self.eat("Operador Aritmético")
-                    if self.tokens[self.current_token_index][0] in ["Identificador", "Número", "String Literal"]:
-                        derecha_token_type = self.tokens[self.current_token_index][0]
-                        derecha = self.eat(derecha_token_type)
-                        return ASTNode("Expresion", operador, [
-                            ASTNode("Operando", izquierda, []),
-                            ASTNode("Operando", derecha, [])
-                        ])
-                    else:
-                        raise SyntaxError("Se esperaba un identificador, número o string literal después de '+'")
-                    
-        elif token_type == "Literal Booleano":
-            izquierda = self.eat("Literal Booleano")
-        elif token_type == "Literal Nulo":
-            izquierda = self.eat("Literal Nulo")
-        else:
-            raise SyntaxError(f"Error en expresión: token inesperado '{token_type}'")
-        
-        
-        
-        # Soporte para ++Identificador o --Identificador (forma prefija)
-        if token_type == "Operador de Incremento/Decremento" and token_value in ["++", "--"]:
-            operador = self.eat("Operador de Incremento/Decremento")  # Consumimos ++ o --
-            if self.tokens[self.current_token_index][0] != "Identificador":
-                raise SyntaxError(f"Se esperaba un identificador después de '{operador}'")
-            identificador = self.eat("Identificador")
-            return ASTNode("ExpresionUnaria", operador, [ASTNode("Identificador", identificador, [])])
-        
-        # Manejo de asignación
-        if self.current_token_index < len(self.tokens) and self.tokens[self.current_token_index][0] == "Operador de Asignación":
-            operador_asignacion = self.eat("Operador de Asignación")
-            derecha = self.parse_expresion()  # Llamamos de nuevo a parse_expresion() para procesar la parte derecha
-            return ASTNode("Asignacion", operador_asignacion, [ASTNode("Identificador", izquierda, []), derecha])
-        
-        # Manejo de Operadores aritméticos o relacionales
-        if self.tokens[self.current_token_index][0] in ["Operador Aritmético", "Operador Relacional"]:
-            operador = self.eat(self.tokens[self.current_token_index][0])
-            derecha = self.eat("Identificador") if self.tokens[self.current_token_index][0] == "Identificador" else self.eat("Número")
-            return ASTNode("Expresion", operador, [ASTNode("Operando", izquierda, []), ASTNode("Operando", derecha, [])])
-        
-        delimitador = self.eat("Delimitador")
-        return ASTNode("Expresion", izquierda, [ASTNode("Valor", delimitador, [])])
+        if token_type == FIN:
+            raise SyntaxError("Error en expresión: no hay más tokens.")
+        raise SyntaxError(f"Error en expresión: token inesperado '{NOMBRES_TIPO[token_type]}'{self._ubicacion()}")
 
 
     def parse_declaracion_variable(self, modificadores=None):
         """Regla para una declaración de variable en Java: [modificadores] Tipo Identificador = Valor ;"""
+        cursor = self.cursor
 
         if modificadores is None:
             modificadores = []  # Si no se proporcionan modificadores, usar una lista vacía
 
-        if self.current_token_index < len(self.tokens):
-
-            token_type, token_value, _, _ = self.tokens[self.current_token_index]
+        if cursor.fin():
+            raise SyntaxError("Error: No se encontraron más tokens para procesar.")
 
-             # Si el token es un modificador, consumirlo y continuar
-            while token_type == "Token de Acceso" or token_type == "Palabra Reservada":
-                if token_value in ["public", "private", "protected", "static", "final"]:
-                    modificadores.append(token_value)
-                    self.eat(token_type)  # Consumir el modificador
-                else:
-                    break  # Salir del bucle si no es un modificador válido
-                
-                # Actualizar el token actual
-                if self.current_token_index < len(self.tokens):
-                    token_type, token_value, _, _ = self.tokens[self.current_token_index]
-                else:
-                    break
+        # Si el token es un modificador, consumirlo y continuar
+        while cursor.peek() in (Tipo.TOKEN_ACCESO, Tipo.PALABRA_RESERVADA):
+            if cursor.lexema() in MODIFICADORES_VARIABLE:
+                modificadores.append(cursor.advance())  # Consumir el modificador
+            else:
+                break  # Salir del bucle si no es un modificador válido
 
-            if token_type == "Tipo de dato" or token_value == "void":
+        if not (cursor.check(Tipo.TIPO_DATO) or cursor.lexema() == Lexema.VOID):
+            raise SyntaxError("Error: Se esperaba un tipo de dato al inicio de la declaración.")
 
-                if token_value != "void":
-                    tipo_dato = self.eat("Tipo de dato")  # Tipo de dato (int, float, etc.)
-                    identificador = self.eat("Identificador")  # Nombre de la variable
-                else:
-                    tipo_dato = self.eat("Palabra Reservada")  # variable de retorno (void.)
-                    identificador = self.eat("Identificador")  # Nombre de la variable
+        if cursor.lexema() != Lexema.VOID:
+            tipo_dato = cursor.expect(Tipo.TIPO_DATO)  # Tipo de dato (int, float, etc.)
+        else:
+            tipo_dato = cursor.expect(Tipo.PALABRA_RESERVADA)  # variable de retorno (void.)
+        identificador = cursor.expect(Tipo.IDENTIFICADOR)  # Nombre de la variable
 
-                # Verificar si hay una asignación
-                valor = None
-                operador_asignacion = None  # Inicializar la variable
+        # Verificar si hay una asignación
+        if cursor.check(Tipo.OPERADOR_ASIGNACION):
+            cursor.advance()  # Operador '='
+            valor = self.parse_expresion()
+            self._delimitador(Lexema.PUNTO_Y_COMA, "Se esperaba ';' al final de la declaración.")
+            # Crear el nodo de la declaración de la variable con el operador de asignación y los modificadores
+            return NodoDeclaracion(modificadores, tipo_dato, identificador, valor_inicial=valor)
 
-                if self.tokens[self.current_token_index][0] == "Operador de Asignación":
-                    operador_asignacion = self.eat("Operador de Asignación")  # Operador '='
-                    valor = self.parse_expresion()
-
-                else:
-
-                    delimitador = self.eat("Delimitador")  # Punto y coma ';'
-                
-                # Crear el nodo de la declaración de la variable con el operador de asignación y los modificadores
-                if operador_asignacion:
-                    return ASTNode("Declaracion", tipo_dato, [modificadores, ASTNode("Identificador", identificador, []), operador_asignacion, valor])
-                else:
-                    return ASTNode("Declaracion", tipo_dato, [modificadores, ASTNode("Identificador", identificador, []), delimitador])  # Sin valor si no hay asignación
-            else:
-                raise SyntaxError("Error: Se esperaba un tipo de dato al inicio de la declaración.")
-        else:
-            raise SyntaxError("Error: No se encontraron más tokens para procesar.")
+        delimitador = cursor.expect(Tipo.DELIMITADOR)  # Punto y coma ';'
+        return NodoDeclaracion(modificadores, tipo_dato, identificador, delimitador=delimitador)  # Sin valor si no hay asignación
 
 
     def parse_sentencia_if(self):
         """Analiza una sentencia 'if' con su bloque de instrucciones y opcionales 'else' o 'else if'."""
-        
-        print("Hola 0")
-        if self.current_token_index >= len(self.tokens):
+        return self._ejecutar(self._regla_if())
+
+    def _regla_if(self):
+        cursor = self.cursor
+
+        if cursor.fin():
             raise SyntaxError("Se esperaba 'if', pero no hay más tokens.")
-        
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        if token_type != "Condicional" or token_value != "if":
-            raise SyntaxError(f"Se esperaba 'if', pero se encontró '{token_value}'.")
-        
-        print("Hola")
-        self.eat("Condicional")  # Consumimos el 'if'
-
-        # 1. Verificamos el paréntesis de apertura '('
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "(":
-            raise SyntaxError("Se esperaba '(' después de 'if'.")
-        self.eat("Delimitador")  # Consumimos '('
+        if not cursor.check(Tipo.CONDICIONAL, Lexema.IF):
+            raise SyntaxError(f"Se esperaba 'if', pero se encontró '{cursor.valor()}'.")
+        cursor.advance()  # Consumimos el 'if'
+
+        # 1. Paréntesis de apertura '('
+        self._delimitador(Lexema.PAREN_ABRE, "Se esperaba '(' después de 'if'.")
 
         # 2. Expresión condicional dentro del 'if'
         expresion = self.parse_expresion()
 
-        # 3. Verificamos el paréntesis de cierre ')'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ")":
-            raise SyntaxError("Se esperaba ')' después de la expresión condicional.")
-        self.eat("Delimitador")  # Consumimos ')'
+        # 3. Paréntesis de cierre ')'
+        self._delimitador(Lexema.PAREN_CIERRA, "Se esperaba ')' después de la expresión condicional.")
 
-        # 4. Verificamos el delimitador de apertura de bloque '{'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-            raise SyntaxError("Se esperaba '{' después de ')'.")
-        self.eat("Delimitador")  # Consumimos '{'
+        # 4. Delimitador de apertura de bloque '{'
+        self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después de ')'.")
 
         # 5. Instrucciones dentro del bloque 'if'
-        instrucciones = self.parse_instrucciones()  # Parseamos las instrucciones dentro del bloque
-
-        # 6. Verificamos el delimitador de cierre de bloque '}'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-            raise SyntaxError("Se esperaba '}' al final del bloque 'if'.")
-        self.eat("Delimitador")  # Consumimos '}'
-
-        # 7. Opcional: Verificamos la existencia de un 'else'
-        if self.current_token_index < len(self.tokens):
-            token_type, token_value, _, _ = self.tokens[self.current_token_index]
-            
-            if token_type == "Condicional" and token_value == "else":
-                self.eat("Condicional")  # Consumimos 'else'
-
-                # Chequeamos si lo que sigue es un 'if'
-                if self.current_token_index < len(self.tokens):
-                    next_token_type, next_token_value, _, _ = self.tokens[self.current_token_index]
-                    if next_token_type == "Condicional" and next_token_value == "if":
-                        else_if_node = self.parse_sentencia_if()
-                        return ASTNode("IfElse", expresion, [instrucciones, else_if_node])
-                
-                # Verificamos el delimitador de apertura de bloque '{'
-                if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-                    raise SyntaxError("Se esperaba '{' después de 'else'.")
-                self.eat("Delimitador")  # Consumimos '{'
-                
-                instrucciones_else = self.parse_instrucciones()  # Parseamos las instrucciones del 'else'
-                
-                # Verificamos el delimitador de cierre de bloque '}'
-                if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-                    raise SyntaxError("Se esperaba '}' al final del bloque 'else'.")
-                self.eat("Delimitador")  # Consumimos '}'
-                
-                return ASTNode("IfElse", expresion, [instrucciones, instrucciones_else])
-        
-        return ASTNode("If", None, [expresion, instrucciones])
+        instrucciones = yield self._regla_instrucciones()
+
+        # 6. Delimitador de cierre de bloque '}'
+        self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final del bloque 'if'.")
+
+        # 7. Opcional: 'else' o 'else if'
+        if cursor.check(Tipo.CONDICIONAL, Lexema.ELSE):
+            cursor.advance()  # Consumimos 'else'
+
+            if cursor.check(Tipo.CONDICIONAL, Lexema.IF):
+                else_if_node = yield self._regla_if()
+                return NodoIf(expresion, instrucciones, else_if_node)
+
+            self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después de 'else'.")
+            instrucciones_else = yield self._regla_instrucciones()  # Parseamos las instrucciones del 'else'
+            self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final del bloque 'else'.")
+
+            return NodoIf(expresion, instrucciones, instrucciones_else)
+
+        return NodoIf(expresion, instrucciones)
 
 
     def parse_sentencia_while(self):
         """Regla para una sentencia while: while (condición) { instrucciones }"""
-        
-        # Verificar si hay más tokens antes de acceder al siguiente
-        if self.current_token_index >= len(self.tokens):
-            raise SyntaxError("Se esperaba 'while', pero no hay más tokens.")
-        
+        return self._ejecutar(self._regla_while())
+
+    def _regla_while(self):
+        cursor = self.cursor
+
         # Verificar la palabra clave 'while'
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        if token_type != "Bucle" or token_value != "while":
-            raise SyntaxError(f"Se esperaba 'while', pero se encontró '{token_value}'.")
-        self.eat("Bucle")  # Consumir 'while'
+        if cursor.fin():
+            raise SyntaxError("Se esperaba 'while', pero no hay más tokens.")
+        if not cursor.check(Tipo.BUCLE, Lexema.WHILE):
+            raise SyntaxError(f"Se esperaba 'while', pero se encontró '{cursor.valor()}'.")
+        cursor.advance()  # Consumir 'while'
 
-        # Verificar el delimitador '('
-        if self.current_token_index >= len(self.tokens) or self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "(":
-            raise SyntaxError("Se esperaba '(' después de 'while'.")
-        self.eat("Delimitador")  # Consumir '('
+        self._delimitador(Lexema.PAREN_ABRE, "Se esperaba '(' después de 'while'.")
 
         # Condición del while
         condicion = self.parse_expresion()
 
-        # Verificar el delimitador ')'
-        if self.current_token_index >= len(self.tokens) or self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ")":
-            raise SyntaxError("Se esperaba ')' después de la condición.")
-        self.eat("Delimitador")  # Consumir ')'
-
-        # Verificar el delimitador de apertura del bloque '{'
-        if self.current_token_index >= len(self.tokens) or self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-            raise SyntaxError("Se esperaba '{' después de ')'.")
-        self.eat("Delimitador")  # Consumir '{'
+        self._delimitador(Lexema.PAREN_CIERRA, "Se esperaba ')' después de la condición.")
+        self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después de ')'.")
 
         # Instrucciones dentro del bloque while
-        instrucciones = self.parse_instrucciones()
+        instrucciones = yield self._regla_instrucciones()
 
-        # Verificar el delimitador de cierre del bloque '}'
-        if self.current_token_index >= len(self.tokens) or self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-            raise SyntaxError("Se esperaba '}' al final del bloque 'while'.")
-        self.eat("Delimitador")  # Consumir '}'
+        self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final del bloque 'while'.")
 
         # Crear el nodo para el bucle while
-        return ASTNode("While", None, [condicion, instrucciones])
-    
+        return NodoWhile(condicion, instrucciones)
+
 
     def parse_sentencia_do_while(self):
         """Regla para una sentencia do-while: do { instrucciones } while (condición);"""
-        
+        return self._ejecutar(self._regla_do_while())
+
+    def _regla_do_while(self):
+        cursor = self.cursor
+
         # Verificar la palabra clave 'do'
-        if self.current_token_index >= len(self.tokens):
+        if cursor.fin():
             raise SyntaxError("Se esperaba 'do', pero no hay más tokens.")
-        
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        if token_type != "Bucle" or token_value != "do":
-            raise SyntaxError(f"Se esperaba 'do', pero se encontró '{token_value}'.")
-        self.eat("Bucle")  # Consumir 'do'
+        if not cursor.check(Tipo.BUCLE, Lexema.DO):
+            raise SyntaxError(f"Se esperaba 'do', pero se encontró '{cursor.valor()}'.")
+        cursor.advance()  # Consumir 'do'
 
-        # Verificar el delimitador de apertura del bloque '{'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-            raise SyntaxError("Se esperaba '{' después de 'do'.")
-        self.eat("Delimitador")  # Consumir '{'
+        self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después de 'do'.")
 
         # Instrucciones dentro del bloque do
-        instrucciones = self.parse_instrucciones()
+        instrucciones = yield self._regla_instrucciones()
 
-        # Verificar el delimitador de cierre del bloque '}'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-            raise SyntaxError("Se esperaba '}' al final del bloque 'do'.")
-        self.eat("Delimitador")  # Consumir '}'
+        self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final del bloque 'do'.")
 
         # Verificar la palabra clave 'while'
-        if self.current_token_index >= len(self.tokens):
+        if cursor.fin():
             raise SyntaxError("Se esperaba 'while', pero no hay más tokens.")
-        
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        if token_type != "Bucle" or token_value != "while":
-            raise SyntaxError(f"Se esperaba 'while', pero se encontró '{token_value}'.")
-        self.eat("Bucle")  # Consumir 'while'
+        if not cursor.check(Tipo.BUCLE, Lexema.WHILE):
+            raise SyntaxError(f"Se esperaba 'while', pero se encontró '{cursor.valor()}'.")
+        cursor.advance()  # Consumir 'while'
 
-        # Verificar el delimitador '('
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "(":
-            raise SyntaxError("Se esperaba '(' después de 'while'.")
-        self.eat("Delimitador")  # Consumir '('
+        self._delimitador(Lexema.PAREN_ABRE, "Se esperaba '(' después de 'while'.")
 
         # Condición del while
         condicion = self.parse_expresion()
 
-        # Verificar el delimitador ')'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ")":
-            raise SyntaxError("Se esperaba ')' después de la condición.")
-        self.eat("Delimitador")  # Consumir ')'
-
-        # Verificar el delimitador ';'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ";":
-            raise SyntaxError("Se esperaba ';' al final de 'do-while'.")
-        self.eat("Delimitador")  # Consumir ';'
+        self._delimitador(Lexema.PAREN_CIERRA, "Se esperaba ')' después de la condición.")
+        self._delimitador(Lexema.PUNTO_Y_COMA, "Se esperaba ';' al final de 'do-while'.")
 
         # Crear el nodo para el bucle do-while
-        return ASTNode("DoWhile", None, [instrucciones, condicion])
-    
+        return NodoDoWhile(instrucciones, condicion)
+
     def parse_sentencia_for(self):
         """Regla para una sentencia for: for (inicialización; condición; actualización) { ... }"""
+        return self._ejecutar(self._regla_for())
+
+    def _regla_for(self):
+        cursor = self.cursor
 
         # Verificar la palabra clave 'for'
-        if self.current_token_index >= len(self.tokens):
+        if cursor.fin():
             raise SyntaxError("Se esperaba 'for', pero no hay más tokens.")
-        
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        if token_type != "Bucle" or token_value != "for":
-            raise SyntaxError(f"Se esperaba 'for', pero se encontró '{token_value}'.")
-        self.eat("Bucle")  # Consumir 'for'
+        if not cursor.check(Tipo.BUCLE, Lexema.FOR):
+            raise SyntaxError(f"Se esperaba 'for', pero se encontró '{cursor.valor()}'.")
+        cursor.advance()  # Consumir 'for'
 
-        # Verificar el delimitador '('
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "(":
-            raise SyntaxError("Se esperaba '(' después de 'for'.")
-        self.eat("Delimitador")  # Consumir '('
+        self._delimitador(Lexema.PAREN_ABRE, "Se esperaba '(' después de 'for'.")
 
         # Inicialización (declaración o expresión)
-        if self.tokens[self.current_token_index][0] == "Tipo de dato":
+        if cursor.check(Tipo.TIPO_DATO):
             inicializacion = self.parse_declaracion_variable()
         else:
             inicializacion = self.parse_expresion()
-
+            self._delimitador(Lexema.PUNTO_Y_COMA, "Se esperaba ';' después de la inicialización.")
 
         # Condición
         condicion = self.parse_expresion()
 
-        # Verificar el delimitador ';'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ";":
-            raise SyntaxError("Se esperaba ';' después de la condición.")
-        self.eat("Delimitador")  # Consumir ';'
+        self._delimitador(Lexema.PUNTO_Y_COMA, "Se esperaba ';' después de la condición.")
 
         # Actualización
         actualizacion = self.parse_expresion()
 
-        # Verificar el delimitador ')'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ")":
-            raise SyntaxError("Se esperaba ')' después de la actualización.")
-        self.eat("Delimitador")  # Consumir ')'
-
-        # Verificar el delimitador de apertura del bloque '{'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-            raise SyntaxError("Se esperaba '{' después de 'for'.")
-        self.eat("Delimitador")  # Consumir '{'
+        self._delimitador(Lexema.PAREN_CIERRA, "Se esperaba ')' después de la actualización.")
+        self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después de 'for'.")
 
         # Instrucciones dentro del bloque for
-        instrucciones = self.parse_instrucciones()
+        instrucciones = yield self._regla_instrucciones()
 
-        # Verificar el delimitador de cierre del bloque '}'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-            raise SyntaxError("Se esperaba '}' al final del bloque 'for'.")
-        self.eat("Delimitador")  # Consumir '}'
+        self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final del bloque 'for'.")
 
         # Crear el nodo para el bucle for
-        return ASTNode("For", None, [inicializacion, condicion, actualizacion, instrucciones])
+        return NodoFor(inicializacion, condicion, actualizacion, instrucciones)
 
-    
 
     def parse_declaracion_funcion(self, modificadores=None):
         """Regla para una declaración de función: [modificadores] tipo_retorno nombre_funcion(parámetros) { ... }"""
+        return self._ejecutar(self._regla_funcion(modificadores))
+
+    def _regla_funcion(self, modificadores=None):
+        cursor = self.cursor
+
         if modificadores is None:
             modificadores = []  # Si no se proporcionan modificadores, usar una lista vacía
-        
+
         # Validar combinaciones inválidas de modificadores
         if "abstract" in modificadores and "final" in modificadores:
             raise SyntaxError("Error: Un método no puede ser 'abstract' y 'final' al mismo tiempo.")
         if "abstract" in modificadores and "static" in modificadores:
             raise SyntaxError("Error: Un método no puede ser 'abstract' y 'static' al mismo tiempo.")
-        
-        
+
         # Verificar el tipo de retorno
-        if self.current_token_index >= len(self.tokens):
+        if cursor.fin():
             raise SyntaxError("Se esperaba un tipo de retorno, pero no hay más tokens.")
-        
-        if self.tokens[self.current_token_index][0] == "Tipo de dato":
 
-            tipo_retorno = self.eat("Tipo de dato")  # Consumir el tipo de retorno (int, float, etc)
+        if cursor.check(Tipo.TIPO_DATO):
+            tipo_retorno = cursor.advance()  # Consumir el tipo de retorno (int, float, etc)
         else:
-            tipo_retorno = self.eat("Palabra Reservada") # Consumir el tipo de retorno (void)
+            tipo_retorno = cursor.expect(Tipo.PALABRA_RESERVADA)  # Consumir el tipo de retorno (void)
 
-        # Verificar el nombre de la función
-        nombre_funcion = self.eat("Identificador")  # Consumir el nombre de la función
+        # Nombre de la función
+        nombre_funcion = cursor.expect(Tipo.IDENTIFICADOR)
 
-        
-        # Verificar el delimitador '('
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "(":
-            raise SyntaxError("Se esperaba '(' después del nombre de la función.")
-        self.eat("Delimitador")  # Consumir '('
+        self._delimitador(Lexema.PAREN_ABRE, "Se esperaba '(' después del nombre de la función.")
 
-       
         # Parámetros (pueden ser múltiples, separados por comas)
         parametros = []
-        while self.current_token_index < len(self.tokens):
-            token_type, token_value, _, _ = self.tokens[self.current_token_index]
-            
+        while not cursor.fin():
             # Si encontramos ')', significa que no hay más parámetros
-            if token_type == "Delimitador" and token_value == ")":
-                break  # Salir del bucle si encontramos ')'
-            
-            if token_type == "Tipo de dato":
-                tipo_parametro = self.eat("Tipo de dato")
-                nombre_parametro = self.eat("Identificador")
+            if cursor.check(Tipo.DELIMITADOR, Lexema.PAREN_CIERRA):
+                break
+
+            if cursor.check(Tipo.TIPO_DATO):
+                tipo_parametro = cursor.advance()
+                nombre_parametro = cursor.expect(Tipo.IDENTIFICADOR)
                 parametros.append((tipo_parametro, nombre_parametro))
-            
+
                 # Verificar si hay más parámetros
-                if self.current_token_index < len(self.tokens) and self.tokens[self.current_token_index][0] == "Delimitador" and self.tokens[self.current_token_index][1] == ",":
-                    self.eat("Delimitador")  # Consumir ','
+                if cursor.check(Tipo.DELIMITADOR, Lexema.COMA):
+                    cursor.advance()  # Consumir ','
             else:
-                raise SyntaxError(f"Error: Token inesperado '{token_value}' en la lista de parámetros.")
+                raise SyntaxError(f"Error: Token inesperado '{cursor.valor()}' en la lista de parámetros.")
 
-       
-        # Verificar el delimitador ')'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ")":
-            raise SyntaxError("Se esperaba ')' después de los parámetros.")
-        self.eat("Delimitador")  # Consumir ')'
-
-        
-        # Verificar el delimitador de apertura del bloque '{'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-            raise SyntaxError("Se esperaba '{' después de la declaración de la función.")
-        self.eat("Delimitador")  # Consumir '{'
+        self._delimitador(Lexema.PAREN_CIERRA, "Se esperaba ')' después de los parámetros.")
+        self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después de la declaración de la función.")
 
         # Instrucciones dentro del bloque de la función
-        instrucciones = self.parse_instrucciones()
+        instrucciones = yield self._regla_instrucciones()
 
-        # Verificar el delimitador de cierre del bloque '}'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-            raise SyntaxError("Se esperaba '}' al final del bloque de la función.")
-        self.eat("Delimitador")  # Consumir '}'
+        self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final del bloque de la función.")
 
         # Crear el nodo para la declaración de la función
-        return ASTNode("Funcion", tipo_retorno, [modificadores, nombre_funcion, parametros, instrucciones])
-    
+        return NodoFuncion(modificadores, tipo_retorno, nombre_funcion, parametros, instrucciones)
+
 
     def parse_sentencia_try_catch(self):
         """Regla para una sentencia try-catch: try { ... } catch (TipoExcepcion e) { ... }"""
-        
+        return self._ejecutar(self._regla_try_catch())
+
+    def _regla_try_catch(self):
+        cursor = self.cursor
+
         # Verificar la palabra clave 'try'
-        if self.current_token_index >= len(self.tokens):
+        if cursor.fin():
             raise SyntaxError("Se esperaba 'try', pero no hay más tokens.")
-        
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        if token_type != "Excepción" or token_value != "try":
-            raise SyntaxError(f"Se esperaba 'try', pero se encontró '{token_value}'.")
-        self.eat("Excepción")  # Consumir 'try'
+        if not cursor.check(Tipo.EXCEPCION, Lexema.TRY):
+            raise SyntaxError(f"Se esperaba 'try', pero se encontró '{cursor.valor()}'.")
+        cursor.advance()  # Consumir 'try'
 
-        # Verificar el delimitador de apertura del bloque '{'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-            raise SyntaxError("Se esperaba '{' después de 'try'.")
-        self.eat("Delimitador")  # Consumir '{'
+        self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después de 'try'.")
 
         # Instrucciones dentro del bloque try
-        instrucciones_try = self.parse_instrucciones()
+        instrucciones_try = yield self._regla_instrucciones()
 
-        # Verificar el delimitador de cierre del bloque '}'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-            raise SyntaxError("Se esperaba '}' al final del bloque 'try'.")
-        self.eat("Delimitador")  # Consumir '}'
+        self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final del bloque 'try'.")
 
         # Verificar la palabra clave 'catch'
-        if self.current_token_index >= len(self.tokens):
+        if cursor.fin():
             raise SyntaxError("Se esperaba 'catch', pero no hay más tokens.")
-        
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        if token_type != "Excepción" or token_value != "catch":
-            raise SyntaxError(f"Se esperaba 'catch', pero se encontró '{token_value}'.")
-        self.eat("Excepción")  # Consumir 'catch'
-
-        # Verificar el delimitador '('
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "(":
-            raise SyntaxError("Se esperaba '(' después de 'catch'.")
-        self.eat("Delimitador")  # Consumir '('
+        if not cursor.check(Tipo.EXCEPCION, Lexema.CATCH):
+            raise SyntaxError(f"Se esperaba 'catch', pero se encontró '{cursor.valor()}'.")
+        cursor.advance()  # Consumir 'catch'
 
-        # Tipo de excepción
-        tipo_excepcion = self.eat("Tipo de dato")  # Consumir el tipo de excepción
+        self._delimitador(Lexema.PAREN_ABRE, "Se esperaba '(' después de 'catch'.")
 
-        # Nombre de la variable de excepción
-        nombre_excepcion = self.eat("Identificador")  # Consumir el nombre de la excepción
+        # Tipo y nombre de la variable de excepción
+        tipo_excepcion = cursor.expect(Tipo.TIPO_DATO)
+        nombre_excepcion = cursor.expect(Tipo.IDENTIFICADOR)
 
-        # Verificar el delimitador ')'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ")":
-            raise SyntaxError("Se esperaba ')' después de la declaración de la excepción.")
-        self.eat("Delimitador")  # Consumir ')'
-
-        # Verificar el delimitador de apertura del bloque '{'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-            raise SyntaxError("Se esperaba '{' después de 'catch'.")
-        self.eat("Delimitador")  # Consumir '{'
+        self._delimitador(Lexema.PAREN_CIERRA, "Se esperaba ')' después de la declaración de la excepción.")
+        self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después de 'catch'.")
 
         # Instrucciones dentro del bloque catch
-        instrucciones_catch = self.parse_instrucciones()
+        instrucciones_catch = yield self._regla_instrucciones()
 
-        # Verificar el delimitador de cierre del bloque '}'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-            raise SyntaxError("Se esperaba '}' al final del bloque 'catch'.")
-        self.eat("Delimitador")  # Consumir '}'
+        self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final del bloque 'catch'.")
 
         # Crear el nodo para la sentencia try-catch
-        return ASTNode("TryCatch", None, [instrucciones_try, (tipo_excepcion, nombre_excepcion), instrucciones_catch])
-    
+        return NodoTryCatch(instrucciones_try, tipo_excepcion, nombre_excepcion, instrucciones_catch)
+
 
     def parse_sentencia_switch(self):
         """Regla para una sentencia switch: switch (expresión) { case valor: ... break; default: ... }"""
-        
+        return self._ejecutar(self._regla_switch())
+
+    def _regla_switch(self):
+        cursor = self.cursor
+
         # Verificar la palabra clave 'switch'
-        if self.current_token_index >= len(self.tokens):
+        if cursor.fin():
             raise SyntaxError("Se esperaba 'switch', pero no hay más tokens.")
-        
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        if token_type != "Palabra Reservada" or token_value != "switch":
-            raise SyntaxError(f"Se esperaba 'switch', pero se encontró '{token_value}'.")
-        self.eat("Palabra Reservada")  # Consumir 'switch'
+        if not cursor.check(Tipo.PALABRA_RESERVADA, Lexema.SWITCH):
+            raise SyntaxError(f"Se esperaba 'switch', pero se encontró '{cursor.valor()}'.")
+        cursor.advance()  # Consumir 'switch'
 
-        # Verificar el delimitador '('
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "(":
-            raise SyntaxError("Se esperaba '(' después de 'switch'.")
-        self.eat("Delimitador")  # Consumir '('
+        self._delimitador(Lexema.PAREN_ABRE, "Se esperaba '(' después de 'switch'.")
 
         # Expresión del switch
         expresion = self.parse_expresion()
 
-        # Verificar el delimitador de apertura del bloque '{'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-            raise SyntaxError("Se esperaba '{' después de 'switch'.")
-        self.eat("Delimitador")  # Consumir '{'
+        self._delimitador(Lexema.PAREN_CIERRA, "Se esperaba ')' después de la expresión del switch.")
+
+        self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después de 'switch'.")
 
         # Casos del switch
         casos = []
         default_case = None
 
-        while self.current_token_index < len(self.tokens):
-            token_type, token_value, _, _ = self.tokens[self.current_token_index]
-            
+        while not cursor.fin():
             # Verificar si es un caso
-            if token_type == "Palabra Reservada" and token_value == "case":
-                self.eat("Palabra Reservada")  # Consumir 'case'
-                
-                # Valor del caso
+            if cursor.check(Tipo.PALABRA_RESERVADA, Lexema.CASE):
+                cursor.advance()  # Consumir 'case'
+
+                # Valor e instrucciones del caso
                 valor = self.parse_expresion()
+                self._delimitador(Lexema.DOS_PUNTOS, "Se esperaba ':' después del valor del case.")
+                instrucciones = yield self._regla_instrucciones()
 
-                # Instrucciones del caso
-                instrucciones = self.parse_instrucciones()
+                casos.append(NodoCase(valor, instrucciones))
 
-                # Agregar el caso a la lista
-                casos.append(ASTNode("Case", None, [valor, instrucciones]))
-            
             # Verificar si es el caso por defecto
-            elif token_type == "Palabra Reservada" and token_value == "default":
-                self.eat("Palabra Reservada")  # Consumir 'default'
+            elif cursor.check(Tipo.PALABRA_RESERVADA, Lexema.DEFAULT):
+                cursor.advance()  # Consumir 'default'
 
-                # Verificar el delimitador ':'
-                if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ":":
-                    raise SyntaxError("Se esperaba ':' después de 'default'.")
-                self.eat("Delimitador")  # Consumir ':'
+                self._delimitador(Lexema.DOS_PUNTOS, "Se esperaba ':' después de 'default'.")
 
                 # Instrucciones del caso por defecto
-                default_case = self.parse_instrucciones()
-            
+                default_case = yield self._regla_instrucciones()
+
             # Verificar el delimitador de cierre del bloque '}'
-            elif token_type == "Delimitador" and token_value == "}":
+            elif cursor.check(Tipo.DELIMITADOR, Lexema.LLAVE_CIERRA):
                 break  # Salir del bucle
-            
-            else:
-                raise SyntaxError(f"Token inesperado '{token_value}' en el switch.")
 
-        # Verificar el delimitador de cierre del bloque '}'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-            raise SyntaxError("Se esperaba '}' al final del bloque 'switch'.")
-        self.eat("Delimitador")  # Consumir '}'
+            else:
+                raise SyntaxError(f"Token inesperado '{cursor.valor()}' en el switch.")
 
-        if default_case:
-            default_case = ASTNode("Default", None, [default_case])
+        self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final del bloque 'switch'.")
 
+        if default_case is not None:
+            default_case = NodoDefault(default_case)
 
         # Crear el nodo para la sentencia switch
-        return ASTNode("Switch", None, [expresion] + casos + ([default_case] if default_case else []))
-    
-    
+        return NodoSwitch(expresion, casos, default_case)
+
+
     def parse_sentencia_break(self):
         """Regla para una sentencia break;"""
-        self.eat("Palabra Reservada")  # Consumir 'break'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != ";":
-            raise SyntaxError("Se esperaba ';' después de 'break'.")
-        self.eat("Delimitador")  # Consumir ';'
-        return ASTNode("Break", "break", [])
+        self.cursor.expect(Tipo.PALABRA_RESERVADA)  # Consumir 'break'
+        self._delimitador(Lexema.PUNTO_Y_COMA, "Se esperaba ';' después de 'break'.")
+        return NodoBreak()
 
 
     def parse_declaracion_clase(self, modificadores=None):
         """Regla para una declaración de clase: [modificadores] class NombreClase { ... }"""
+        return self._ejecutar(self._regla_clase(modificadores))
+
+    def _regla_clase(self, modificadores=None):
+        cursor = self.cursor
+
         if modificadores is None:
             modificadores = []  # Si no se proporcionan modificadores, usar una lista vacía
-        
+
         # Verificar la palabra clave 'class'
-        if self.current_token_index >= len(self.tokens):
+        if cursor.fin():
             raise SyntaxError("Se esperaba 'class', pero no hay más tokens.")
-        
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        if token_type != "Palabra Reservada" or token_value != "class":
-            raise SyntaxError(f"Se esperaba 'class', pero se encontró '{token_value}'.")
-        self.eat("Palabra Reservada")  # Consumir 'class'
+        if not cursor.check(Tipo.PALABRA_RESERVADA, Lexema.CLASS):
+            raise SyntaxError(f"Se esperaba 'class', pero se encontró '{cursor.valor()}'.")
+        cursor.advance()  # Consumir 'class'
 
         # Nombre de la clase
-        nombre_clase = self.eat("Identificador")  # Consumir el nombre de la clase
+        nombre_clase = cursor.expect(Tipo.IDENTIFICADOR)
 
-        # Verificar el delimitador de apertura del bloque '{'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "{":
-            raise SyntaxError("Se esperaba '{' después del nombre de la clase.")
-        self.eat("Delimitador")  # Consumir '{'
+        self._delimitador(Lexema.LLAVE_ABRE, "Se esperaba '{' después del nombre de la clase.")
 
         # Atributos y métodos de la clase
         miembros = []
 
-        while self.current_token_index < len(self.tokens):
-            token_type, token_value, _, _ = self.tokens[self.current_token_index]
-            
+        while not cursor.fin():
             # Verificar si es el cierre de bloque '}'
-            if token_type == "Delimitador" and token_value == "}":
-                break  # Salir del bucle si encontramos '}'
-
-            # Recolectar modificadores (public, private, protected, static, etc.)
-            modificadores_miembro = self.parse_modificadores()
-
-            # Verificar el tipo de declaración basado en el siguiente token
-            if self.current_token_index < len(self.tokens):
-                token_type, token_value, _, _ = self.tokens[self.current_token_index]
-            
-                # 1. Declaración de variable (atributo)
-                if token_type == "Tipo de dato":
-                    miembros.append(self.parse_declaracion_variable(modificadores_miembro))  # Atributo
-                    print("cond 1")
-                
-                # 2. Declaración de función (método)
-                elif token_type == "Tipo de dato" or (token_type == "Palabra Reservada" and token_value == "void"):
-                    miembros.append(self.parse_declaracion_funcion(modificadores_miembro))  # Método
-                    print("cond 2")
-
-                # Verificar si es un delimitador ';' (instrucción vacía)
-                elif token_type == "Delimitador" and token_value == ";":
-                    self.eat("Delimitador")  # Consumir ';'
-                    print("cond 3")
-                
-                # 3. Token inesperado
-                else:
-                    raise SyntaxError(f"Token inesperado '{token_value}' en la clase. Se esperaba un atributo, método o '}}'.")
+            if cursor.check(Tipo.DELIMITADOR, Lexema.LLAVE_CIERRA):
+                break
+
+            inicio = cursor.indice
+            cantidad = len(miembros)
+
+            try:
+                # Recolectar modificadores (public, private, protected, static, etc.)
+                modificadores_miembro = self.parse_modificadores()
 
-        # Verificar el delimitador de cierre del bloque '}'
-        if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "}":
-            raise SyntaxError("Se esperaba '}' al final de la clase.")
-        self.eat("Delimitador")  # Consumir '}'
+                # Verificar el tipo de declaración basado en el siguiente token
+                if not cursor.fin():
+                    # 1. Declaración de variable (atributo)
+                    if cursor.check(Tipo.TIPO_DATO):
+                        miembros.append(self.parse_declaracion_variable(modificadores_miembro))
+
+                    # 2. Declaración de función (método)
+                    elif cursor.check(Tipo.PALABRA_RESERVADA, Lexema.VOID):
+                        miembros.append((yield self._regla_funcion(modificadores_miembro)))
+
+                    # Verificar si es un delimitador ';' (instrucción vacía)
+                    elif cursor.check(Tipo.DELIMITADOR, Lexema.PUNTO_Y_COMA):
+                        cursor.advance()  # Consumir ';'
+
+                    # 3. Token inesperado
+                    else:
+                        raise SyntaxError(f"Token inesperado '{cursor.valor()}' en la clase{self._ubicacion()}. Se esperaba un atributo, método o '}}'.")
+            except SyntaxError as e:
+                if not self.recuperar:
+                    raise
+                del miembros[cantidad:]  # La instrucción pudo quedar agregada antes del error
+                miembros.append(self._recuperar(e, inicio))
+
+            if len(miembros) > cantidad:
+                miembros[-1].posicion = self._posicion(inicio)
+
+        self._delimitador(Lexema.LLAVE_CIERRA, "Se esperaba '}' al final de la clase.")
 
         # Crear el nodo para la declaración de la clase
-        return ASTNode("Clase", None, [modificadores, nombre_clase, miembros])
+        return NodoClase(modificadores, nombre_clase, miembros)
 
 
     def parse_modificadores(self):
         """Recolecta los modificadores de acceso y otros modificadores."""
+        cursor = self.cursor
         modificadores = []
-        while self.current_token_index < len(self.tokens):
-            token_type, token_value, _, _ = self.tokens[self.current_token_index]
-            
-            # Verificar si es un modificador válido
-            if token_type == "Token de Acceso" or token_type == "Palabra Reservada":
-                if token_value in ["public", "private", "protected", "static", "final", "abstract"]:
-                    modificadores.append(token_value)
-                    self.eat(token_type)  # Consumir el modificador
-                else:
-                    break  # Salir del bucle si no es un modificador válido
-            else:
-                break  # Salir del bucle si no es un modificador
-        
+        while cursor.peek() in (Tipo.TOKEN_ACCESO, Tipo.PALABRA_RESERVADA) and cursor.lexema() in MODIFICADORES:
+            modificadores.append(cursor.advance())  # Consumir el modificador
         return modificadores
 
     def parse_sentencia_print(self):
         """Regla para una sentencia System.out.println o System.out.print: System.out.println(expresión);"""
-        
+        cursor = self.cursor
+
         # Verificar si es una sentencia de impresión
-        if self.current_token_index >= len(self.tokens):
+        if cursor.fin():
             raise SyntaxError("Se esperaba una sentencia de impresión, pero no hay más tokens.")
-        
-        token_type, token_value, _, _ = self.tokens[self.current_token_index]
-        
-        # Verificar si es un token de impresión específico
-        if token_type == "Imprimir":
-            tipo_print = self.eat("Imprimir")
-            
-            # Verificar el paréntesis de apertura
-            if self.tokens[self.current_token_index][0] != "Delimitador" or self.tokens[self.current_token_index][1] != "(":
-                raise SyntaxError("Se esperaba '(' después de la sentencia de impresión.")
-            self.eat("Delimitador")  # Consumir '('
-            
-            # Procesar argumentos
-            expr = self.parse_expresion()
-            argumentos = [expr]
-
-            # Verificar el punto y coma
-            if self.tokens[self.current_token_index][0] == "Delimitador" or self.tokens[self.current_token_index][1] != ";":
-                if self.tokens[self.current_token_index][1] == ';':
-                    self.eat("Delimitador")  # Consumir ';'
-                elif self.tokens[self.current_token_index][1] == ')':
-                    self.eat("Delimitador")  # Consumir ')'
-                    self.eat("Delimitador")  # Consumir ';'
-            else:
-                raise SyntaxError("Se esperaba ';' al final de la sentencia print.")
-            
-            # Crear el nodo para la sentencia print
-            return ASTNode("Print", tipo_print, argumentos)
-        
-        else:
-            raise SyntaxError(f"Se esperaba una sentencia de impresión, pero se encontró '{token_value}'.")
+        if not cursor.check(Tipo.IMPRIMIR):
+            raise SyntaxError(f"Se esperaba una sentencia de impresión, pero se encontró '{cursor.valor()}'.")
+        tipo_print = cursor.advance()
+
+        self._delimitador(Lexema.PAREN_ABRE, "Se esperaba '(' después de la sentencia de impresión.")
+
+        # Procesar argumentos (puede no haber ninguno)
+        argumentos = []
+        if not cursor.check(Tipo.DELIMITADOR, Lexema.PAREN_CIERRA):
+            argumentos.append(self.parse_expresion())
+
+        self._delimitador(Lexema.PAREN_CIERRA, "Se esperaba ')' al final de los argumentos de la sentencia print.")
+        self._delimitador(Lexema.PUNTO_Y_COMA, "Se esperaba ';' al final de la sentencia print.")
+
+        # Crear el nodo para la sentencia print
+        return NodoPrint(tipo_print, argumentos)
 
 
     def parse_instrucciones(self):
         """Analiza las instrucciones dentro de un bloque."""
+        return self._ejecutar(self._regla_instrucciones())
+
+    def _regla_instrucciones(self):
+        cursor = self.cursor
         instrucciones = []
-        while self.current_token_index < len(self.tokens):
-            token_type, token_value, _, _ = self.tokens[self.current_token_index]
-            
-             # 🚨 Detener cuando aparezca el siguiente case, default o cierre de bloque
-            if (token_type == "Palabra Reservada" and token_value in ["case", "default"]) or (token_type == "Delimitador" and token_value == "}"):
+        while not cursor.fin():
+            token_type = cursor.peek()
+            lexema = cursor.lexema()
+
+            # Detener cuando aparezca el siguiente case, default o cierre de bloque
+            if (token_type == Tipo.PALABRA_RESERVADA and lexema in (Lexema.CASE, Lexema.DEFAULT)) or (token_type == Tipo.DELIMITADOR and lexema == Lexema.LLAVE_CIERRA):
                 break
-            
-            # Recolectar modificadores (public, private, protected, static, etc.)
-            modificadores = self.parse_modificadores()
-            
-            # Verificar el tipo de declaración basado en el siguiente token
-            if self.current_token_index < len(self.tokens):
-                token_type, token_value, _, _ = self.tokens[self.current_token_index]
-                
-                # 1. Declaración de variable
-                if token_type == "Tipo de dato":
-                    print("Inicio")
-                    instrucciones.append(self.parse_declaracion_variable(modificadores))  # Declaración de variable
-                
-                # 2. Declaración de función
-                elif token_type == "Tipo de dato" or (token_type == "Palabra Reservada" and token_value == "void"):
-                    instrucciones.append(self.parse_declaracion_funcion(modificadores))  # Declaración de función
-                
-                # 3. Declaración de clase
-                elif token_type == "Palabra Reservada" and token_value == "class":
-                    instrucciones.append(self.parse_declaracion_clase(modificadores))  # Declaración de clase
-                
-                # 4. Sentencia if
-                elif token_type == "Condicional" and token_value == "if":
-                    print("Entro")
-                    instrucciones.append(self.parse_sentencia_if())  # Sentencia if
-                
-                # 5. Sentencia while
-                elif token_type == "Bucle" and token_value == "while":
-                    instrucciones.append(self.parse_sentencia_while())  # Sentencia while
-                
-                # 6. Sentencia do-while
-                elif token_type == "Bucle" and token_value == "do":
-                    instrucciones.append(self.parse_sentencia_do_while())  # Sentencia do-while
-                
-                # 7. Sentencia for
-                elif token_type == "Bucle" and token_value == "for":
-                    instrucciones.append(self.parse_sentencia_for())  # Sentencia for
-                
-                # 8. Sentencia try-catch
-                elif token_type == "Excepción" and token_value == "try":
-                    instrucciones.append(self.parse_sentencia_try_catch())  # Sentencia try-catch
-                
-                # 9. Sentencia switch
-                elif token_type == "Palabra Reservada" and token_value == "switch":
-                    instrucciones.append(self.parse_sentencia_switch())  # Sentencia switch
-                
-                elif token_type == "Palabra Reservada" and token_value == "break":
-                    instrucciones.append(self.parse_sentencia_break())
-                
-                # 10. Sentencia de impresión (System.out.print/println o token Imprimir)
-                elif token_type == "Imprimir" or (token_type == "Identificador" and token_value == "System"):
-                    instrucciones.append(self.parse_sentencia_print())  # Sentencia print
-                
-                # 11. Expresión o asignación
-                elif token_type == "Identificador":
-                    if self.current_token_index + 1 < len(self.tokens) and self.tokens[self.current_token_index + 1][0] == "Operador de Asignación":
-                        instrucciones.append(self.parse_expresion())  # Asignación
+
+            inicio = cursor.indice
+            cantidad = len(instrucciones)
+
+            try:
+                # Recolectar modificadores (public, private, protected, static, etc.)
+                modificadores = self.parse_modificadores()
+
+                # Verificar el tipo de declaración basado en el siguiente token
+                if not cursor.fin():
+                    token_type = cursor.peek()
+                    lexema = cursor.lexema()
+
+                    # 1. Declaración de variable
+                    if token_type == Tipo.TIPO_DATO:
+                        instrucciones.append(self.parse_declaracion_variable(modificadores))
+
+                    # 2. Declaración de función
+                    elif token_type == Tipo.PALABRA_RESERVADA and lexema == Lexema.VOID:
+                        instrucciones.append((yield self._regla_funcion(modificadores)))
+
+                    # 3. Declaración de clase
+                    elif token_type == Tipo.PALABRA_RESERVADA and lexema == Lexema.CLASS:
+                        instrucciones.append((yield self._regla_clase(modificadores)))
+
+                    # 4. Sentencia if
+                    elif token_type == Tipo.CONDICIONAL and lexema == Lexema.IF:
+                        instrucciones.append((yield self._regla_if()))
+
+                    # 5. Sentencia while
+                    elif token_type == Tipo.BUCLE and lexema == Lexema.WHILE:
+                        instrucciones.append((yield self._regla_while()))
+
+                    # 6. Sentencia do-while
+                    elif token_type == Tipo.BUCLE and lexema == Lexema.DO:
+                        instrucciones.append((yield self._regla_do_while()))
+
+                    # 7. Sentencia for
+                    elif token_type == Tipo.BUCLE and lexema == Lexema.FOR:
+                        instrucciones.append((yield self._regla_for()))
+
+                    # 8. Sentencia try-catch
+                    elif token_type == Tipo.EXCEPCION and lexema == Lexema.TRY:
+                        instrucciones.append((yield self._regla_try_catch()))
+
+                    # 9. Sentencia switch
+                    elif token_type == Tipo.PALABRA_RESERVADA and lexema == Lexema.SWITCH:
+                        instrucciones.append((yield self._regla_switch()))
+
+                    elif token_type == Tipo.PALABRA_RESERVADA and lexema == Lexema.BREAK:
+                        instrucciones.append(self.parse_sentencia_break())
+
+                    # 10. Sentencia de impresión (System.out.print/println o token Imprimir)
+                    elif token_type == Tipo.IMPRIMIR or (token_type == Tipo.IDENTIFICADOR and lexema == Lexema.SYSTEM):
+                        instrucciones.append(self.parse_sentencia_print())
+
+                    # 11. Expresión o asignación (también ++i y --i)
+                    elif token_type == Tipo.IDENTIFICADOR or token_type == Tipo.OPERADOR_INCREMENTO:
+                        instrucciones.append(self.parse_expresion())
+                        self._delimitador(Lexema.PUNTO_Y_COMA, "Se esperaba ';' al final de la instrucción.")
+
+                    # 12. Delimitador (punto y coma)
+                    elif token_type == Tipo.DELIMITADOR and lexema == Lexema.PUNTO_Y_COMA:
+                        cursor.advance()  # Consumir ';' (instrucción vacía)
+
+                    # 13. Token inesperado
                     else:
-                        instrucciones.append(self.parse_expresion())  # Expresión
-                
-                # 12. Delimitador (punto y coma)
-                elif token_type == "Delimitador" and token_value == ";":
-                    self.eat("Delimitador")  # Consumir ';' (instrucción vacía)
-                
-                # 13. Token inesperado
-                else:
-                    raise SyntaxError(f"Token inesperado '{token_type}: {token_value}'")
-        
-        # Crear el nodo para el bloque de instrucciones
-        return ASTNode("Bloque", None, instrucciones)
-            
-    def parse(self):
-        """Inicia el análisis sintáctico"""
-        try:
-            self.ast = self.parse_instrucciones()
+                        raise SyntaxError(f"Token inesperado '{NOMBRES_TIPO[token_type]}: {cursor.valor()}'{self._ubicacion()}")
+            except SyntaxError as e:
+                if not self.recuperar:
+                    raise
+                del instrucciones[cantidad:]  # La instrucción pudo quedar agregada antes del error
+                instrucciones.append(self._recuperar(e, inicio))
 
-            print("AST Generado:", self.ast)
-            print("")
-            print(self.ast.hijos)
+            if len(instrucciones) > cantidad:
+                instrucciones[-1].posicion = self._posicion(inicio)
 
-            # Comprobamos si hemos procesado todos los tokens
-            if self.current_token_index < len(self.tokens):
-                raise SyntaxError(f"Token inesperado '{self.tokens[self.current_token_index][1]}' al final del código.")
+        # Crear el nodo para el bloque de instrucciones
+        return NodoBloque(instrucciones)
+
+    def _programa(self):
+        """Regla inicial: las instrucciones del programa hasta el último token."""
+        ast = self.parse_instrucciones()
+
+        # Comprobamos si hemos procesado todos los tokens
+        while not self.cursor.fin():
+            error = SyntaxError(f"Token inesperado '{self.cursor.valor()}' al final del código{self._ubicacion()}.")
+            if not self.recuperar:
+                raise error
+            # Un '}', 'case' o 'default' de más: se descarta y se sigue con lo que viene
+            inicio = self.cursor.indice
+            ast.instrucciones.append(self._recuperar(error, inicio))
+            ast.instrucciones[-1].posicion = self._posicion(inicio)
+            ast.instrucciones.extend(self.parse_instrucciones().instrucciones)
+        return ast
+
+    def parse(self, graficar=False):
+        """Inicia el análisis sintáctico; con graficar=True además guarda la imagen del árbol."""
+        try:
+            self.ast = self._programa()
 
-            
             # Graficamos el árbol después de generarlo
-            self.ast.graficar_mpl()
+            if graficar:
+                self.ast.graficar_mpl()
 
             return self.ast  # Retornar el árbol de sintaxis abstracta
 
         except SyntaxError as e:
+            self.errores.append(f"Error de sintaxis: {e}")
             print(f"Error de sintaxis: {e}")
         except Exception as e:
+            self.errores.append(f"Error inesperado: {e}")
             print(f"Error inesperado: {e}")
 
 
-"""
-
-VERIFICAR LOS ARCHIVOS DE PRUEBA 5 A PRUEBA 11:
+class ParserIncremental:
+    """Vuelve a analizar un programa después de cada edición reutilizando sus clases y funciones.
 
-- PARA COMPROBAR QUE ANALIZADOR SINTACTICO FUNCIONA
-- VER SI FALTA OTRAS ESTRUCTURAS PARA ANALIZAR
+    Cada clase y función del nivel superior se guarda con una clave que es el hash
+    del texto y los tipos de sus tokens. En el siguiente parse(), las que tienen la
+    misma clave se reutilizan (copiadas con sus posiciones corregidas si se movieron) y solo se
+    analizan las que cambiaron y las instrucciones sueltas entre ellas; el Bloque
+    resultante es el mismo que daría Parser.
 
-"""
+    Si el programa tiene errores se analiza completo con Parser, para que los
+    errores sean los mismos.
+    """
 
+    def __init__(self):
+        self.ast = None
+        self.errores = []
+        self.reutilizados = 0  # Clases y funciones reutilizadas en el último parse()
+        self.analizados = 0  # Clases y funciones analizadas en el último parse()
+        self._subarboles = {}  # clave -> (nodo, posición de su primer token)
+
+    def parse(self, tokens):
+        """Analiza los tokens (mejor un TokenBuffer) y retorna el AST, o None si hay errores."""
+        parser = Parser(tokens)
+        cursor = parser.cursor
+        self.reutilizados = self.analizados = 0
+        try:
+            unidades = self._unidades(cursor)
+            if unidades is None:
+                raise SyntaxError("Llaves sin balancear.")
+
+            hijos = []
+            nuevos = {}
+            anterior = 0
+            for inicio, fin in unidades:
+                hijos.extend(self._analizar_rango(parser, anterior, inicio))
+
+                clave = self._clave(tokens, cursor, inicio, fin)
+                posicion = cursor.posicion(inicio)
+                guardado = self._subarboles.get(clave)
+                if guardado is not None and clave not in nuevos:  # Dos unidades iguales no comparten nodo
+                    nodo, posicion_anterior = guardado
+                    if posicion_anterior != posicion:
+                        nodo = _desplazar_posiciones(nodo, posicion_anterior, posicion)
+                    self.reutilizados += 1
+                else:
+                    rango = self._analizar_rango(parser, inicio, fin)
+                    if len(rango) != 1:
+                        raise SyntaxError("La clase o función no es una sola instrucción.")
+                    nodo = rango[0]
+                    self.analizados += 1
+                nuevos[clave] = (nodo, posicion)
+                hijos.append(nodo)
+                anterior = fin
+            hijos.extend(self._analizar_rango(parser, anterior, cursor.total))
+        except Exception:
+            # Se repite el análisis completo para reportar los errores igual que Parser
+            parser = Parser(tokens)
+            self.ast = parser.parse(graficar=False)
+            self.errores = parser.errores
+            return self.ast
+
+        self._subarboles = nuevos
+        self.ast = NodoBloque(hijos)
+        self.errores = []
+        return self.ast
+
+    @staticmethod
+    def _unidades(cursor):
+        """Rangos [inicio, fin) de tokens de las clases y funciones del nivel superior.
+
+        Una unidad empieza en 'class' o 'void' a profundidad 0 (con los modificadores
+        que la preceden desde el fin de la instrucción anterior) y termina en la '}'
+        que vuelve a profundidad 0. Retorna None si las llaves no están balanceadas.
+        """
+        lexemas = cursor.lexemas
+        unidades = []
+        profundidad = 0
+        fin_instruccion = 0  # Índice siguiente al último ';' o '}' del nivel superior
+        inicio_unidad = None
+        for coincidencia in PATRON_ESTRUCTURA.finditer(lexemas.tobytes()):
+            indice = coincidencia.start()
+            lexema = lexemas[indice]
+            if lexema == Lexema.LLAVE_ABRE:
+                profundidad += 1
+            elif lexema == Lexema.LLAVE_CIERRA:
+                profundidad -= 1
+                if profundidad < 0:
+                    return None
+                if profundidad == 0:
+                    fin_instruccion = indice + 1
+                    if inicio_unidad is not None:
+                        unidades.append((inicio_unidad, fin_instruccion))
+                        inicio_unidad = None
+            elif profundidad == 0:
+                if lexema == Lexema.PUNTO_Y_COMA:
+                    fin_instruccion = indice + 1
+                    inicio_unidad = None
+                elif inicio_unidad is None and all(codigo in MODIFICADORES for codigo in lexemas[fin_instruccion:indice]):
+                    inicio_unidad = fin_instruccion
+        return unidades if profundidad == 0 else None
+
+    @staticmethod
+    def _clave(tokens, cursor, inicio, fin):
+        """Hash del rango de tokens: su texto (con espacios y comentarios) y sus tipos."""
+        if isinstance(tokens, TokenBuffer):
+            texto = tokens.codigo[tokens.inicios[inicio]:tokens.fines[fin - 1]]
+        else:
+            texto = repr([token[1] for token in tokens[inicio:fin]])
+        contenido = texto.encode("utf-8", "surrogatepass") + cursor.tipos[inicio:fin].tobytes()
+        return hashlib.sha1(contenido).digest()
+
+    @staticmethod
+    def _analizar_rango(parser, inicio, fin):
+        """Instrucciones de los tokens [inicio, fin), analizadas como si fueran todo el programa.
+
+        El token fin se reemplaza por el centinela FIN mientras se analiza, así las
+        reglas se detienen ahí igual que al final de los tokens.
+        """
+        cursor = parser.cursor
+        guardado = (cursor.tipos[fin], cursor.lexemas[fin], cursor.total)
+        cursor.tipos[fin] = FIN
+        cursor.lexemas[fin] = Lexema.OTRO
+        cursor.total = fin
+        cursor.indice = inicio
+        try:
+            bloque = parser.parse_instrucciones()
+            if cursor.indice != fin:
+                raise SyntaxError(f"Token inesperado '{cursor.valor()}' al final del código{cursor.ubicacion()}.")
+        finally:
+            cursor.tipos[fin], cursor.lexemas[fin], cursor.total = guardado
+        return bloque.instrucciones
+
+
+def _desplazar_posiciones(nodo, antes, despues):
+    """Copia de un subárbol cuyo primer token pasó de la posición antes a despues.
+
+    El texto del subárbol no cambió: todas sus líneas se desplazan igual y solo
+    los tokens de su primera línea cambian de columna. Se copian los nodos en lugar
+    de modificarlos porque los árboles anteriores (en cache_fases) los comparten.
+    """
+    linea_antes = antes[0]
+    delta_linea = despues[0] - antes[0]
+    delta_columna = despues[1] - antes[1]
+
+    def copiar(original):
+        if isinstance(original, ASTNode):
+            posicion = original.posicion
+            if posicion is not None:
+                linea, columna = posicion
+                if linea == linea_antes:
+                    columna += delta_columna
+                posicion = (linea + delta_linea, columna)
+            copia = object.__new__(type(original))
+            copia.posicion = posicion
+            pendientes.append((original, copia))
+            return copia
+        if isinstance(original, list):
+            copia = []
+            pendientes.append((original, copia))
+            return copia
+        return original
+
+    pendientes = []
+    raiz = copiar(nodo)
+    while pendientes:
+        original, copia = pendientes.pop()
+        if isinstance(original, list):
+            copia.extend(copiar(hijo) for hijo in original)
+        else:
+            for campo in original.campos:
+                setattr(copia, campo, copiar(getattr(original, campo)))
+    return raiz
 
 
+# Instancia compartida por las páginas: gui.py vuelve a crear Sintactico_page en
+# cada navegación y cada cambio de tamaño, así que el parser incremental no puede
+# vivir en la página o empezaría vacío cada vez
+parser_incremental = ParserIncremental()
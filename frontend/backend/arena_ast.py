@@ -0,0 +1,279 @@
+from array import array
+
+from .nodos_ast import (
+    ASTNode, NodoAsignacion, NodoBinaria, NodoBloque, NodoBreak, NodoCase, NodoClase, NodoDeclaracion,
+    NodoDefault, NodoDoWhile, NodoError, NodoFor, NodoFuncion, NodoIdentificador, NodoIf, NodoOperando,
+    NodoPrint, NodoSwitch, NodoTryCatch, NodoUnaria, NodoValor, NodoWhile,
+)
+
+# Clases de nodo que guarda la arena; el índice en esta tupla es el código de su clase
+CLASES_NODO = (
+    NodoBloque, NodoDeclaracion, NodoIf, NodoWhile, NodoDoWhile, NodoFor, NodoFuncion, NodoClase,
+    NodoTryCatch, NodoSwitch, NodoCase, NodoDefault, NodoBreak, NodoPrint, NodoError,
+    NodoAsignacion, NodoBinaria, NodoUnaria, NodoValor, NodoOperando, NodoIdentificador,
+)
+CODIGO_CLASE = {clase: codigo for codigo, clase in enumerate(CLASES_NODO)}
+
+# Códigos de los valores de los campos que no son nodos
+TEXTO = len(CLASES_NODO)  # Un string (nombre, tipo de dato, modificador, ...)
+NULO = TEXTO + 1  # Un campo en None
+LISTA = TEXTO + 2  # Una lista; sus elementos son los hijos
+TUPLA = TEXTO + 3  # Una tupla (los parámetros de una función); sus elementos son los hijos
+
+NOMBRES_TIPO_ARENA = tuple(clase.__name__ for clase in CLASES_NODO) + ("Texto", "Nulo", "Lista", "Tupla")
+
+# Campo de texto de cada clase que se guarda en la columna valor del nodo en lugar
+# de como hijo: las hojas de las expresiones ocupan una sola fila
+CAMPO_VALOR = {
+    NodoDeclaracion: "tipo_dato",
+    NodoFuncion: "tipo_retorno",
+    NodoPrint: "funcion",
+    NodoError: "mensaje",
+    NodoBinaria: "operador",
+    NodoUnaria: "operador",
+    NodoValor: "texto",
+    NodoOperando: "texto",
+    NodoIdentificador: "nombre",
+}
+
+# Campos de cada clase que son hijos en la arena, en orden
+CAMPOS_HIJO = tuple(
+    tuple(campo for campo in clase.campos if campo != CAMPO_VALOR.get(clase)) for clase in CLASES_NODO
+)
+
+SIN_NODO = -1
+
+
+class ArenaAST:
+    """Un AST guardado por columnas en arrays paralelos, un nodo por fila.
+
+    Las columnas son el tipo (código de la clase del nodo, o TEXTO, NULO, LISTA y
+    TUPLA para los valores de los campos que no son nodos), el valor (índice en
+    la tabla de strings, donde cada texto distinto aparece una sola vez), el
+    primer hijo, el siguiente hermano y la posición. Cada fila ocupa 21 bytes y la
+    arena entera son unos pocos objetos, así se pueden tener en memoria los
+    árboles de miles de archivos.
+
+    Los nodos están en preorden: el nodo 0 es la raíz, los hijos de un nodo van
+    después de él y su subárbol ocupa filas consecutivas. Los hijos de un nodo de
+    clase son sus campos (CAMPOS_HIJO) en orden. desde_arbol y a_arbol convierten
+    desde y hacia los nodos de nodos_ast; CursorArena recorre la arena sin crearlos.
+    """
+
+    __slots__ = ("tipos", "valores", "primeros_hijos", "siguientes", "lineas", "columnas", "textos", "_indice_textos")
+
+    def __init__(self):
+        self.tipos = array("B")
+        self.valores = array("i")  # Índice en textos; SIN_NODO si no tiene
+        self.primeros_hijos = array("i")
+        self.siguientes = array("i")
+        self.lineas = array("i")  # 0 si el nodo no tiene posición
+        self.columnas = array("i")
+        self.textos = []
+        self._indice_textos = {}
+
+    def texto(self, valor):
+        """Índice del string en la tabla de textos, agregándolo si no estaba."""
+        indice = self._indice_textos.get(valor)
+        if indice is None:
+            indice = self._indice_textos[valor] = len(self.textos)
+            self.textos.append(valor)
+        return indice
+
+    def agregar(self, tipo, valor=SIN_NODO, posicion=None):
+        """Agrega un nodo sin hijos al final de la arena y retorna su índice."""
+        self.tipos.append(tipo)
+        self.valores.append(valor)
+        self.primeros_hijos.append(SIN_NODO)
+        self.siguientes.append(SIN_NODO)
+        if posicion is None:
+            posicion = (0, 0)
+        self.lineas.append(posicion[0])
+        self.columnas.append(posicion[1])
+        return len(self.tipos) - 1
+
+    @classmethod
+    def desde_arbol(cls, raiz):
+        """Arena con el árbol de raiz (un ASTNode), en preorden."""
+        arena = cls()
+        ultimos_hijos = []  # Último hijo agregado de cada nodo, para enlazar el siguiente
+        pendientes = [(raiz, SIN_NODO)]
+        while pendientes:
+            valor, padre = pendientes.pop()
+
+            if isinstance(valor, ASTNode):
+                clase = type(valor)
+                codigo = CODIGO_CLASE[clase]
+                campo_valor = CAMPO_VALOR.get(clase)
+                texto = SIN_NODO
+                if campo_valor is not None and getattr(valor, campo_valor) is not None:
+                    texto = arena.texto(getattr(valor, campo_valor))
+                indice = arena.agregar(codigo, texto, valor.posicion)
+                hijos = [getattr(valor, campo) for campo in CAMPOS_HIJO[codigo]]
+            elif isinstance(valor, str):
+                indice = arena.agregar(TEXTO, arena.texto(valor))
+                hijos = ()
+            elif valor is None:
+                indice = arena.agregar(NULO)
+                hijos = ()
+            elif isinstance(valor, list):
+                indice = arena.agregar(LISTA)
+                hijos = valor
+            elif isinstance(valor, tuple):
+                indice = arena.agregar(TUPLA)
+                hijos = valor
+            else:
+                raise TypeError(f"La arena no puede guardar un valor de tipo {type(valor).__name__}.")
+
+            ultimos_hijos.append(SIN_NODO)
+            if padre != SIN_NODO:
+                anterior = ultimos_hijos[padre]
+                if anterior == SIN_NODO:
+                    arena.primeros_hijos[padre] = indice
+                else:
+                    arena.siguientes[anterior] = indice
+                ultimos_hijos[padre] = indice
+
+            # Invertidos: el primer hijo es el próximo en salir de la pila
+            pendientes.extend((hijo, indice) for hijo in reversed(hijos))
+        return arena
+
+    def a_arbol(self, indice=0):
+        """Árbol de nodos_ast del subárbol del nodo indice (por defecto, todo)."""
+        fin = self.fin_subarbol(indice)
+        tipos = self.tipos
+        valores = self.valores
+        textos = self.textos
+        objetos = [None] * (fin - indice)
+
+        # En preorden los hijos están después del padre: recorriendo hacia atrás,
+        # los hijos de cada nodo ya están construidos
+        for actual in range(fin - 1, indice - 1, -1):
+            tipo = tipos[actual]
+            hijos = [objetos[hijo - indice] for hijo in self.hijos(actual)]
+            if tipo == TEXTO:
+                objeto = textos[valores[actual]]
+            elif tipo == NULO:
+                objeto = None
+            elif tipo == LISTA:
+                objeto = hijos
+            elif tipo == TUPLA:
+                objeto = tuple(hijos)
+            else:
+                clase = CLASES_NODO[tipo]
+                objeto = object.__new__(clase)
+                for campo, hijo in zip(CAMPOS_HIJO[tipo], hijos):
+                    setattr(objeto, campo, hijo)
+                campo_valor = CAMPO_VALOR.get(clase)
+                if campo_valor is not None:
+                    setattr(objeto, campo_valor, textos[valores[actual]] if valores[actual] != SIN_NODO else None)
+                objeto.posicion = self.posicion(actual)
+            objetos[actual - indice] = objeto
+        return objetos[0]
+
+    def hijos(self, indice):
+        """Índices de los hijos del nodo, en orden."""
+        hijo = self.primeros_hijos[indice]
+        while hijo != SIN_NODO:
+            yield hijo
+            hijo = self.siguientes[hijo]
+
+    def fin_subarbol(self, indice):
+        """Índice siguiente al último nodo del subárbol de indice."""
+        # El último nodo del subárbol es el que se alcanza bajando siempre por el último hijo
+        while self.primeros_hijos[indice] != SIN_NODO:
+            indice = self.primeros_hijos[indice]
+            while self.siguientes[indice] != SIN_NODO:
+                indice = self.siguientes[indice]
+        return indice + 1
+
+    def tipo(self, indice):
+        """Nombre del tipo del nodo: el de su clase (NodoIf, ...) o Texto, Nulo, Lista o Tupla."""
+        return NOMBRES_TIPO_ARENA[self.tipos[indice]]
+
+    def valor(self, indice):
+        """Texto del nodo (el de CAMPO_VALOR o el de un nodo Texto); None si no tiene."""
+        valor = self.valores[indice]
+        return self.textos[valor] if valor != SIN_NODO else None
+
+    def posicion(self, indice):
+        """(línea, columna) del nodo; None si no la tiene."""
+        linea = self.lineas[indice]
+        return (linea, self.columnas[indice]) if linea else None
+
+    def cursor(self, indice=0):
+        return CursorArena(self, indice)
+
+    def tamano_bytes(self):
+        """Bytes aproximados que ocupan las columnas y la tabla de textos."""
+        columnas = (self.tipos, self.valores, self.primeros_hijos, self.siguientes, self.lineas, self.columnas)
+        return sum(columna.itemsize * len(columna) for columna in columnas) + sum(len(texto) for texto in self.textos)
+
+    def __len__(self):
+        return len(self.tipos)
+
+
+class CursorArena:
+    """Recorre una ArenaAST moviéndose entre índices, sin crear nodos.
+
+    Se mueve con ir_primer_hijo, ir_siguiente_hermano e ir_padre (cada uno retorna
+    False si no hay a dónde ir) y lee el nodo actual con tipo, valor, posicion y
+    campo, el nombre del campo del padre donde está el nodo.
+    """
+
+    __slots__ = ("arena", "indice", "_padres")
+
+    def __init__(self, arena, indice=0):
+        self.arena = arena
+        self.indice = indice
+        self._padres = []  # (índice del padre, posición del nodo entre sus hijos)
+
+    @property
+    def tipo(self):
+        return self.arena.tipo(self.indice)
+
+    @property
+    def valor(self):
+        return self.arena.valor(self.indice)
+
+    @property
+    def posicion(self):
+        return self.arena.posicion(self.indice)
+
+    @property
+    def campo(self):
+        """Campo del padre que contiene al nodo; None en la raíz y en los elementos de listas y tuplas."""
+        if not self._padres:
+            return None
+        padre, orden = self._padres[-1]
+        tipo_padre = self.arena.tipos[padre]
+        if tipo_padre >= TEXTO:
+            return None
+        return CAMPOS_HIJO[tipo_padre][orden]
+
+    @property
+    def profundidad(self):
+        return len(self._padres)
+
+    def ir_primer_hijo(self):
+        hijo = self.arena.primeros_hijos[self.indice]
+        if hijo == SIN_NODO:
+            return False
+        self._padres.append((self.indice, 0))
+        self.indice = hijo
+        return True
+
+    def ir_siguiente_hermano(self):
+        siguiente = self.arena.siguientes[self.indice]
+        if siguiente == SIN_NODO or not self._padres:
+            return False
+        padre, orden = self._padres[-1]
+        self._padres[-1] = (padre, orden + 1)
+        self.indice = siguiente
+        return True
+
+    def ir_padre(self):
+        if not self._padres:
+            return False
+        self.indice = self._padres.pop()[0]
+        return True
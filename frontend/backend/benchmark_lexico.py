@@ -0,0 +1,297 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from .analizador_lexico import VERSION_LEXICO, iter_tokens, lexer, lexer_compacto, lexer_mmap
+
+# Archivo por defecto para la línea base de resultados. Está en el repositorio;
+# cuando cambian los patrones del lexer (VERSION_LEXICO) o la máquina de
+# referencia se regenera desde frontend/ con:
+#     python -m backend.benchmark_lexico --guardar
+RUTA_LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base_lexico.json")
+
+# Pérdida de rendimiento (tokens/s) aceptada respecto de la línea base
+TOLERANCIA = 0.25
+
+# Para la prueba de linealidad: el tiempo por MB del caso más lento no puede
+# superar en más de este factor al del caso más rápido
+FACTOR_LINEALIDAD = 3.0
+
+# Funciones de análisis que se miden
+MOTORES_BENCHMARK = {
+    "maestro": lambda codigo: lexer(codigo, motor="maestro"),
+    "secuencial": lambda codigo: lexer(codigo, motor="secuencial"),
+    "compacto": lexer_compacto,
+}
+
+_NOMBRES = ["contador", "total", "i", "j", "valor", "resultado", "suma", "indice", "dato", "temp"]
+_TIPOS = ["int", "double", "float", "boolean", "String", "char", "long"]
+_OPERADORES = ["+", "-", "*", "/", "%", "==", "!=", "<", ">", "<=", ">=", "&&", "||", "&", "|", "^", "<<", ">>"]
+_PALABRAS = ["public", "private", "static", "final", "if", "else", "while", "for", "return", "new", "try", "catch"]
+
+
+def _linea_comentarios(azar):
+    if azar.random() < 0.5:
+        return f"{azar.choice(_NOMBRES)}++; // " + " ".join(azar.choices(_NOMBRES, k=8))
+    return "/* " + " ".join(azar.choices(_NOMBRES, k=6)) + "\n   " + " ".join(azar.choices(_NOMBRES, k=6)) + " */"
+
+
+def _linea_strings(azar):
+    texto = " ".join(azar.choices(_NOMBRES, k=5))
+    return f'String {azar.choice(_NOMBRES)} = "{texto} \\"{azar.choice(_NOMBRES)}\\"" + "{texto}";'
+
+
+def _linea_operadores(azar):
+    partes = [azar.choice(_NOMBRES)]
+    for _ in range(8):
+        partes.append(azar.choice(_OPERADORES))
+        partes.append(azar.choice(_NOMBRES + ["1", "2.5", "3e10"]))
+    return f"{azar.choice(_NOMBRES)} = {' '.join(partes)};"
+
+
+def _linea_palabras_clave(azar):
+    return " ".join(azar.choices(_PALABRAS + _TIPOS, k=6)) + f" {azar.choice(_NOMBRES)}() {{ }}"
+
+
+def _linea_mixta(azar):
+    return azar.choice([_linea_comentarios, _linea_strings, _linea_operadores, _linea_palabras_clave])(azar)
+
+
+# Generadores de una línea de Java para cada mezcla de tokens
+MEZCLAS = {
+    "comentarios": _linea_comentarios,
+    "strings": _linea_strings,
+    "operadores": _linea_operadores,
+    "palabras_clave": _linea_palabras_clave,
+    "mixta": _linea_mixta,
+}
+
+
+def generar_corpus(lineas=1000, mezcla="mixta", semilla=0):
+    """Genera código Java sintético (no necesariamente válido) con la mezcla de tokens pedida."""
+    azar = random.Random(semilla)
+    generar_linea = MEZCLAS[mezcla]
+    cuerpo = ["    " + generar_linea(azar) for _ in range(lineas)]
+    return "public class Benchmark {\n" + "\n".join(cuerpo) + "\n}\n"
+
+
+# Entradas patológicas para la prueba de linealidad: cada una repite un fragmento
+# hasta el tamaño pedido. Sin los tokens ERROR de comentario y string sin cerrar,
+# cada "/*" o comilla volvía a recorrer el resto del código. Los fragmentos no
+# pueden cerrar lo que abren: "/*" repetido forma "/*/" y '"\\"' repetido forma
+# strings completos, que el lexer anterior ya analizaba en tiempo lineal.
+ENTRADAS_PATOLOGICAS = {
+    "comentarios_sin_cerrar": "/* ",  # Un solo comentario que nunca termina
+    "strings_sin_cerrar": '\\"',  # Cada comilla está escapada: el string nunca termina
+    "comillas_y_comentarios": 'x = "/*',
+    "identificador_gigante": "a",
+    "numero_gigante": "1",
+    "operadores": "a+=b<<=c>>>=d&&!e||f;\n",
+}
+
+
+def generar_patologico(caso, megabytes):
+    fragmento = ENTRADAS_PATOLOGICAS[caso]
+    repeticiones = int(megabytes * 1024 * 1024) // len(fragmento)
+    return fragmento * repeticiones
+
+
+@contextlib.contextmanager
+def _archivo_temporal(codigo):
+    """Escribe el código en un archivo temporal y da su ruta; lo borra al salir."""
+    descriptor, ruta = tempfile.mkstemp(suffix=".java")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8", newline="") as archivo:
+            archivo.write(codigo)
+        yield ruta
+    finally:
+        os.remove(ruta)
+
+
+def _consumir(tokens):
+    for _ in tokens:
+        pass
+
+
+def _analizar_mmap(ruta):
+    with lexer_mmap(ruta):
+        pass
+
+
+# Caminos de entrada que se verifican en la prueba de linealidad: cada uno es
+# (preparar, analizar), donde preparar(codigo) es un context manager que da la
+# fuente que recibe analizar. Solo se mide analizar, no escribir el archivo.
+MOTORES_LINEALIDAD = {
+    "compacto": (contextlib.nullcontext, lexer_compacto),
+    "archivo": (lambda codigo: contextlib.nullcontext(io.StringIO(codigo)), lambda archivo: _consumir(iter_tokens(archivo))),
+    "mmap": (_archivo_temporal, _analizar_mmap),
+}
+
+
+def verificar_linealidad(tamanos_mb=(1, 2, 5, 10), casos=None, motores=None, factor=FACTOR_LINEALIDAD):
+    """Mide el tiempo de análisis de cada entrada patológica en varios tamaños.
+
+    Cada entrada se analiza con cada motor de MOTORES_LINEALIDAD: un str, un
+    archivo abierto leído por bloques y un mmap del archivo. Retorna un
+    diccionario 'motor/caso' -> {"segundos_por_mb": {tamaño: s/MB}, "lineal": bool};
+    un caso es lineal si sus segundos por MB no varían más que el factor indicado.
+    """
+    resultados = {}
+    for motor in motores or MOTORES_LINEALIDAD:
+        preparar, analizar = MOTORES_LINEALIDAD[motor]
+        for caso in casos or ENTRADAS_PATOLOGICAS:
+            por_mb = {}
+            for tamano in tamanos_mb:
+                codigo = generar_patologico(caso, tamano)
+                with preparar(codigo) as fuente:
+                    inicio = time.perf_counter()
+                    analizar(fuente)
+                    por_mb[tamano] = (time.perf_counter() - inicio) / tamano
+                del codigo
+            # Tiempos muy cortos se comparan contra un mínimo para no amplificar el ruido
+            menor = max(min(por_mb.values()), 0.01)
+            resultados[f"{motor}/{caso}"] = {"segundos_por_mb": por_mb, "lineal": max(por_mb.values()) <= menor * factor}
+    return resultados
+
+
+def medir(codigo, funcion, repeticiones=3):
+    """Mide una función de análisis léxico sobre el código.
+
+    Retorna tokens, el mejor tiempo de las repeticiones, tokens/s, MB/s, el pico de
+    memoria asignada durante el análisis y los bloques de memoria que siguen vivos
+    en el resultado.
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        tokens = funcion(codigo)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    del tokens
+
+    # Memoria medida aparte, porque tracemalloc hace más lento el análisis
+    bloques_antes = sys.getallocatedblocks()
+    tracemalloc.start()
+    tokens = funcion(codigo)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    bloques = sys.getallocatedblocks() - bloques_antes
+
+    megabytes = len(codigo.encode("utf-8")) / (1024 * 1024)
+    return {
+        "tokens": len(tokens),
+        "segundos": mejor,
+        "tokens_por_segundo": len(tokens) / mejor if mejor else 0.0,
+        "mb_por_segundo": megabytes / mejor if mejor else 0.0,
+        "memoria_pico_kb": pico / 1024,
+        "bloques_retenidos": bloques,
+    }
+
+
+def ejecutar(lineas=2000, mezclas=None, motores=None, repeticiones=3):
+    """Mide cada motor con cada mezcla; las claves del resultado son 'mezcla/motor'."""
+    resultados = {}
+    for mezcla in mezclas or MEZCLAS:
+        codigo = generar_corpus(lineas, mezcla)
+        for motor in motores or MOTORES_BENCHMARK:
+            resultados[f"{mezcla}/{motor}"] = medir(codigo, MOTORES_BENCHMARK[motor], repeticiones)
+    return resultados
+
+
+def guardar_linea_base(resultados, lineas, ruta=RUTA_LINEA_BASE):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({"version_lexico": VERSION_LEXICO, "lineas": lineas, "resultados": resultados}, archivo, indent=2, sort_keys=True)
+
+
+def cargar_linea_base(ruta=RUTA_LINEA_BASE):
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def comparar(resultados, linea_base, tolerancia=TOLERANCIA):
+    """Retorna la lista de regresiones respecto de la línea base.
+
+    Es regresión una caída de tokens/s mayor que la tolerancia, o un cambio en la
+    cantidad de tokens (los patrones ya no reconocen lo mismo). Si la línea base
+    es de otra VERSION_LEXICO también se informa, para saber que las
+    diferencias pueden venir de los patrones y no del rendimiento.
+    """
+    regresiones = []
+    version_base = linea_base.get("version_lexico")
+    if version_base != VERSION_LEXICO:
+        regresiones.append(f"version_lexico: {VERSION_LEXICO}, la línea base se generó con {version_base}")
+    for clave, actual in resultados.items():
+        base = linea_base["resultados"].get(clave)
+        if base is None:
+            continue
+        if actual["tokens"] != base["tokens"]:
+            regresiones.append(f"{clave}: {actual['tokens']} tokens, la línea base tenía {base['tokens']}")
+        caida = 1 - actual["tokens_por_segundo"] / base["tokens_por_segundo"]
+        if caida > tolerancia:
+            regresiones.append(
+                f"{clave}: {actual['tokens_por_segundo']:.0f} tokens/s, "
+                f"{caida:.0%} menos que la línea base ({base['tokens_por_segundo']:.0f})"
+            )
+    return regresiones
+
+
+def imprimir(resultados):
+    print(f"{'Caso':<28} {'Tokens':>9} {'Tokens/s':>12} {'MB/s':>8} {'Pico KB':>10} {'Bloques':>9}")
+    for clave, r in resultados.items():
+        print(
+            f"{clave:<28} {r['tokens']:>9} {r['tokens_por_segundo']:>12.0f} {r['mb_por_segundo']:>8.2f} "
+            f"{r['memoria_pico_kb']:>10.0f} {r['bloques_retenidos']:>9}"
+        )
+
+
+def imprimir_linealidad(resultados):
+    for caso, r in resultados.items():
+        tiempos = "  ".join(f"{tamano} MB: {segundos:.3f} s/MB" for tamano, segundos in r["segundos_por_mb"].items())
+        print(f"{caso:<34} {tiempos}  {'lineal' if r['lineal'] else 'NO LINEAL'}")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark del analizador léxico con código Java sintético.")
+    parser.add_argument("--lineas", type=int, default=2000, help="líneas de cada corpus generado")
+    parser.add_argument("--mezcla", action="append", choices=sorted(MEZCLAS), help="mezcla a medir (por defecto, todas)")
+    parser.add_argument("--motor", action="append", choices=sorted(MOTORES_BENCHMARK), help="motor a medir (por defecto, todos)")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--guardar", nargs="?", const=RUTA_LINEA_BASE, help="guardar los resultados como línea base JSON")
+    parser.add_argument("--comparar", nargs="?", const=RUTA_LINEA_BASE, help="comparar con una línea base JSON")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA)
+    parser.add_argument("--linealidad", nargs="*", type=float, metavar="MB",
+                        help="solo verificar que el tiempo crece linealmente con entradas patológicas (por defecto 1 2 5 10 MB)")
+    parser.add_argument("--motor-linealidad", action="append", choices=sorted(MOTORES_LINEALIDAD),
+                        help="camino de entrada a verificar con --linealidad (por defecto, todos)")
+    opciones = parser.parse_args(argumentos)
+
+    if opciones.linealidad is not None:
+        resultados = verificar_linealidad(opciones.linealidad or (1, 2, 5, 10), motores=opciones.motor_linealidad)
+        imprimir_linealidad(resultados)
+        return 0 if all(r["lineal"] for r in resultados.values()) else 1
+
+    resultados = ejecutar(opciones.lineas, opciones.mezcla, opciones.motor, opciones.repeticiones)
+    imprimir(resultados)
+
+    if opciones.guardar:
+        guardar_linea_base(resultados, opciones.lineas, opciones.guardar)
+        print(f"Línea base guardada en {opciones.guardar}")
+
+    if opciones.comparar:
+        regresiones = comparar(resultados, cargar_linea_base(opciones.comparar), opciones.tolerancia)
+        for regresion in regresiones:
+            print(f"REGRESIÓN {regresion}")
+        if regresiones:
+            return 1
+        print("Sin regresiones respecto de la línea base.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
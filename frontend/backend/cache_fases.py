@@ -0,0 +1,63 @@
+import hashlib
+from collections import OrderedDict
+
+from .analizador_lexico import VERSION_LEXICO, lexer_compacto
+
+
+class CacheFases:
+    """Cache LRU en memoria de los resultados del análisis léxico y sintáctico.
+
+    Las claves combinan un hash del código fuente con la versión del lexer (y de
+    la gramática para los árboles), así un código que no cambió nunca se vuelve a
+    analizar. Cuando hay más de max_entradas se descarta la usada hace más tiempo.
+    """
+
+    def __init__(self, max_entradas=32):
+        self.max_entradas = max_entradas
+        self._entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    @staticmethod
+    def hash_codigo(codigo):
+        return hashlib.sha256(codigo.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def tokens(self, codigo, calcular=None):
+        """TokenBuffer del código; calcular() lo produce si no está en cache."""
+        clave = ("tokens", VERSION_LEXICO, self.hash_codigo(codigo))
+        return self._obtener(clave, calcular or (lambda: lexer_compacto(codigo)))
+
+    def ast(self, codigo, tokens=None, calcular=None):
+        """AST del código (None si tiene errores de sintaxis); calcular() lo produce si no está en cache."""
+        # Import diferido: el parser es más pesado de importar que el lexer
+        from .analizador_sintactico import VERSION_GRAMATICA, Parser
+
+        if calcular is None:
+            def calcular():
+                return Parser(tokens if tokens is not None else self.tokens(codigo)).parse(graficar=False)
+
+        clave = ("ast", VERSION_LEXICO, VERSION_GRAMATICA, self.hash_codigo(codigo))
+        return self._obtener(clave, calcular)
+
+    def _obtener(self, clave, calcular):
+        if clave in self._entradas:
+            self.aciertos += 1
+            self._entradas.move_to_end(clave)
+            return self._entradas[clave]
+
+        self.fallos += 1
+        valor = calcular()
+        self._entradas[clave] = valor
+        while len(self._entradas) > self.max_entradas:
+            self._entradas.popitem(last=False)
+        return valor
+
+    def limpiar(self):
+        self._entradas.clear()
+
+    def __len__(self):
+        return len(self._entradas)
+
+
+# Instancia compartida por las páginas y las herramientas de línea de comandos
+cache_fases = CacheFases()
@@ -0,0 +1,192 @@
+from array import array
+from types import MappingProxyType
+
+from .analizador_lexico import NOMBRES_TIPO, TIPO_POR_NOMBRE, TipoToken, TokenBuffer
+
+# Tipo del centinela que sigue al último token: consultar el final no necesita
+# comparar el índice con la cantidad de tokens.
+FIN = 255
+
+
+# Los mismos valores de TipoToken como int simples: leer un miembro de un IntEnum
+# (TipoToken.DELIMITADOR) cuesta varias veces más que un atributo de clase común,
+# y el parser lo hace en cada comparación.
+class Tipo:
+    pass
+
+for _miembro in TipoToken:
+    setattr(Tipo, _miembro.name, int(_miembro))
+del _miembro
+
+
+# Lexemas fijos que el parser compara, como enteros. Los identificadores, números
+# y strings no tienen un código propio y quedan como OTRO.
+class Lexema:
+    OTRO = 0
+    PAREN_ABRE = 1
+    PAREN_CIERRA = 2
+    LLAVE_ABRE = 3
+    LLAVE_CIERRA = 4
+    PUNTO_Y_COMA = 5
+    COMA = 6
+    DOS_PUNTOS = 7
+    IF = 8
+    ELSE = 9
+    WHILE = 10
+    DO = 11
+    FOR = 12
+    TRY = 13
+    CATCH = 14
+    CLASS = 15
+    VOID = 16
+    SWITCH = 17
+    CASE = 18
+    DEFAULT = 19
+    BREAK = 20
+    PUBLIC = 21
+    PRIVATE = 22
+    PROTECTED = 23
+    STATIC = 24
+    FINAL = 25
+    ABSTRACT = 26
+    SYSTEM = 27
+    MAS = 28
+    INCREMENTO = 29
+    DECREMENTO = 30
+    MENOS = 31
+    POR = 32
+    DIVIDIDO = 33
+    MODULO = 34
+    O_LOGICO = 35
+    Y_LOGICO = 36
+    NO = 37
+    O_BITS = 38
+    XOR = 39
+    Y_BITS = 40
+    NO_BITS = 41
+    IGUAL = 42
+    DISTINTO = 43
+    MENOR = 44
+    MAYOR = 45
+    MENOR_IGUAL = 46
+    MAYOR_IGUAL = 47
+    DESPLAZAR_IZQ = 48
+    DESPLAZAR_DER = 49
+    DESPLAZAR_DER_SIN_SIGNO = 50
+    ASIGNAR = 51
+    MAS_ASIGNAR = 52
+    MENOS_ASIGNAR = 53
+    POR_ASIGNAR = 54
+    DIVIDIDO_ASIGNAR = 55
+    MODULO_ASIGNAR = 56
+    Y_BITS_ASIGNAR = 57
+    O_BITS_ASIGNAR = 58
+    XOR_ASIGNAR = 59
+    DESPLAZAR_IZQ_ASIGNAR = 60
+    DESPLAZAR_DER_ASIGNAR = 61
+    DESPLAZAR_DER_SIN_SIGNO_ASIGNAR = 62
+
+
+# Texto de cada lexema, en el orden de sus códigos
+TEXTO_LEXEMA = (
+    None, "(", ")", "{", "}", ";", ",", ":",
+    "if", "else", "while", "do", "for", "try", "catch", "class", "void",
+    "switch", "case", "default", "break",
+    "public", "private", "protected", "static", "final", "abstract",
+    "System", "+", "++", "--",
+    "-", "*", "/", "%", "||", "&&", "!", "|", "^", "&", "~",
+    "==", "!=", "<", ">", "<=", ">=", "<<", ">>", ">>>",
+    "=", "+=", "-=", "*=", "/=", "%=", "&=", "|=", "^=", "<<=", ">>=", ">>>=",
+)
+LEXEMA_POR_TEXTO = MappingProxyType({texto: i for i, texto in enumerate(TEXTO_LEXEMA) if texto is not None})
+
+
+class CursorTokens:
+    """Recorre los tokens del parser comparando enteros en lugar de tuplas de strings.
+
+    Al crearlo se calculan dos arrays paralelos a los tokens: el tipo (Tipo) y
+    el lexema (Lexema) de cada uno, más un centinela FIN al final. peek, check,
+    expect y advance solo leen esos arrays; el texto y la posición de un token se
+    obtienen de los tokens originales cuando se piden.
+    """
+
+    __slots__ = ("tokens", "tipos", "lexemas", "indice", "total")
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.total = len(tokens)
+        if isinstance(tokens, TokenBuffer):
+            self.tipos = array("B", tokens.tipos)
+            valores = (tokens.valor(i) for i in range(self.total))
+        else:
+            self.tipos = array("B", (TIPO_POR_NOMBRE[token[0]] for token in tokens))
+            valores = (token[1] for token in tokens)
+        codigo = LEXEMA_POR_TEXTO.get
+        self.lexemas = array("B", (codigo(valor, 0) for valor in valores))
+        self.tipos.append(FIN)
+        self.lexemas.append(Lexema.OTRO)
+        self.indice = 0
+
+    def fin(self):
+        """True si ya no quedan tokens."""
+        return self.indice >= self.total
+
+    def peek(self, desplazamiento=0):
+        """Tipo del token actual (o del que está desplazamiento tokens después); FIN al terminar."""
+        indice = self.indice + desplazamiento
+        return self.tipos[indice] if indice < self.total else FIN
+
+    def lexema(self, desplazamiento=0):
+        """Lexema del token actual como Lexema; OTRO si no es un lexema fijo."""
+        indice = self.indice + desplazamiento
+        return self.lexemas[indice] if indice < self.total else Lexema.OTRO
+
+    def valor(self, desplazamiento=0):
+        """Texto del token actual; None al terminar."""
+        indice = self.indice + desplazamiento
+        return self.tokens[indice][1] if indice < self.total else None
+
+    def check(self, tipo, lexema=None):
+        """True si el token actual es del tipo (y lexema, si se indica) pedido."""
+        indice = self.indice
+        return self.tipos[indice] == tipo and (lexema is None or self.lexemas[indice] == lexema)
+
+    def advance(self):
+        """Consume el token actual y retorna su texto."""
+        indice = self.indice
+        self.indice = indice + 1
+        return self.tokens[indice][1]
+
+    def expect(self, tipo, lexema=None, mensaje=None):
+        """Consume el token actual si es del tipo (y lexema) pedido; si no, lanza SyntaxError.
+
+        Sin mensaje se usa el de Parser.eat, con la ubicación del token.
+        """
+        indice = self.indice
+        if self.tipos[indice] == tipo and (lexema is None or self.lexemas[indice] == lexema):
+            self.indice = indice + 1
+            return self.tokens[indice][1]
+        if mensaje is not None:
+            raise SyntaxError(mensaje)
+        if indice >= self.total:
+            raise SyntaxError(f"Error: Se esperaba '{NOMBRES_TIPO[tipo]}' pero no hay más tokens.")
+        raise SyntaxError(f"Error: Se esperaba '{NOMBRES_TIPO[tipo]}' pero se encontró '{self.tokens[indice][1]}'{self.ubicacion()}")
+
+    def posicion(self, indice=None):
+        """(línea, columna) del token indicado o del actual; None si no existe.
+
+        Con un TokenBuffer la posición se resuelve con su IndiceLineas en este momento.
+        """
+        if indice is None:
+            indice = self.indice
+        if indice >= self.total:
+            return None
+        token = self.tokens[indice]
+        return token[2], token[3]
+
+    def ubicacion(self, indice=None):
+        """Texto ' (línea L, columna C)' para los mensajes de error."""
+        posicion = self.posicion(indice)
+        if posicion is None:
+            return ""
+        return f" (línea {posicion[0]}, columna {posicion[1]})"
@@ -0,0 +1,102 @@
+import argparse
+import json
+import sys
+
+from .analizador_lexico import lexer_mmap
+from .analizador_sintactico import Parser
+from .nodos_ast import etiqueta_nodo
+
+# Exportadores del AST sin graficarlo: recorren el árbol una vez con
+# ASTNode.recorrer y escriben cada nodo en el archivo apenas lo visitan, así la
+# memoria depende de la profundidad del árbol y no de su tamaño. Los ids y las
+# etiquetas son los mismos que usa graficar.
+
+
+def _texto_dot(texto):
+    """texto como string de DOT entre comillas."""
+    return '"' + texto.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+
+def exportar_dot(raiz, archivo):
+    """Escribe el árbol en archivo como un digraph de Graphviz."""
+    archivo.write("digraph AST {\n    node [shape=box, fontname=\"Helvetica\"];\n")
+    for nodo_id, padre_id, _, tipo, valor, _ in raiz.recorrer():
+        archivo.write(f"    n{nodo_id} [label={_texto_dot(etiqueta_nodo(tipo, valor))}];\n")
+        if padre_id is not None:
+            archivo.write(f"    n{padre_id} -> n{nodo_id};\n")
+    archivo.write("}\n")
+
+
+def exportar_jsonl(raiz, archivo):
+    """Escribe el árbol en archivo con un objeto JSON por línea y por nodo, en preorden.
+
+    Cada objeto tiene id, padre (null en la raíz), nivel, tipo, valor (como texto,
+    null si no tiene) y posicion ([línea, columna] o null).
+    """
+    for nodo_id, padre_id, nivel, tipo, valor, posicion in raiz.recorrer():
+        nodo = {
+            "id": nodo_id,
+            "padre": padre_id,
+            "nivel": nivel,
+            "tipo": tipo,
+            "valor": str(valor) if valor is not None else None,
+            "posicion": posicion,
+        }
+        archivo.write(json.dumps(nodo, ensure_ascii=False) + "\n")
+
+
+def _texto_adyacencia(texto):
+    return texto.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+
+def exportar_adyacencia(raiz, archivo):
+    """Escribe el árbol en archivo con una línea 'id<TAB>padre<TAB>etiqueta' por nodo.
+
+    El padre de la raíz es -1. Las tabulaciones y saltos de línea de las
+    etiquetas se escapan, así cada línea es un nodo y el formato se puede comparar
+    con diff.
+    """
+    for nodo_id, padre_id, _, tipo, valor, _ in raiz.recorrer():
+        padre = padre_id if padre_id is not None else -1
+        archivo.write(f"{nodo_id}\t{padre}\t{_texto_adyacencia(etiqueta_nodo(tipo, valor))}\n")
+
+
+FORMATOS = {
+    "dot": exportar_dot,
+    "jsonl": exportar_jsonl,
+    "adyacencia": exportar_adyacencia,
+}
+
+
+def exportar(raiz, archivo, formato="dot"):
+    """Escribe el árbol de raiz en archivo (un archivo de texto abierto) en uno de los FORMATOS."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de exportación desconocido: {formato}. Los formatos son {', '.join(FORMATOS)}.")
+    FORMATOS[formato](raiz, archivo)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Exporta el AST de un archivo Java a DOT, JSON Lines o una lista de adyacencia.")
+    parser.add_argument("ruta", help="archivo .java")
+    parser.add_argument("-f", "--formato", choices=FORMATOS, default="dot", help="formato de salida (por defecto, dot)")
+    parser.add_argument("-o", "--salida", default=None, help="archivo de salida (por defecto, la salida estándar)")
+    opciones = parser.parse_args(argumentos)
+
+    with lexer_mmap(opciones.ruta) as tokens:
+        analizador = Parser(tokens, recuperar=True)
+        ast = analizador.parse(graficar=False)
+    for error in analizador.errores:
+        print(error, file=sys.stderr)
+    if ast is None:
+        return 1
+
+    if opciones.salida is None:
+        exportar(ast, sys.stdout, opciones.formato)
+    else:
+        with open(opciones.salida, "w", encoding="utf-8") as archivo:
+            exportar(ast, archivo, opciones.formato)
+    return 1 if analizador.errores else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
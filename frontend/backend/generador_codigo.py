@@ -1,3 +1,10 @@
+from .nodos_ast import (
+    ASTNode, NodoAsignacion, NodoBinaria, NodoBloque, NodoClase, NodoDeclaracion, NodoDoWhile, NodoFor,
+    NodoFuncion, NodoIdentificador, NodoIf, NodoOperando, NodoSwitch, NodoTryCatch, NodoUnaria, NodoValor,
+    NodoWhile,
+)
+
+
 class CodeGenerator:
     def __init__(self):
         self.code = []
@@ -31,48 +38,22 @@ class CodeGenerator:
         if node is None:
             return
         
-        # Process node based on its type
-        if node.tipo == "Bloque":
-            self._generate_block(node)
-        elif node.tipo == "Declaracion":
-            self._generate_declaration(node)
-        elif node.tipo == "Asignacion":
-            self._generate_assignment(node)
-        elif node.tipo == "Expresion":
-            return self._generate_expression(node)
-        elif node.tipo == "If" or node.tipo == "IfElse":
-            self._generate_if_statement(node)
-        elif node.tipo == "While":
-            self._generate_while_statement(node)
-        elif node.tipo == "DoWhile":
-            self._generate_do_while_statement(node)
-        elif node.tipo == "For":
-            self._generate_for_statement(node)
-        elif node.tipo == "Funcion":
-            self._generate_function(node)
-        elif node.tipo == "Clase":
-            self._generate_class(node)
-        elif node.tipo == "TryCatch":
-            self._generate_try_catch(node)
-        elif node.tipo == "Switch":
-            self._generate_switch(node)
-        elif node.tipo == "Identificador":
-            return node.valor
-        elif node.tipo == "Operando":
-            return node.valor
-        else:
-            # Process children for other node types
-            if isinstance(node.hijos, list):
-                for hijo in node.hijos:
-                    if hijo is not None:
-                        self._generate_node(hijo)
+        # Process node based on its class
+        handler = self._handlers.get(type(node))
+        if handler is not None:
+            return handler(self, node)
+        
+        # Process children for other node types
+        for hijo in node.hijos:
+            if isinstance(hijo, ASTNode):
+                self._generate_node(hijo)
 
     def _generate_block(self, node):
         """Generate code for a block of statements."""
         self.indentation += 1
         
-        for hijo in node.hijos:
-            self._generate_node(hijo)
+        for instruccion in node.instrucciones:
+            self._generate_node(instruccion)
         
         self.indentation -= 1
         
@@ -82,24 +63,12 @@ class CodeGenerator:
 
     def _generate_declaration(self, node):
         """Generate code for a variable declaration."""
-        tipo_dato = node.valor
-        
-        # Extract information from the declaration
-        modificadores = []
-        identificador = None
-        valor_inicial = None
-        
-        for hijo in node.hijos:
-            if isinstance(hijo, list) and all(isinstance(item, str) for item in hijo):
-                modificadores = hijo
-            elif hijo is not None and hasattr(hijo, 'tipo') and hijo.tipo == "Identificador":
-                identificador = hijo.valor
-            elif hijo is not None and hasattr(hijo, 'tipo') and hijo.tipo in ["Expresion", "Asignacion"]:
-                valor_inicial = hijo
+        tipo_dato = node.tipo_dato
+        identificador = node.nombre
         
         # In Python, we don't declare types, just assign values
-        if valor_inicial is not None:
-            valor_str = self._generate_expression(valor_inicial)
+        if node.valor_inicial is not None:
+            valor_str = self._generate_expression(node.valor_inicial)
             self._add_line(f"{identificador} = {valor_str}")
         else:
             # Initialize with default values based on type
@@ -118,82 +87,76 @@ class CodeGenerator:
 
     def _generate_assignment(self, node):
         """Generate code for an assignment statement."""
-        left_node = node.hijos[0]
-        right_node = node.hijos[1]
-        
-        left_str = self._generate_expression(left_node)
-        right_str = self._generate_expression(right_node)
+        right_str = self._generate_expression(node.expresion)
         
-        self._add_line(f"{left_str} = {right_str}")
+        self._add_line(f"{node.nombre} = {right_str}")
 
     def _generate_expression(self, node):
         """Generate code for an expression."""
         if node is None:
             return "None"
         
-        if node.tipo == "Identificador":
-            return node.valor
-        
-        elif node.tipo == "Operando":
-            return node.valor
-        
-        elif node.tipo == "Número":
-            return node.valor
-        
-        elif node.tipo == "String Literal":
-            return node.valor
-        
-        elif node.tipo == "Literal Booleano":
-            return "True" if node.valor.lower() == "true" else "False"
-        
-        elif node.tipo == "Literal Nulo":
-            return "None"
-        
-        elif node.tipo == "Expresion":
-            # For binary operations
-            if len(node.hijos) >= 2:
-                left_expr = self._generate_expression(node.hijos[0])
-                right_expr = self._generate_expression(node.hijos[1])
-                
-                # Convert Java operators to Python
-                operator = node.valor
-                if operator == "&&":
-                    operator = "and"
-                elif operator == "||":
-                    operator = "or"
-                elif operator == "!":
-                    operator = "not "
-                
-                return f"({left_expr} {operator} {right_expr})"
-        
-        elif node.tipo == "Asignacion":
-            right_expr = self._generate_expression(node.hijos[1])
-            return right_expr
+        if isinstance(node, NodoIdentificador):
+            return node.nombre
+        
+        elif isinstance(node, (NodoOperando, NodoValor)):
+            return node.texto
+        
+        elif isinstance(node, NodoBinaria):
+            left_expr = self._generate_expression(node.izquierda)
+            right_expr = self._generate_expression(node.derecha)
+            
+            # Convert Java operators to Python
+            operator = node.operador
+            if operator == "&&":
+                operator = "and"
+            elif operator == "||":
+                operator = "or"
+            
+            return f"({left_expr} {operator} {right_expr})"
+        
+        elif isinstance(node, NodoUnaria):
+            operand = self._generate_expression(node.operando)
+            if node.operador == "!":
+                return f"(not {operand})"
+            if node.operador in ("-", "+", "~"):
+                return f"({node.operador}{operand})"
+            # ++ and -- do not exist in Python; inside an expression use the variable's value
+            return operand
+        
+        elif isinstance(node, NodoAsignacion):
+            return self._generate_expression(node.expresion)
         
         return "None"  # Default case
 
     def _generate_if_statement(self, node):
         """Generate code for an if statement."""
         # Generate the condition
-        condition = self._generate_expression(node.hijos[0])
+        condition = self._generate_expression(node.condicion)
         self._add_line(f"if {condition}:")
         
         # Generate the if block
-        self._generate_node(node.hijos[1])
+        self._generate_node(node.cuerpo)
         
         # Generate the else block if present
-        if len(node.hijos) >= 3 and node.tipo == "IfElse":
+        if node.sino is not None:
             self._add_line("else:")
-            self._generate_node(node.hijos[2])
+            if isinstance(node.sino, NodoIf):
+                # else if: the nested if goes inside the else
+                self.indentation += 1
+                self._generate_node(node.sino)
+                self.indentation -= 1
+            else:
+                self._generate_node(node.sino)
 
     def _generate_while_statement(self, node):
         """Generate code for a while statement."""
         # Generate the condition
-        condition = self._generate_expression(node.hijos[0])
+        condition = self._generate_expression(node.condicion)
         self._add_line(f"while {condition}:")
         
         # Generate the loop body
-        self._generate_node(node.hijos[1])
+        self._generate_node(node.cuerpo)
 
     def _generate_do_while_statement(self, node):
         """Generate code for a do-while statement."""
@@ -202,10 +165,10 @@ class CodeGenerator:
         
         # Generate the loop body
         self.indentation += 1
-        self._generate_node(node.hijos[0])
+        self._generate_node(node.cuerpo)
         
         # Generate the condition check at the end
-        condition = self._generate_expression(node.hijos[1])
+        condition = self._generate_expression(node.condicion)
         self._add_line(f"if not ({condition}):")
         self._add_line("    break")
         self.indentation -= 1
@@ -213,27 +176,21 @@ class CodeGenerator:
     def _generate_for_statement(self, node):
         """Generate code for a for statement."""
         # In Java: for (initialization; condition; update) { body }
-        # Extract components
-        initialization = node.hijos[0]
-        condition = node.hijos[1]
-        update = node.hijos[2]
-        body = node.hijos[3]
-        
         # Generate initialization before the loop
-        init_code = self._generate_expression(initialization)
+        init_code = self._generate_expression(node.inicializacion)
         if init_code and init_code != "None":
             self._add_line(init_code)
         
         # Generate the while loop with the condition
-        cond_code = self._generate_expression(condition)
+        cond_code = self._generate_expression(node.condicion)
         self._add_line(f"while {cond_code}:")
         
         # Generate the loop body
         self.indentation += 1
-        self._generate_node(body)
+        self._generate_node(node.cuerpo)
         
         # Add the update at the end of the loop body
-        update_code = self._generate_expression(update)
+        update_code = self._generate_expression(node.actualizacion)
         if update_code and update_code != "None":
             self._add_line(update_code)
         
@@ -241,22 +198,10 @@ class CodeGenerator:
 
     def _generate_function(self, node):
         """Generate code for a function declaration."""
-        tipo_retorno = node.valor
-        
-        # Extract information from the function declaration
-        modificadores = []
-        nombre_funcion = None
-        parametros = []
-        cuerpo = None
-        
-        if len(node.hijos) >= 4:
-            modificadores = node.hijos[0]
-            nombre_funcion = node.hijos[1]
-            parametros = node.hijos[2]
-            cuerpo = node.hijos[3]
+        parametros = node.parametros
         
         # Convert Java method name to Python function name
-        if self.class_name and "static" not in modificadores:
+        if self.class_name and "static" not in node.modificadores:
             # Instance method, add self parameter
             param_str = "self"
             if parametros:
@@ -266,37 +211,26 @@ class CodeGenerator:
             param_str = ", ".join(param_name for _, param_name in parametros)
         
         # Generate function definition
-        python_return_type = self.java_to_python_types.get(tipo_retorno, "None")
-        self._add_line(f"def {nombre_funcion}({param_str}):")
+        self._add_line(f"def {node.nombre}({param_str}):")
         
         # Generate function body
-        if cuerpo is not None:
-            self._generate_node(cuerpo)
+        if node.cuerpo is not None:
+            self._generate_node(node.cuerpo)
         else:
             # Empty function body
             self._add_line("    pass")
 
     def _generate_class(self, node):
         """Generate code for a class declaration."""
-        # Extract information from the class declaration
-        modificadores = []
-        nombre_clase = None
-        miembros = []
-        
-        if len(node.hijos) >= 3:
-            modificadores = node.hijos[0]
-            nombre_clase = node.hijos[1]
-            miembros = node.hijos[2]
-        
         # Save the class name for method generation
-        self.class_name = nombre_clase
+        self.class_name = node.nombre
         
         # Generate class definition
-        self._add_line(f"class {nombre_clase}:")
+        self._add_line(f"class {node.nombre}:")
         
         # Generate class members
-        if isinstance(miembros, list) and miembros:
-            for miembro in miembros:
+        if node.miembros:
+            for miembro in node.miembros:
                 self._generate_node(miembro)
         else:
             # Empty class
@@ -309,52 +243,62 @@ class CodeGenerator:
         """Generate code for a try-catch statement."""
         # Generate try block
         self._add_line("try:")
-        self._generate_node(node.hijos[0])
+        self._generate_node(node.cuerpo_try)
+        
+        # Map Java exception types to Python
+        exception_type = node.tipo_excepcion
+        python_exception = "Exception"  # Default
+        if exception_type == "ArithmeticException":
+            python_exception = "ZeroDivisionError"
+        elif exception_type == "NullPointerException":
+            python_exception = "AttributeError"
+        elif exception_type == "IndexOutOfBoundsException":
+            python_exception = "IndexError"
         
         # Generate except block
-        if len(node.hijos) >= 2:
-            exception_info = node.hijos[1]
-            if isinstance(exception_info, tuple) and len(exception_info) == 2:
-                exception_type, exception_name = exception_info
-                
-                # Map Java exception types to Python
-                python_exception = "Exception"  # Default
-                if exception_type == "ArithmeticException":
-                    python_exception = "ZeroDivisionError"
-                elif exception_type == "NullPointerException":
-                    python_exception = "AttributeError"
-                elif exception_type == "IndexOutOfBoundsException":
-                    python_exception = "IndexError"
-                
-                self._add_line(f"except {python_exception} as {exception_name}:")
-                self._generate_node(node.hijos[2])
+        self._add_line(f"except {python_exception} as {node.nombre_excepcion}:")
+        self._generate_node(node.cuerpo_catch)
 
     def _generate_switch(self, node):
         """Generate code for a switch statement."""
         # Python doesn't have switch, so we use if-elif-else
         
         # Generate the switch expression
-        switch_expr = self._generate_expression(node.hijos[0])
+        switch_expr = self._generate_expression(node.expresion)
         
         # Generate case blocks
         first_case = True
-        if len(node.hijos) >= 2:
-            casos = node.hijos[1]
-            if isinstance(casos, list):
-                for caso in casos:
-                    if isinstance(caso, tuple) and len(caso) == 2:
-                        valor, instrucciones = caso
-                        case_value = self._generate_expression(valor)
-                        
-                        if first_case:
-                            self._add_line(f"if {switch_expr} == {case_value}:")
-                            first_case = False
-                        else:
-                            self._add_line(f"elif {switch_expr} == {case_value}:")
-                        
-                        self._generate_node(instrucciones)
+        for caso in node.casos:
+            case_value = self._generate_expression(caso.expresion)
+            
+            if first_case:
+                self._add_line(f"if {switch_expr} == {case_value}:")
+                first_case = False
+            else:
+                self._add_line(f"elif {switch_expr} == {case_value}:")
+            
+            self._generate_node(caso.cuerpo)
         
         # Generate default block
-        if len(node.hijos) >= 3 and node.hijos[2] is not None:
+        if node.por_defecto is not None:
             self._add_line("else:")
-            self._generate_node(node.hijos[2])
+            self._generate_node(node.por_defecto.cuerpo)
+
+    # Handler for each node class; the rest only have their children generated
+    _handlers = {
+        NodoBloque: _generate_block,
+        NodoDeclaracion: _generate_declaration,
+        NodoAsignacion: _generate_assignment,
+        NodoBinaria: _generate_expression,
+        NodoValor: _generate_expression,
+        NodoIf: _generate_if_statement,
+        NodoWhile: _generate_while_statement,
+        NodoDoWhile: _generate_do_while_statement,
+        NodoFor: _generate_for_statement,
+        NodoFuncion: _generate_function,
+        NodoClase: _generate_class,
+        NodoTryCatch: _generate_try_catch,
+        NodoSwitch: _generate_switch,
+        NodoIdentificador: _generate_expression,
+        NodoOperando: _generate_expression,
+    }
@@ -0,0 +1,281 @@
+import argparse
+import hashlib
+import json
+import os
+
+from .analizador_lexico import NOMBRES_TIPO, TipoToken
+from .cursor_tokens import FIN, LEXEMA_POR_TEXTO, TEXTO_LEXEMA
+
+RUTA_GRAMATICA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gramatica.txt")
+# Las tablas generadas se guardan junto al bytecode, que ya está fuera del repositorio
+RUTA_TABLAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__", "tablas_gramatica.json")
+
+# Formato del archivo de tablas; se incrementa al cambiar cómo se codifican
+FORMATO_TABLAS = 1
+
+# Códigos de los símbolos en las tablas:
+#   0..len(TipoToken)-1        cualquier token de ese tipo
+#   FIN (255)                  fin de los tokens
+#   BASE_LEXEMA + Lexema       un lexema fijo
+#   BASE_NO_TERMINAL + i       el no terminal i
+#   BASE_EXTERNO + i           el símbolo externo i (lo analiza un método del parser)
+BASE_LEXEMA = 256
+TAMANO_FILA = BASE_LEXEMA + len(TEXTO_LEXEMA)
+BASE_NO_TERMINAL = 1024
+BASE_EXTERNO = 2048
+
+_TIPO_POR_MIEMBRO = {miembro.name: int(miembro) for miembro in TipoToken}
+
+
+def leer_gramatica(texto):
+    """Interpreta el texto de una gramática (ver el formato en gramatica.txt).
+
+    Retorna un diccionario con el símbolo inicial, las producciones como tuplas
+    (no_terminal, [símbolos], acción), los símbolos externos con sus terminales
+    iniciales y los no terminales con posición. Los errores de formato lanzan ValueError.
+    """
+    gramatica = {"inicio": None, "producciones": [], "externos": {}, "posicion": []}
+    actual = None
+
+    for numero, linea in enumerate(texto.splitlines(), 1):
+        linea = linea.split("#", 1)[0].strip()
+        if not linea:
+            continue
+
+        if linea.startswith("%"):
+            directiva, _, resto = linea.partition(" ")
+            if directiva == "%inicio":
+                gramatica["inicio"] = resto.strip()
+            elif directiva == "%externo":
+                nombre, _, terminales = resto.partition(":")
+                gramatica["externos"][nombre.strip()] = terminales.split()
+            elif directiva == "%posicion":
+                gramatica["posicion"].extend(resto.split())
+            else:
+                raise ValueError(f"Línea {numero}: directiva desconocida '{directiva}'.")
+            continue
+
+        if "->" in linea:
+            actual, _, alternativa = linea.partition("->")
+            actual = actual.strip()
+        elif linea.startswith("|") and actual is not None:
+            alternativa = linea[1:]
+        else:
+            raise ValueError(f"Línea {numero}: se esperaba 'no_terminal -> símbolos' o '| símbolos'.")
+
+        simbolos, _, accion = alternativa.partition("=>")
+        gramatica["producciones"].append((actual, simbolos.split(), accion.strip() or None))
+
+    if gramatica["inicio"] is None:
+        raise ValueError("La gramática no declara el símbolo inicial (%inicio).")
+    return gramatica
+
+
+def codigo_terminal(simbolo):
+    """Código de un terminal escrito como 'texto' o como nombre de TipoToken; None si no lo es."""
+    if len(simbolo) > 2 and simbolo[0] == simbolo[-1] == "'":
+        codigo = LEXEMA_POR_TEXTO.get(simbolo[1:-1])
+        if codigo is None:
+            raise ValueError(f"El lexema {simbolo} no está en cursor_tokens.TEXTO_LEXEMA.")
+        return BASE_LEXEMA + codigo
+    return _TIPO_POR_MIEMBRO.get(simbolo)
+
+
+def nombre_terminal(codigo):
+    """Texto de un terminal para los mensajes de error."""
+    if codigo == FIN:
+        return "fin del código"
+    if codigo >= BASE_LEXEMA:
+        return f"'{TEXTO_LEXEMA[codigo - BASE_LEXEMA]}'"
+    return NOMBRES_TIPO[codigo]
+
+
+def calcular_primeros(gramatica):
+    """Conjunto FIRST de cada no terminal y externo, y el conjunto de los que derivan vacío."""
+    primeros = {nombre: set(map(codigo_terminal, terminales)) for nombre, terminales in gramatica["externos"].items()}
+    for no_terminal, _, _ in gramatica["producciones"]:
+        primeros.setdefault(no_terminal, set())
+    anulables = set()
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for no_terminal, simbolos, _ in gramatica["producciones"]:
+            conjunto, anulable = primeros_de_secuencia(simbolos, primeros, anulables)
+            if not conjunto <= primeros[no_terminal]:
+                primeros[no_terminal] |= conjunto
+                cambio = True
+            if anulable and no_terminal not in anulables:
+                anulables.add(no_terminal)
+                cambio = True
+    return primeros, anulables
+
+
+def primeros_de_secuencia(simbolos, primeros, anulables):
+    """FIRST de una secuencia de símbolos y si la secuencia completa puede ser vacía."""
+    conjunto = set()
+    for simbolo in simbolos:
+        if simbolo not in primeros:
+            conjunto.add(codigo_terminal(simbolo))
+            return conjunto, False
+        conjunto |= primeros[simbolo]
+        if simbolo not in anulables:
+            return conjunto, False
+    return conjunto, True
+
+
+def calcular_siguientes(gramatica, primeros, anulables):
+    """Conjunto FOLLOW de cada no terminal (FIN sigue al símbolo inicial)."""
+    siguientes = {no_terminal: set() for no_terminal, _, _ in gramatica["producciones"]}
+    siguientes[gramatica["inicio"]].add(FIN)
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for no_terminal, simbolos, _ in gramatica["producciones"]:
+            for i, simbolo in enumerate(simbolos):
+                if simbolo not in siguientes:
+                    continue
+                conjunto, anulable = primeros_de_secuencia(simbolos[i + 1:], primeros, anulables)
+                if anulable:
+                    conjunto |= siguientes[no_terminal]
+                if not conjunto <= siguientes[simbolo]:
+                    siguientes[simbolo] |= conjunto
+                    cambio = True
+    return siguientes
+
+
+def construir_tablas(gramatica):
+    """Construye la tabla de predicción LL(1) con los símbolos ya codificados.
+
+    Retorna un diccionario listo para guardar como JSON. Si dos producciones de un
+    no terminal se predicen con el mismo terminal la gramática no es LL(1) y se lanza
+    ValueError con todos los conflictos.
+    """
+    no_terminales = list(dict.fromkeys(no_terminal for no_terminal, _, _ in gramatica["producciones"]))
+    externos = list(gramatica["externos"])
+    codigos = {nombre: BASE_NO_TERMINAL + i for i, nombre in enumerate(no_terminales)}
+    codigos.update({nombre: BASE_EXTERNO + i for i, nombre in enumerate(externos)})
+
+    def codificar(simbolo):
+        if simbolo in codigos:
+            return codigos[simbolo]
+        codigo = codigo_terminal(simbolo)
+        if codigo is None:
+            raise ValueError(f"Símbolo '{simbolo}' sin definir: no es un no terminal, un externo ni un TipoToken.")
+        return codigo
+
+    if gramatica["inicio"] not in codigos:
+        raise ValueError(f"El símbolo inicial '{gramatica['inicio']}' no tiene producciones.")
+    for nombre, terminales in gramatica["externos"].items():
+        if not terminales or any(codigo_terminal(terminal) is None for terminal in terminales):
+            raise ValueError(f"El externo '{nombre}' necesita una lista de terminales válidos.")
+
+    primeros, anulables = calcular_primeros(gramatica)
+    siguientes = calcular_siguientes(gramatica, primeros, anulables)
+
+    producciones = []
+    filas = [{} for _ in no_terminales]
+    conflictos = []
+    for indice, (no_terminal, simbolos, accion) in enumerate(gramatica["producciones"]):
+        if accion is None:
+            if len(simbolos) > 1:
+                raise ValueError(f"La producción {no_terminal} -> {' '.join(simbolos)} necesita una acción.")
+            accion = "primero" if simbolos else "nada"
+        producciones.append([codigos[no_terminal] - BASE_NO_TERMINAL, [codificar(s) for s in simbolos], accion])
+
+        prediccion, anulable = primeros_de_secuencia(simbolos, primeros, anulables)
+        if anulable:
+            prediccion |= siguientes[no_terminal]
+        fila = filas[codigos[no_terminal] - BASE_NO_TERMINAL]
+        for terminal in prediccion:
+            anterior = fila.setdefault(terminal, indice)
+            if anterior != indice:
+                conflictos.append(
+                    f"{no_terminal}: {nombre_terminal(terminal)} predice "
+                    f"'{' '.join(gramatica['producciones'][anterior][1]) or 'ε'}' y '{' '.join(simbolos) or 'ε'}'"
+                )
+
+    if conflictos:
+        raise ValueError("La gramática no es LL(1):\n" + "\n".join(conflictos))
+
+    return {
+        "inicio": codigos[gramatica["inicio"]],
+        "no_terminales": no_terminales,
+        "externos": externos,
+        "posicion": sorted(codigos[nombre] - BASE_NO_TERMINAL for nombre in gramatica["posicion"]),
+        "producciones": producciones,
+        "tabla": [sorted(fila.items()) for fila in filas],
+    }
+
+
+def version_tablas(texto_gramatica):
+    """Hash de todo lo que determina las tablas: la gramática y la codificación de los terminales."""
+    contenido = repr((FORMATO_TABLAS, texto_gramatica, NOMBRES_TIPO, TEXTO_LEXEMA, FIN))
+    return hashlib.sha1(contenido.encode("utf-8")).hexdigest()[:12]
+
+
+def tablas_de_gramatica(texto_gramatica):
+    """Construye las tablas del texto de una gramática, con su versión."""
+    tablas = construir_tablas(leer_gramatica(texto_gramatica))
+    tablas["version"] = version_tablas(texto_gramatica)
+    return tablas
+
+
+def guardar_tablas(tablas, ruta_tablas=RUTA_TABLAS):
+    os.makedirs(os.path.dirname(ruta_tablas), exist_ok=True)
+    temporal = f"{ruta_tablas}.{os.getpid()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump(tablas, archivo)
+    os.replace(temporal, ruta_tablas)  # Otro proceso nunca lee un archivo a medio escribir
+
+
+def generar_tablas(ruta_gramatica=RUTA_GRAMATICA, ruta_tablas=RUTA_TABLAS):
+    """Genera las tablas desde la gramática y las guarda en ruta_tablas."""
+    with open(ruta_gramatica, "r", encoding="utf-8") as archivo:
+        tablas = tablas_de_gramatica(archivo.read())
+    guardar_tablas(tablas, ruta_tablas)
+    return tablas
+
+
+def cargar_tablas(ruta_gramatica=RUTA_GRAMATICA, ruta_tablas=RUTA_TABLAS):
+    """Carga las tablas guardadas si corresponden a la gramática actual; si no, las regenera y guarda."""
+    with open(ruta_gramatica, "r", encoding="utf-8") as archivo:
+        texto = archivo.read()
+    try:
+        with open(ruta_tablas, "r", encoding="utf-8") as archivo:
+            tablas = json.load(archivo)
+        if tablas.get("version") == version_tablas(texto):
+            return tablas
+    except (OSError, ValueError):
+        pass
+
+    tablas = tablas_de_gramatica(texto)
+    try:
+        guardar_tablas(tablas, ruta_tablas)
+    except OSError:
+        pass  # Sin permiso de escritura las tablas se usan sin guardarlas
+    return tablas
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Genera las tablas LL(1) del parser a partir de la gramática.")
+    parser.add_argument("--gramatica", default=RUTA_GRAMATICA)
+    parser.add_argument("--salida", default=RUTA_TABLAS)
+    opciones = parser.parse_args(argumentos)
+
+    try:
+        tablas = generar_tablas(opciones.gramatica, opciones.salida)
+    except ValueError as e:
+        print(e)
+        return 1
+    entradas = sum(len(fila) for fila in tablas["tabla"])
+    print(
+        f"{len(tablas['no_terminales'])} no terminales, {len(tablas['producciones'])} producciones, "
+        f"{entradas} entradas en la tabla (versión {tablas['version']}) -> {opciones.salida}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
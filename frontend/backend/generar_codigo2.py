@@ -1,5 +1,5 @@
-# Importamos la clase ASTNode del analizador sintáctico
-from backend.analizador_sintactico import ASTNode
+# Importamos los nodos del AST
+from backend.nodos_ast import ASTNode, NodoAsignacion, NodoBinaria, NodoIdentificador, NodoOperando, NodoUnaria, NodoValor
 
 class PythonCodeGenerator:
     def __init__(self):
@@ -62,43 +62,23 @@ class PythonCodeGenerator:
 
     def visit_Bloque(self, node):
         """Visita un bloque de instrucciones."""
-        for instruccion in node.hijos:
+        for instruccion in node.instrucciones:
             if instruccion:
                 instruccion.accept(self)
 
     def visit_Declaracion(self, node):
         """Visita una declaración de variable."""
-        tipo = node.valor
-        modificadores = []
-        identificador = None
-        valor_inicial = None
+        identificador = node.nombre
+        valor_inicial = node.valor_inicial
         
-        # Extraer modificadores, identificador y valor inicial
-        for hijo in node.hijos:
-            if isinstance(hijo, list) and all(isinstance(mod, str) for mod in hijo):
-                modificadores = hijo
-            elif isinstance(hijo, ASTNode) and hijo.tipo == "Identificador":
-                identificador = hijo.valor
-            elif isinstance(hijo, ASTNode) and hijo.tipo == "Expresion":
-                valor_inicial = hijo
-            elif isinstance(hijo, str) and hijo == "=":
-                # Es el operador de asignación
-                pass
-        
-        # Generar código para la declaración
-        if identificador:
-            # Si hay un valor inicial, generamos la asignación
-            if valor_inicial:
-                valor_str = self._generate_expression(valor_inicial)
-                self._add_line(f"{identificador} = {valor_str}")
-            else:
-                # Inicialización por defecto según el tipo
-                default_value = self._get_default_value(tipo)
-                self._add_line(f"{identificador} = {default_value}")
-        
-        # Si es una declaración de clase, añadimos un comentario
-        if "class" in modificadores:
-            self._add_comment(f"Declaración de clase {identificador}")
+        # Si hay un valor inicial (que no sea otra asignación), generamos la asignación
+        if valor_inicial is not None and not isinstance(valor_inicial, NodoAsignacion):
+            valor_str = self._generate_expression(valor_inicial)
+            self._add_line(f"{identificador} = {valor_str}")
+        else:
+            # Inicialización por defecto según el tipo
+            default_value = self._get_default_value(node.tipo_dato)
+            self._add_line(f"{identificador} = {default_value}")
 
     def _get_default_value(self, tipo):
         """Retorna el valor por defecto para un tipo de dato Java."""
@@ -114,228 +94,139 @@ class PythonCodeGenerator:
 
     def _generate_expression(self, node):
         """Genera código para una expresión."""
-        if node.tipo == "Expresion":
+        if isinstance(node, NodoBinaria):
             # Si es una expresión con operador
-            if len(node.hijos) >= 2:
-                operador = node.valor
-                izquierda = node.hijos[0]
-                derecha = node.hijos[1] if len(node.hijos) > 1 else None
-                
-                izq_str = self._generate_expression(izquierda) if isinstance(izquierda, ASTNode) else str(izquierda)
-                der_str = self._generate_expression(derecha) if isinstance(derecha, ASTNode) and derecha else ""
-                
-                # Convertir operadores Java a Python
-                py_operador = self.java_to_python_operators.get(operador, operador)
-                
-                if der_str:
-                    return f"({izq_str} {py_operador} {der_str})"
-                else:
-                    return f"{py_operador}{izq_str}"
+            izq_str = self._generate_expression(node.izquierda)
+            der_str = self._generate_expression(node.derecha)
+            
+            # Convertir operadores Java a Python
+            py_operador = self.java_to_python_operators.get(node.operador, node.operador)
+            
+            if der_str:
+                return f"({izq_str} {py_operador} {der_str})"
             else:
-                # Si es una expresión simple (un valor)
-                return str(node.valor)
-        elif node.tipo == "Identificador" or node.tipo == "Operando":
-            return str(node.valor)
-        elif node.tipo == "Valor":
+                return f"{py_operador}{izq_str}"
+        elif isinstance(node, NodoUnaria):
+            operando = self._generate_expression(node.operando)
+            if node.operador == "!":
+                return f"(not {operando})"
+            if node.operador in ("-", "+", "~"):
+                return f"({node.operador}{operando})"
+            # ++ y -- no existen en Python: dentro de una expresión se usa el valor de la variable
+            return operando
+        elif isinstance(node, (NodoValor, NodoOperando, NodoIdentificador)):
+            # Un valor solo: identificador o literal
             return str(node.valor)
         else:
             # Para otros tipos de nodos
-            return str(node.valor) if hasattr(node, 'valor') and node.valor is not None else ""
+            return str(node.valor) if node.valor is not None else ""
 
     def visit_Asignacion(self, node):
         """Visita una asignación."""
-        identificador = None
-        expresion = None
-        
-        # Extraer identificador y expresión
-        if len(node.hijos) >= 2:
-            if isinstance(node.hijos[0], ASTNode) and node.hijos[0].tipo == "Identificador":
-                identificador = node.hijos[0].valor
-            
-            if isinstance(node.hijos[1], ASTNode):
-                expresion = node.hijos[1]
-        
-        if identificador and expresion:
-            valor_str = self._generate_expression(expresion)
-            self._add_line(f"{identificador} = {valor_str}")
+        valor_str = self._generate_expression(node.expresion)
+        self._add_line(f"{node.nombre} = {valor_str}")
 
     def visit_If(self, node):
-        """Visita una sentencia if."""
-        condicion = None
-        cuerpo_if = None
-        cuerpo_else = None
+        """Visita una sentencia if, con su else si lo tiene."""
+        condicion_str = self._generate_expression(node.condicion)
+        self._add_line(f"if {condicion_str}:")
         
-        # Extraer condición y cuerpos
-        if len(node.hijos) >= 2:
-            condicion = node.hijos[0]
-            cuerpo_if = node.hijos[1]
-            if len(node.hijos) > 2:
-                cuerpo_else = node.hijos[2]
+        # Visitar el cuerpo del if
+        self.indent_level += 1
+        node.cuerpo.accept(self)
+        self.indent_level -= 1
         
-        if condicion and cuerpo_if:
-            condicion_str = self._generate_expression(condicion)
-            self._add_line(f"if {condicion_str}:")
-            
-            # Visitar el cuerpo del if
+        # Visitar el cuerpo del else (o el if de un else if)
+        if node.sino is not None:
+            self._add_line("else:")
             self.indent_level += 1
-            cuerpo_if.accept(self)
+            node.sino.accept(self)
             self.indent_level -= 1
-            
-            # Si hay un else
-            if cuerpo_else:
-                self._add_line("else:")
-                self.indent_level += 1
-                cuerpo_else.accept(self)
-                self.indent_level -= 1
 
     def visit_IfElse(self, node):
         """Visita una sentencia if-else."""
-        condicion = node.valor
-        cuerpo_if = None
-        cuerpo_else = None
-        
-        # Extraer cuerpos
-        if len(node.hijos) >= 2:
-            cuerpo_if = node.hijos[0]
-            cuerpo_else = node.hijos[1]
-        
-        condicion_str = self._generate_expression(condicion)
-        self._add_line(f"if {condicion_str}:")
-        
-        # Visitar el cuerpo del if
-        self.indent_level += 1
-        cuerpo_if.accept(self)
-        self.indent_level -= 1
-        
-        # Visitar el cuerpo del else
-        self._add_line("else:")
-        self.indent_level += 1
-        cuerpo_else.accept(self)
-        self.indent_level -= 1
+        self.visit_If(node)
 
     def visit_While(self, node):
         """Visita una sentencia while."""
-        condicion = None
-        cuerpo = None
+        condicion_str = self._generate_expression(node.condicion)
+        self._add_line(f"while {condicion_str}:")
         
-        # Extraer condición y cuerpo
-        if len(node.hijos) >= 2:
-            condicion = node.hijos[0]
-            cuerpo = node.hijos[1]
-        
-        if condicion and cuerpo:
-            condicion_str = self._generate_expression(condicion)
-            self._add_line(f"while {condicion_str}:")
-            
-            # Visitar el cuerpo del while
-            self.indent_level += 1
-            cuerpo.accept(self)
-            self.indent_level -= 1
+        # Visitar el cuerpo del while
+        self.indent_level += 1
+        node.cuerpo.accept(self)
+        self.indent_level -= 1
 
     def visit_DoWhile(self, node):
         """Visita una sentencia do-while."""
-        cuerpo = None
-        condicion = None
+        # En Python no hay do-while, así que lo simulamos
+        self._add_line("# Simulación de do-while")
+        self._add_line("while True:")
         
-        # Extraer cuerpo y condición
-        if len(node.hijos) >= 2:
-            cuerpo = node.hijos[0]
-            condicion = node.hijos[1]
+        # Visitar el cuerpo del do-while
+        self.indent_level += 1
+        node.cuerpo.accept(self)
         
-        if cuerpo and condicion:
-            # En Python no hay do-while, así que lo simulamos
-            self._add_line("# Simulación de do-while")
-            self._add_line("while True:")
-            
-            # Visitar el cuerpo del do-while
-            self.indent_level += 1
-            cuerpo.accept(self)
-            
-            # Añadir la condición de salida
-            condicion_str = self._generate_expression(condicion)
-            self._add_line(f"if not ({condicion_str}):")
-            self.indent_level += 1
-            self._add_line("break")
-            self.indent_level -= 2
+        # Añadir la condición de salida
+        condicion_str = self._generate_expression(node.condicion)
+        self._add_line(f"if not ({condicion_str}):")
+        self.indent_level += 1
+        self._add_line("break")
+        self.indent_level -= 2
 
     def visit_For(self, node):
         """Visita una sentencia for."""
-        inicializacion = None
-        condicion = None
-        actualizacion = None
-        cuerpo = None
+        # En Java: for (inicializacion; condicion; actualizacion) { cuerpo }
+        # En Python: inicializacion; while condicion: cuerpo; actualizacion
         
-        # Extraer inicialización, condición, actualización y cuerpo
-        if len(node.hijos) >= 4:
-            inicializacion = node.hijos[0]
-            condicion = node.hijos[1]
-            actualizacion = node.hijos[2]
-            cuerpo = node.hijos[3]
+        # Inicialización
+        if isinstance(node.inicializacion, (NodoBinaria, NodoValor)):
+            init_str = self._generate_expression(node.inicializacion)
+            self._add_line(f"{init_str}")
+        else:
+            node.inicializacion.accept(self)
         
-        if inicializacion and condicion and actualizacion and cuerpo:
-            # En Java: for (inicializacion; condicion; actualizacion) { cuerpo }
-            # En Python: inicializacion; while condicion: cuerpo; actualizacion
-            
-            # Inicialización
-            if inicializacion.tipo == "Expresion":
-                init_str = self._generate_expression(inicializacion)
-                self._add_line(f"{init_str}")
-            else:
-                inicializacion.accept(self)
-            
-            # Condición y bucle
-            condicion_str = self._generate_expression(condicion)
-            self._add_line(f"while {condicion_str}:")
-            
-            # Cuerpo
-            self.indent_level += 1
-            cuerpo.accept(self)
-            
-            # Actualización
-            if actualizacion.tipo == "Expresion":
-                update_str = self._generate_expression(actualizacion)
-                self._add_line(f"{update_str}")
-            else:
-                actualizacion.accept(self)
-            
-            self.indent_level -= 1
+        # Condición y bucle
+        condicion_str = self._generate_expression(node.condicion)
+        self._add_line(f"while {condicion_str}:")
+        
+        # Cuerpo
+        self.indent_level += 1
+        node.cuerpo.accept(self)
+        
+        # Actualización
+        if isinstance(node.actualizacion, (NodoBinaria, NodoValor)):
+            update_str = self._generate_expression(node.actualizacion)
+            self._add_line(f"{update_str}")
+        else:
+            node.actualizacion.accept(self)
+        
+        self.indent_level -= 1
 
     def visit_Funcion(self, node):
         """Visita una declaración de función."""
-        tipo_retorno = node.valor
-        modificadores = []
-        nombre_funcion = None
-        parametros = []
-        cuerpo = None
+        tipo_retorno = node.tipo_retorno
         
-        # Extraer modificadores, nombre, parámetros y cuerpo
-        if len(node.hijos) >= 4:
-            modificadores = node.hijos[0]
-            nombre_funcion = node.hijos[1]
-            parametros = node.hijos[2]
-            cuerpo = node.hijos[3]
+        # Generar la definición de la función
+        params_str = ", ".join(nombre for _, nombre in node.parametros)
         
-        if nombre_funcion and cuerpo:
-            # Generar la definición de la función
-            params_str = ", ".join([f"{param[1]}" for param in parametros]) if parametros else ""
-            
-            # Si estamos dentro de una clase, añadimos 'self' como primer parámetro
-            if self.current_class and "static" not in modificadores:
-                params_str = f"self{', ' + params_str if params_str else ''}"
-            
-            self._add_line(f"def {nombre_funcion}({params_str}):")
-            
-            # Visitar el cuerpo de la función
-            self.indent_level += 1
-            cuerpo.accept(self)
-            
-            # Si la función tiene un tipo de retorno que no es void, añadimos un return por defecto
-            if tipo_retorno != "void" and not self._has_return(cuerpo):
-                default_return = self._get_default_value(tipo_retorno)
-                self._add_line(f"return {default_return}")
-            
-            self.indent_level -= 1
-            self._add_line("")  # Línea en blanco después de la función
+        # Si estamos dentro de una clase, añadimos 'self' como primer parámetro
+        if self.current_class and "static" not in node.modificadores:
+            params_str = f"self{', ' + params_str if params_str else ''}"
+        
+        self._add_line(f"def {node.nombre}({params_str}):")
+        
+        # Visitar el cuerpo de la función
+        self.indent_level += 1
+        node.cuerpo.accept(self)
+        
+        # Si la función tiene un tipo de retorno que no es void, añadimos un return por defecto
+        if tipo_retorno != "void" and not self._has_return(node.cuerpo):
+            default_return = self._get_default_value(tipo_retorno)
+            self._add_line(f"return {default_return}")
+        
+        self.indent_level -= 1
+        self._add_line("")  # Línea en blanco después de la función
 
     def _has_return(self, node):
         """Verifica si un nodo contiene una sentencia return."""
@@ -345,50 +236,41 @@ class PythonCodeGenerator:
 
     def visit_Clase(self, node):
         """Visita una declaración de clase."""
-        modificadores = []
-        nombre_clase = None
-        miembros = []
+        miembros = node.miembros
         
-        # Extraer modificadores, nombre y miembros
-        if len(node.hijos) >= 3:
-            modificadores = node.hijos[0]
-            nombre_clase = node.hijos[1]
-            miembros = node.hijos[2]
+        # Guardar la clase actual
+        old_class = self.current_class
+        self.current_class = node.nombre
         
-        if nombre_clase:
-            # Guardar la clase actual
-            old_class = self.current_class
-            self.current_class = nombre_clase
-            
-            # Generar la definición de la clase
-            self._add_line(f"class {nombre_clase}:")
+        # Generar la definición de la clase
+        self._add_line(f"class {node.nombre}:")
+        
+        # Si no hay miembros, añadimos un pass
+        if not miembros:
+            self.indent_level += 1
+            self._add_line("pass")
+            self.indent_level -= 1
+        else:
+            # Visitar los miembros de la clase
+            self.indent_level += 1
             
-            # Si no hay miembros, añadimos un pass
-            if not miembros:
+            # Añadir el constructor __init__ si no existe
+            if not self._has_constructor(miembros):
+                self._add_line("def __init__(self):")
                 self.indent_level += 1
                 self._add_line("pass")
                 self.indent_level -= 1
-            else:
-                # Visitar los miembros de la clase
-                self.indent_level += 1
-                
-                # Añadir el constructor __init__ si no existe
-                if not self._has_constructor(miembros):
-                    self._add_line("def __init__(self):")
-                    self.indent_level += 1
-                    self._add_line("pass")
-                    self.indent_level -= 1
-                    self._add_line("")
-                
-                # Visitar cada miembro
-                for miembro in miembros:
-                    miembro.accept(self)
-                
-                self.indent_level -= 1
+                self._add_line("")
             
-            # Restaurar la clase anterior
-            self.current_class = old_class
-            self._add_line("")  # Línea en blanco después de la clase
+            # Visitar cada miembro
+            for miembro in miembros:
+                miembro.accept(self)
+            
+            self.indent_level -= 1
+        
+        # Restaurar la clase anterior
+        self.current_class = old_class
+        self._add_line("")  # Línea en blanco después de la clase
 
     def _has_constructor(self, miembros):
         """Verifica si hay un constructor en los miembros de la clase."""
@@ -398,32 +280,20 @@ class PythonCodeGenerator:
 
     def visit_TryCatch(self, node):
         """Visita una sentencia try-catch."""
-        bloque_try = None
-        excepcion = None
-        bloque_catch = None
+        # Generar el bloque try
+        self._add_line("try:")
+        self.indent_level += 1
+        node.cuerpo_try.accept(self)
+        self.indent_level -= 1
         
-        # Extraer bloques try y catch, y la excepción
-        if len(node.hijos) >= 3:
-            bloque_try = node.hijos[0]
-            excepcion = node.hijos[1]
-            bloque_catch = node.hijos[2]
+        # Generar el bloque except
+        # Mapear tipos de excepción de Java a Python
+        py_excepcion = self._map_exception_type(node.tipo_excepcion)
         
-        if bloque_try and excepcion and bloque_catch:
-            # Generar el bloque try
-            self._add_line("try:")
-            self.indent_level += 1
-            bloque_try.accept(self)
-            self.indent_level -= 1
-            
-            # Generar el bloque except
-            tipo_excepcion, nombre_excepcion = excepcion
-            # Mapear tipos de excepción de Java a Python
-            py_excepcion = self._map_exception_type(tipo_excepcion)
-            
-            self._add_line(f"except {py_excepcion} as {nombre_excepcion}:")
-            self.indent_level += 1
-            bloque_catch.accept(self)
-            self.indent_level -= 1
+        self._add_line(f"except {py_excepcion} as {node.nombre_excepcion}:")
+        self.indent_level += 1
+        node.cuerpo_catch.accept(self)
+        self.indent_level -= 1
 
     def _map_exception_type(self, java_exception):
         """Mapea un tipo de excepción de Java a su equivalente en Python."""
@@ -439,43 +309,6 @@ class PythonCodeGenerator:
         }
         return exception_map.get(java_exception, "Exception")
 
-    def visit_Switch(self, node):
-        """Visita una sentencia switch."""
-        expresion = None
-        casos = []
-        caso_default = None
-        
-        # Extraer expresión, casos y caso por defecto
-        if len(node.hijos) >= 3:
-            expresion = node.hijos[0]
-            casos = node.hijos[1]
-            caso_default = node.hijos[2]
-        
-        if expresion:
-            # En Python no hay switch, así que lo simulamos con if-elif-else
-            expr_str = self._generate_expression(expresion)
-            
-            # Generar los casos
-            first_case = True
-            for valor, instrucciones in casos:
-                valor_str = self._generate_expression(valor)
-                if first_case:
-                    self._add_line(f"if {expr_str} == {valor_str}:")
-                    first_case = False
-                else:
-                    self._add_line(f"elif {expr_str} == {valor_str}:")
-                
-                self.indent_level += 1
-                instrucciones.accept(self)
-                self.indent_level -= 1
-            
-            # Generar el caso por defecto
-            if caso_default:
-                self._add_line("else:")
-                self.indent_level += 1
-                caso_default.accept(self)
-                self.indent_level -= 1
-
     # Métodos de visita genéricos para cada tipo de nodo en el AST
     # Estos métodos serán llamados por el método accept de ASTNode
 
@@ -502,8 +335,8 @@ class PythonCodeGenerator:
 
     def visit_Print(self, node):
         """Visita una sentencia System.out.println o System.out.print."""
-        tipo = node.valor  # 'System.out.println' o 'System.out.print'
-        argumentos = node.hijos
+        tipo = node.funcion  # 'System.out.println' o 'System.out.print'
+        argumentos = node.argumentos
 
         if tipo == "System.out.println":
             newline = True
@@ -513,12 +346,7 @@ class PythonCodeGenerator:
             newline = True  # Por seguridad
 
         # Verificar si hay concatenación de strings con otros tipos
-        contenido = []
-        for arg in argumentos:
-            if isinstance(arg, ASTNode):
-                contenido.append(self._generate_expression(arg))
-            else:
-                contenido.append(str(arg))
+        contenido = [self._generate_expression(arg) for arg in argumentos]
 
         # Si hay operaciones de concatenación con +, convertimos a formato de print con comas
         # para evitar errores de tipo en Python
@@ -557,37 +385,32 @@ class PythonCodeGenerator:
 
     def visit_Switch(self, node):
         """Visita una sentencia switch."""
-        expresion = node.hijos[0]
         self._add_line("# Simulación de switch con if-elif-else en Python")
 
-        expr_str = self._generate_expression(expresion)
+        expr_str = self._generate_expression(node.expresion)
 
         first_case = True
-        for child in node.hijos[1:]:
-            if child.tipo == "Case":
-                valor = child.hijos[0]
-                instrucciones = child.hijos[1]
-
-                valor_str = self._generate_expression(valor)
-                if first_case:
-                    self._add_line(f"if {expr_str} == {valor_str}:")
-                    first_case = False
-                else:
-                    self._add_line(f"elif {expr_str} == {valor_str}:")
+        for caso in node.casos:
+            valor_str = self._generate_expression(caso.expresion)
+            if first_case:
+                self._add_line(f"if {expr_str} == {valor_str}:")
+                first_case = False
+            else:
+                self._add_line(f"elif {expr_str} == {valor_str}:")
 
-                self.indent_level += 1
-                instrucciones.accept(self)
-                self.indent_level -= 1
+            self.indent_level += 1
+            caso.cuerpo.accept(self)
+            self.indent_level -= 1
 
-            elif child.tipo == "Default":
-                self._add_line("else:")
-                self.indent_level += 1
-                child.hijos[0].accept(self)  # Instrucciones del default
-                self.indent_level -= 1
+        if node.por_defecto is not None:
+            self._add_line("else:")
+            self.indent_level += 1
+            node.por_defecto.cuerpo.accept(self)  # Instrucciones del default
+            self.indent_level -= 1
 
     def visit_ExpresionUnaria(self, node):
-        operador = node.valor  # operador++_post o ++, --, etc.
-        hijo = node.hijos[0].accept(self)  # Genera el código del operando
+        operador = node.operador  # operador++_post o ++, --, etc.
+        hijo = node.operando.accept(self)  # Genera el código del operando
 
         if operador == "++":
             return f"{hijo} = {hijo} + 1"
@@ -606,7 +429,6 @@ class PythonCodeGenerator:
         self._add_comment(f"Nodo no manejado específicamente: {node.tipo}")
         
         # Si el nodo tiene hijos, los visitamos
-        if hasattr(node, 'hijos') and node.hijos:
-            for hijo in node.hijos:
-                if isinstance(hijo, ASTNode):
-                    hijo.accept(self)
+        for hijo in node.hijos:
+            if isinstance(hijo, ASTNode):
+                hijo.accept(self)
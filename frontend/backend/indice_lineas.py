@@ -0,0 +1,35 @@
+from array import array
+from bisect import bisect_right
+
+
+class IndiceLineas:
+    """Índice de los offsets donde empieza cada línea del código fuente.
+
+    Se construye una sola vez buscando los saltos de línea y permite convertir un
+    offset en (línea, columna) con una búsqueda binaria, solo cuando hace falta
+    mostrar una posición. Funciona igual con str, bytes o mmap.
+    """
+
+    __slots__ = ("inicios",)
+
+    def __init__(self, codigo):
+        salto = "\n" if isinstance(codigo, str) else b"\n"
+        inicios = array("I", [0])
+        buscar = codigo.find
+        posicion = buscar(salto)
+        while posicion != -1:
+            inicios.append(posicion + 1)
+            posicion = buscar(salto, posicion + 1)
+        self.inicios = inicios
+
+    def posicion(self, offset):
+        """Retorna (línea, columna), ambas desde 1, del offset dado."""
+        linea = bisect_right(self.inicios, offset)
+        return linea, offset - self.inicios[linea - 1] + 1
+
+    def offset(self, linea, columna):
+        """Operación inversa de posicion()."""
+        return self.inicios[linea - 1] + columna - 1
+
+    def __len__(self):
+        return len(self.inicios)
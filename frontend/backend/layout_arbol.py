@@ -0,0 +1,157 @@
+from array import array
+
+# Layout ordenado de árboles (Reingold–Tilford, en la versión de tiempo lineal de
+# Buchheim, Jünger y Leipert). Cada subárbol se acomoda una sola vez: su contorno
+# derecho se compara con el contorno izquierdo del siguiente hermano siguiendo
+# "hilos" entre niveles, y el corrimiento necesario se reparte entre los hermanos
+# intermedios al final, en una sola pasada. Los padres quedan centrados sobre sus
+# hijos y ningún par de subárboles se superpone.
+#
+# Las dos pasadas (la de acomodar los subárboles, en postorden, y la que suma los
+# corrimientos, en preorden) son iterativas, así que un árbol profundo no usa la
+# pila de Python. Los datos de cada nodo están en listas indexadas por su orden en
+# nodes.
+
+SIN_NODO = -1
+
+
+def calcular_layout_arbol(nodes, edges, separacion_horizontal=4, separacion_vertical=2):
+    """Posiciones (x, y) de los nodos de un árbol, como las que usa networkx.
+
+    nodes son los (id, etiqueta) y edges las aristas (padre, hijo), como los arma
+    ASTNode.graficar; los hijos de cada nodo quedan en el orden de sus aristas. La
+    raíz es el nodo sin padre. Los nodos de un nivel quedan a separacion_horizontal
+    de distancia como mínimo y cada nivel a separacion_vertical debajo del anterior.
+    """
+    if not nodes:
+        return {}
+
+    ids = [node_id for node_id, _ in nodes]
+    indices = {node_id: indice for indice, node_id in enumerate(ids)}
+    cantidad = len(ids)
+
+    padres = array("i", [SIN_NODO]) * cantidad
+    hijos = [[] for _ in range(cantidad)]
+    for padre, hijo in edges:
+        padre, hijo = indices[padre], indices[hijo]
+        padres[hijo] = padre
+        hijos[padre].append(hijo)
+    raiz = padres.index(SIN_NODO)
+
+    numeros = array("i", [0]) * cantidad  # Posición de cada nodo entre sus hermanos
+    for lista in hijos:
+        for numero, hijo in enumerate(lista):
+            numeros[hijo] = numero
+
+    preliminares = [0.0] * cantidad
+    modificadores = [0.0] * cantidad
+    corrimientos = [0.0] * cantidad
+    cambios = [0.0] * cantidad
+    hilos = array("i", [SIN_NODO]) * cantidad
+    ancestros = array("i", range(cantidad))
+    ancestros_defecto = array("i", [SIN_NODO]) * cantidad  # Por padre, mientras se acomodan sus hijos
+
+    def siguiente_izquierdo(v):
+        return hijos[v][0] if hijos[v] else hilos[v]
+
+    def siguiente_derecho(v):
+        return hijos[v][-1] if hijos[v] else hilos[v]
+
+    def mover_subarbol(izquierdo, derecho, corrimiento):
+        subarboles = numeros[derecho] - numeros[izquierdo]
+        cambios[derecho] -= corrimiento / subarboles
+        corrimientos[derecho] += corrimiento
+        cambios[izquierdo] += corrimiento / subarboles
+        preliminares[derecho] += corrimiento
+        modificadores[derecho] += corrimiento
+
+    def acomodar(v, ancestro_defecto):
+        """Separa el subárbol de v de los de sus hermanos anteriores. Retorna el nuevo ancestro por defecto."""
+        padre = padres[v]
+        numero = numeros[v]
+        if numero == 0:
+            return ancestro_defecto
+
+        # Contornos: interior y exterior, derecho (el subárbol de v) e izquierdo (sus hermanos anteriores)
+        v_id = v_ed = v
+        v_ii = hijos[padre][numero - 1]
+        v_ei = hijos[padre][0]
+        s_id = s_ed = modificadores[v_id]
+        s_ii = modificadores[v_ii]
+        s_ei = modificadores[v_ei]
+        siguiente_ii = siguiente_derecho(v_ii)
+        siguiente_id = siguiente_izquierdo(v_id)
+        while siguiente_ii != SIN_NODO and siguiente_id != SIN_NODO:
+            v_ii = siguiente_ii
+            v_id = siguiente_id
+            v_ei = siguiente_izquierdo(v_ei)
+            v_ed = siguiente_derecho(v_ed)
+            ancestros[v_ed] = v
+            corrimiento = (preliminares[v_ii] + s_ii) - (preliminares[v_id] + s_id) + 1
+            if corrimiento > 0:
+                ancestro = ancestros[v_ii]
+                if padres[ancestro] != padre:
+                    ancestro = ancestro_defecto
+                mover_subarbol(ancestro, v, corrimiento)
+                s_id += corrimiento
+                s_ed += corrimiento
+            s_ii += modificadores[v_ii]
+            s_id += modificadores[v_id]
+            s_ei += modificadores[v_ei]
+            s_ed += modificadores[v_ed]
+            siguiente_ii = siguiente_derecho(v_ii)
+            siguiente_id = siguiente_izquierdo(v_id)
+
+        if siguiente_ii != SIN_NODO and siguiente_derecho(v_ed) == SIN_NODO:
+            hilos[v_ed] = siguiente_ii
+            modificadores[v_ed] += s_ii - s_ed
+        if siguiente_id != SIN_NODO and siguiente_izquierdo(v_ei) == SIN_NODO:
+            hilos[v_ei] = siguiente_id
+            modificadores[v_ei] += s_id - s_ei
+            ancestro_defecto = v
+        return ancestro_defecto
+
+    # Primera pasada, en postorden: cada nodo se ubica respecto de su hermano anterior
+    # y, si tiene hijos, se centra sobre ellos
+    pendientes = [(raiz, False)]
+    while pendientes:
+        v, hijos_listos = pendientes.pop()
+        if not hijos_listos:
+            pendientes.append((v, True))
+            pendientes.extend((hijo, False) for hijo in reversed(hijos[v]))
+            continue
+
+        padre = padres[v]
+        anterior = hijos[padre][numeros[v] - 1] if padre != SIN_NODO and numeros[v] > 0 else SIN_NODO
+        if hijos[v]:
+            # Aplica los corrimientos pendientes de los hijos, de derecha a izquierda
+            corrimiento = cambio = 0.0
+            for hijo in reversed(hijos[v]):
+                preliminares[hijo] += corrimiento
+                modificadores[hijo] += corrimiento
+                cambio += cambios[hijo]
+                corrimiento += corrimientos[hijo] + cambio
+            medio = (preliminares[hijos[v][0]] + preliminares[hijos[v][-1]]) / 2
+            if anterior != SIN_NODO:
+                preliminares[v] = preliminares[anterior] + 1
+                modificadores[v] = preliminares[v] - medio
+            else:
+                preliminares[v] = medio
+        elif anterior != SIN_NODO:
+            preliminares[v] = preliminares[anterior] + 1
+
+        if padre != SIN_NODO:
+            if numeros[v] == 0:
+                ancestros_defecto[padre] = v
+            ancestros_defecto[padre] = acomodar(v, ancestros_defecto[padre])
+
+    # Segunda pasada, en preorden: la x final suma los modificadores de los ancestros
+    posiciones = {}
+    desplazamiento = preliminares[raiz]  # La raíz queda en x = 0
+    pendientes = [(raiz, -desplazamiento, 0)]
+    while pendientes:
+        v, suma, nivel = pendientes.pop()
+        posiciones[ids[v]] = ((preliminares[v] + suma) * separacion_horizontal, -nivel * separacion_vertical)
+        suma += modificadores[v]
+        pendientes.extend((hijo, suma, nivel + 1) for hijo in hijos[v])
+    return posiciones
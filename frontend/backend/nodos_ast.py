@@ -0,0 +1,509 @@
+import time
+
+# Marca de next() en recorrer para un iterador sin más hijos (None es un hijo válido)
+_AGOTADO = object()
+
+
+def etiqueta_nodo(tipo, valor):
+    """Texto con que se muestra un nodo de ASTNode.recorrer: 'tipo: valor'."""
+    return f"{tipo}: {str(valor) if valor is not None else 'None'}"
+
+
+class ASTNode:
+    """Base de los nodos del AST.
+
+    Cada construcción del lenguaje es una subclase con __slots__ y campos con
+    nombre (NodoIf.condicion, NodoFor.actualizacion, ...), así que un nodo no tiene
+    __dict__ y quien lo recorre no necesita decodificar una lista de hijos.
+
+    tipo, valor e hijos son la vista de compatibilidad con la forma genérica de
+    antes: el nombre de la construcción, su valor y la lista de hijos en el mismo
+    orden que antes. Los usan __str__, graficar y los visitors que despachan por tipo.
+    """
+
+    __slots__ = ("posicion",)  # (línea, columna) del primer token, si se conoce
+
+    tipo = None
+    # Nombres de los campos de la subclase, en el orden de su constructor
+    campos = ()
+
+    @property
+    def valor(self):
+        return None
+
+    @property
+    def hijos(self):
+        return []
+
+    def __str__(self):
+        valor_str = str(self.valor) if self.valor is not None else "None"
+        hijos_str = ", ".join(self._convertir_hijo_a_str(hijo) for hijo in self.hijos)
+        return f"{self.tipo}: {valor_str}, Hijos: [{hijos_str}]"
+
+    def _convertir_hijo_a_str(self, hijo):
+        if isinstance(hijo, ASTNode):
+            return str(hijo)
+        elif isinstance(hijo, list):
+            return ", ".join(self._convertir_hijo_a_str(item) for item in hijo)
+        else:
+            return str(hijo)
+
+    def hijos_grafico(self):
+        """Hijos del nodo como se grafican: los elementos de un hijo que es lista son
+        hijos del nodo (una lista dentro de esa lista queda como un valor)."""
+        for hijo in self.hijos:
+            if isinstance(hijo, list):
+                yield from hijo
+            else:
+                yield hijo
+
+    def recorrer(self):
+        """Recorre el árbol en preorden, en el orden en que se grafica.
+
+        Genera (id, id del padre, nivel, tipo, valor, posición) por nodo, con ids
+        consecutivos desde 0 y None como padre de la raíz. Los hijos de cada nodo
+        son los de hijos_grafico, y los valores que no son nodos son hojas de tipo
+        'Valor'. Es iterativo y guarda un iterador por nivel, así que la memoria
+        depende de la profundidad del árbol y no de su tamaño.
+        """
+        yield 0, None, 0, self.tipo, self.valor, self.posicion
+        siguiente_id = 1
+        pendientes = [(0, self.hijos_grafico())]  # (id del padre, sus hijos que faltan)
+        while pendientes:
+            padre_id, hijos = pendientes[-1]
+            hijo = next(hijos, _AGOTADO)
+            if hijo is _AGOTADO:
+                pendientes.pop()
+                continue
+
+            nodo_id = siguiente_id
+            siguiente_id += 1
+            if isinstance(hijo, ASTNode):
+                yield nodo_id, padre_id, len(pendientes), hijo.tipo, hijo.valor, hijo.posicion
+                pendientes.append((nodo_id, hijo.hijos_grafico()))
+            else:
+                yield nodo_id, padre_id, len(pendientes), "Valor", hijo, None
+
+    def graficar(self, parent_id=None, node_count=0, nodes=None, edges=None, level=0):
+        """Agrega a nodes los (id, etiqueta) de los nodos del árbol y a edges sus aristas
+        (padre, hijo), numerando desde node_count. Retorna el siguiente id libre."""
+        if nodes is None:
+            nodes = []
+        if edges is None:
+            edges = []
+        for nodo_id, padre_id, _, tipo, valor, _ in self.recorrer():
+            nodes.append((node_count + nodo_id, etiqueta_nodo(tipo, valor)))
+            if padre_id is not None:
+                edges.append((node_count + padre_id, node_count + nodo_id))
+            elif parent_id is not None:
+                edges.append((parent_id, node_count))
+            ultimo_id = nodo_id
+        return node_count + ultimo_id + 1
+
+    def graficar_mpl(self, output_filename=None):
+        if output_filename is None:
+            output_filename = f"arbol_sintactico_{int(time.time())}.png"
+
+        nodes = []
+        edges = []
+        self.graficar(node_count=0, nodes=nodes, edges=edges)
+
+        # Import diferido: matplotlib y networkx se cargan solo al graficar
+        from .visualizacion_ast import guardar_imagen_arbol
+        guardar_imagen_arbol(nodes, edges, output_filename)
+        print(f"Árbol guardado como imagen: {output_filename}")
+        return output_filename
+
+    def crear_layout_arbol(self, G, nodes, edges):
+        """Posiciones de los nodos para graficar el árbol sin que se superpongan sus subárboles."""
+        from .layout_arbol import calcular_layout_arbol
+        return calcular_layout_arbol(nodes, edges)
+
+    # Método necesario para el patrón Visitor
+    def accept(self, visitor):
+        method_name = 'visit_' + self.tipo
+        visitor_method = getattr(visitor, method_name, None)
+        if visitor_method:
+            return visitor_method(self)
+        else:
+            raise NotImplementedError(f"No se encontró el método {method_name} en el visitor.")
+
+
+# Instrucciones
+
+class NodoBloque(ASTNode):
+    """Lista de instrucciones; hijos es la misma lista."""
+
+    __slots__ = campos = ("instrucciones",)
+    tipo = "Bloque"
+
+    def __init__(self, instrucciones, posicion=None):
+        self.instrucciones = instrucciones
+        self.posicion = posicion
+
+    @property
+    def hijos(self):
+        return self.instrucciones
+
+
+class NodoDeclaracion(ASTNode):
+    """[modificadores] tipo_dato nombre [= valor_inicial] ;
+
+    Sin valor inicial, delimitador es el token que terminó la declaración.
+    """
+
+    __slots__ = campos = ("modificadores", "tipo_dato", "nombre", "valor_inicial", "delimitador")
+    tipo = "Declaracion"
+
+    def __init__(self, modificadores, tipo_dato, nombre, valor_inicial=None, delimitador=None, posicion=None):
+        self.modificadores = modificadores
+        self.tipo_dato = tipo_dato
+        self.nombre = nombre
+        self.valor_inicial = valor_inicial
+        self.delimitador = delimitador
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return self.tipo_dato
+
+    @property
+    def hijos(self):
+        if self.valor_inicial is not None:
+            return [self.modificadores, NodoIdentificador(self.nombre), "=", self.valor_inicial]
+        return [self.modificadores, NodoIdentificador(self.nombre), self.delimitador]
+
+
+class NodoIf(ASTNode):
+    """if (condicion) { cuerpo } [else sino]; sino es un Bloque o el NodoIf de un else if.
+
+    Como antes, el tipo es IfElse cuando hay else, y entonces la condición es el valor.
+    """
+
+    __slots__ = campos = ("condicion", "cuerpo", "sino")
+
+    def __init__(self, condicion, cuerpo, sino=None, posicion=None):
+        self.condicion = condicion
+        self.cuerpo = cuerpo
+        self.sino = sino
+        self.posicion = posicion
+
+    @property
+    def tipo(self):
+        return "If" if self.sino is None else "IfElse"
+
+    @property
+    def valor(self):
+        return None if self.sino is None else self.condicion
+
+    @property
+    def hijos(self):
+        if self.sino is None:
+            return [self.condicion, self.cuerpo]
+        return [self.cuerpo, self.sino]
+
+
+class NodoWhile(ASTNode):
+    __slots__ = campos = ("condicion", "cuerpo")
+    tipo = "While"
+
+    def __init__(self, condicion, cuerpo, posicion=None):
+        self.condicion = condicion
+        self.cuerpo = cuerpo
+        self.posicion = posicion
+
+    @property
+    def hijos(self):
+        return [self.condicion, self.cuerpo]
+
+
+class NodoDoWhile(ASTNode):
+    __slots__ = campos = ("cuerpo", "condicion")
+    tipo = "DoWhile"
+
+    def __init__(self, cuerpo, condicion, posicion=None):
+        self.cuerpo = cuerpo
+        self.condicion = condicion
+        self.posicion = posicion
+
+    @property
+    def hijos(self):
+        return [self.cuerpo, self.condicion]
+
+
+class NodoFor(ASTNode):
+    """for (inicializacion; condicion; actualizacion) { cuerpo }
+
+    La inicialización es una NodoDeclaracion o una expresión.
+    """
+
+    __slots__ = campos = ("inicializacion", "condicion", "actualizacion", "cuerpo")
+    tipo = "For"
+
+    def __init__(self, inicializacion, condicion, actualizacion, cuerpo, posicion=None):
+        self.inicializacion = inicializacion
+        self.condicion = condicion
+        self.actualizacion = actualizacion
+        self.cuerpo = cuerpo
+        self.posicion = posicion
+
+    @property
+    def hijos(self):
+        return [self.inicializacion, self.condicion, self.actualizacion, self.cuerpo]
+
+
+class NodoFuncion(ASTNode):
+    """[modificadores] tipo_retorno nombre(parametros) { cuerpo }; parametros son tuplas (tipo, nombre)."""
+
+    __slots__ = campos = ("modificadores", "tipo_retorno", "nombre", "parametros", "cuerpo")
+    tipo = "Funcion"
+
+    def __init__(self, modificadores, tipo_retorno, nombre, parametros, cuerpo, posicion=None):
+        self.modificadores = modificadores
+        self.tipo_retorno = tipo_retorno
+        self.nombre = nombre
+        self.parametros = parametros
+        self.cuerpo = cuerpo
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return self.tipo_retorno
+
+    @property
+    def hijos(self):
+        return [self.modificadores, self.nombre, self.parametros, self.cuerpo]
+
+
+class NodoClase(ASTNode):
+    """[modificadores] class nombre { miembros }; los miembros son declaraciones y funciones."""
+
+    __slots__ = campos = ("modificadores", "nombre", "miembros")
+    tipo = "Clase"
+
+    def __init__(self, modificadores, nombre, miembros, posicion=None):
+        self.modificadores = modificadores
+        self.nombre = nombre
+        self.miembros = miembros
+        self.posicion = posicion
+
+    @property
+    def hijos(self):
+        return [self.modificadores, self.nombre, self.miembros]
+
+
+class NodoTryCatch(ASTNode):
+    """try { cuerpo_try } catch (tipo_excepcion nombre_excepcion) { cuerpo_catch }"""
+
+    __slots__ = campos = ("cuerpo_try", "tipo_excepcion", "nombre_excepcion", "cuerpo_catch")
+    tipo = "TryCatch"
+
+    def __init__(self, cuerpo_try, tipo_excepcion, nombre_excepcion, cuerpo_catch, posicion=None):
+        self.cuerpo_try = cuerpo_try
+        self.tipo_excepcion = tipo_excepcion
+        self.nombre_excepcion = nombre_excepcion
+        self.cuerpo_catch = cuerpo_catch
+        self.posicion = posicion
+
+    @property
+    def hijos(self):
+        return [self.cuerpo_try, (self.tipo_excepcion, self.nombre_excepcion), self.cuerpo_catch]
+
+
+class NodoSwitch(ASTNode):
+    """switch (expresion) { casos [default] }; casos es una lista de NodoCase."""
+
+    __slots__ = campos = ("expresion", "casos", "por_defecto")
+    tipo = "Switch"
+
+    def __init__(self, expresion, casos, por_defecto=None, posicion=None):
+        self.expresion = expresion
+        self.casos = casos
+        self.por_defecto = por_defecto  # NodoDefault o None
+        self.posicion = posicion
+
+    @property
+    def hijos(self):
+        return [self.expresion] + self.casos + ([self.por_defecto] if self.por_defecto is not None else [])
+
+
+class NodoCase(ASTNode):
+    __slots__ = campos = ("expresion", "cuerpo")
+    tipo = "Case"
+
+    def __init__(self, expresion, cuerpo, posicion=None):
+        self.expresion = expresion
+        self.cuerpo = cuerpo
+        self.posicion = posicion
+
+    @property
+    def hijos(self):
+        return [self.expresion, self.cuerpo]
+
+
+class NodoDefault(ASTNode):
+    __slots__ = campos = ("cuerpo",)
+    tipo = "Default"
+
+    def __init__(self, cuerpo, posicion=None):
+        self.cuerpo = cuerpo
+        self.posicion = posicion
+
+    @property
+    def hijos(self):
+        return [self.cuerpo]
+
+
+class NodoBreak(ASTNode):
+    __slots__ = campos = ()
+    tipo = "Break"
+
+    def __init__(self, posicion=None):
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return "break"
+
+
+class NodoPrint(ASTNode):
+    """funcion(argumentos); funcion es el texto del token (System.out.println o System.out.print)."""
+
+    __slots__ = campos = ("funcion", "argumentos")
+    tipo = "Print"
+
+    def __init__(self, funcion, argumentos, posicion=None):
+        self.funcion = funcion
+        self.argumentos = argumentos
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return self.funcion
+
+    @property
+    def hijos(self):
+        return self.argumentos
+
+
+class NodoError(ASTNode):
+    """Instrucción inválida que el parser descartó al recuperarse de un error."""
+
+    __slots__ = campos = ("mensaje",)
+    tipo = "Error"
+
+    def __init__(self, mensaje, posicion=None):
+        self.mensaje = mensaje
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return self.mensaje
+
+
+# Expresiones
+
+class NodoAsignacion(ASTNode):
+    """nombre = expresion; x += e se guarda como x = x + e."""
+
+    __slots__ = campos = ("nombre", "expresion")
+    tipo = "Asignacion"
+
+    def __init__(self, nombre, expresion, posicion=None):
+        self.nombre = nombre
+        self.expresion = expresion
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return "="
+
+    @property
+    def hijos(self):
+        return [NodoIdentificador(self.nombre), self.expresion]
+
+
+class NodoBinaria(ASTNode):
+    """izquierda operador derecha"""
+
+    __slots__ = campos = ("operador", "izquierda", "derecha")
+    tipo = "Expresion"
+
+    def __init__(self, operador, izquierda, derecha, posicion=None):
+        self.operador = operador
+        self.izquierda = izquierda
+        self.derecha = derecha
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return self.operador
+
+    @property
+    def hijos(self):
+        return [self.izquierda, self.derecha]
+
+
+class NodoUnaria(ASTNode):
+    """operador operando; los posfijos i++ e i-- tienen operador '++_post' y '--_post'."""
+
+    __slots__ = campos = ("operador", "operando")
+    tipo = "ExpresionUnaria"
+
+    def __init__(self, operador, operando, posicion=None):
+        self.operador = operador
+        self.operando = operando
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return self.operador
+
+    @property
+    def hijos(self):
+        return [self.operando]
+
+
+class NodoValor(ASTNode):
+    """Expresión que es un solo identificador o literal (tipo Expresion sin hijos)."""
+
+    __slots__ = campos = ("texto",)
+    tipo = "Expresion"
+
+    def __init__(self, texto, posicion=None):
+        self.texto = texto
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return self.texto
+
+
+class NodoOperando(ASTNode):
+    """Identificador o literal dentro de una operación."""
+
+    __slots__ = campos = ("texto",)
+    tipo = "Operando"
+
+    def __init__(self, texto, posicion=None):
+        self.texto = texto
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return self.texto
+
+
+class NodoIdentificador(ASTNode):
+    """Variable que se asigna o se incrementa."""
+
+    __slots__ = campos = ("nombre",)
+    tipo = "Identificador"
+
+    def __init__(self, nombre, posicion=None):
+        self.nombre = nombre
+        self.posicion = posicion
+
+    @property
+    def valor(self):
+        return self.nombre
@@ -0,0 +1,103 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Módulos del núcleo del compilador: los que importa cualquier proceso que solo
+# analiza o genera código (la línea de comandos, los procesos de los lotes, las pruebas)
+MODULOS_NUCLEO = (
+    "backend.analizador_lexico",
+    "backend.analizador_sintactico",
+    "backend.analizador_semantico",
+    "backend.generador_codigo",
+    "backend.generar_codigo2",
+)
+
+# Bibliotecas que el núcleo no puede importar: solo las usan la interfaz y los gráficos
+MODULOS_PROHIBIDOS = ("matplotlib", "networkx", "flet")
+
+# Tiempo máximo de importación del núcleo, en milisegundos
+PRESUPUESTO_MS = 60.0
+
+# Directorio desde el que se importa el paquete backend
+DIRECTORIO_FRONTEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Se escribe en stderr antes de importar, para separar los imports del arranque del intérprete
+_MARCA = "--- importando el núcleo ---"
+
+
+def medir_importacion(modulos=MODULOS_NUCLEO):
+    """Importa modulos en un intérprete nuevo con -X importtime.
+
+    Retorna el tiempo total en milisegundos (la suma de los tiempos acumulados de
+    los imports de primer nivel) y un diccionario con el tiempo acumulado de cada
+    módulo importado, también en milisegundos.
+    """
+    codigo = f"import sys; print({_MARCA!r}, file=sys.stderr, flush=True); import {', '.join(modulos)}"
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=DIRECTORIO_FRONTEND, capture_output=True, text=True,
+    )
+    if proceso.returncode != 0:
+        raise RuntimeError(f"No se pudo importar el núcleo:\n{proceso.stderr}")
+
+    lineas = proceso.stderr.splitlines()
+    total = 0
+    modulos_importados = {}
+    for linea in lineas[lineas.index(_MARCA) + 1:]:
+        if not linea.startswith("import time:"):
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        if not acumulado.strip().isdigit():
+            continue  # Encabezado
+        modulos_importados[nombre.strip()] = int(acumulado) / 1000
+        # Los imports anidados tienen más sangría; los de primer nivel, un espacio
+        if not nombre.startswith("  "):
+            total += int(acumulado)
+    return total / 1000, modulos_importados
+
+
+def verificar(presupuesto_ms=PRESUPUESTO_MS, repeticiones=5, modulos=MODULOS_NUCLEO):
+    """Mide la importación varias veces y la compara con el presupuesto.
+
+    Se queda con la medición más rápida: las más lentas son ruido del sistema. La
+    primera importación no se cuenta, porque puede estar compilando los .pyc.
+    Retorna un diccionario con el tiempo, los módulos de esa medición, los
+    módulos prohibidos que se importaron y si se respetó el presupuesto.
+    """
+    medir_importacion(modulos)
+    total, modulos_importados = min((medir_importacion(modulos) for _ in range(repeticiones)), key=lambda m: m[0])
+    prohibidos = sorted(
+        nombre for nombre in modulos_importados
+        if nombre.split(".")[0] in MODULOS_PROHIBIDOS
+    )
+    return {
+        "total_ms": total,
+        "modulos": modulos_importados,
+        "prohibidos": prohibidos,
+        "ok": total <= presupuesto_ms and not prohibidos,
+    }
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Verifica que el núcleo del compilador se importe dentro de un presupuesto de tiempo.")
+    parser.add_argument("--presupuesto", type=float, default=PRESUPUESTO_MS, help=f"milisegundos permitidos (por defecto {PRESUPUESTO_MS:g})")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--mostrar", type=int, default=10, metavar="N", help="cantidad de módulos más lentos a mostrar")
+    opciones = parser.parse_args(argumentos)
+
+    resultado = verificar(opciones.presupuesto, opciones.repeticiones)
+    mas_lentos = sorted(resultado["modulos"].items(), key=lambda modulo: modulo[1], reverse=True)
+    for nombre, milisegundos in mas_lentos[:opciones.mostrar]:
+        print(f"{milisegundos:8.1f} ms  {nombre}")
+    print(f"Importación del núcleo: {resultado['total_ms']:.1f} ms (presupuesto {opciones.presupuesto:g} ms)")
+
+    for nombre in resultado["prohibidos"]:
+        print(f"PROHIBIDO el núcleo importa {nombre}")
+    if resultado["total_ms"] > opciones.presupuesto:
+        print("EXCEDIDO el núcleo tarda más que el presupuesto en importarse.")
+    return 0 if resultado["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
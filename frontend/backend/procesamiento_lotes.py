@@ -0,0 +1,88 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .analizador_lexico import lexer_mmap
+from .analizador_sintactico import Parser
+from .arena_ast import ArenaAST
+
+
+def procesar_archivo(ruta, arena=False):
+    """Analiza léxica y sintácticamente un archivo .java.
+
+    Retorna un diccionario con la ruta, los tokens (TokenBuffer), el AST, todos los
+    errores de sintaxis (el parser se recupera de cada uno, así el AST tiene nodos
+    Error en su lugar) y el primero de ellos (None si no hubo). Los errores se
+    capturan para que un archivo inválido no detenga al resto del lote. Con arena,
+    el AST se retorna como ArenaAST, que ocupa menos memoria y se transfiere entre
+    procesos mucho más rápido que el árbol de nodos.
+    """
+    resultado = {"ruta": ruta, "tokens": None, "ast": None, "error": None, "errores": []}
+    try:
+        # El buffer se cierra al terminar: sin eso cada resultado retiene el mmap
+        # y el descriptor de su archivo, y un lote grande agota los descriptores
+        with lexer_mmap(ruta) as tokens:
+            resultado["tokens"] = tokens
+            parser = Parser(tokens, recuperar=True)
+            resultado["ast"] = parser.parse(graficar=False)
+            resultado["errores"] = parser.errores
+        if arena and resultado["ast"] is not None:
+            resultado["ast"] = ArenaAST.desde_arbol(resultado["ast"])
+    except (OSError, UnicodeDecodeError, SyntaxError) as e:
+        resultado["errores"] = [f"{type(e).__name__}: {e}"]
+    if resultado["errores"]:
+        resultado["error"] = resultado["errores"][0]
+    return resultado
+
+
+def procesar_archivos(rutas, trabajadores=None, arena=False):
+    """Procesa varios archivos en paralelo con un ProcessPoolExecutor.
+
+    trabajadores es la cantidad de procesos (None usa todos los núcleos, 1 procesa
+    en el proceso actual). arena se pasa a procesar_archivo. Los resultados
+    vuelven en el mismo orden que rutas.
+    """
+    rutas = list(rutas)
+    procesar = partial(procesar_archivo, arena=arena)
+    if trabajadores == 1 or len(rutas) <= 1:
+        return [procesar(ruta) for ruta in rutas]
+
+    # Lotes de varios archivos por tarea para no pagar la comunicación por archivo
+    tamano_lote = max(1, len(rutas) // ((trabajadores or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        return list(pool.map(procesar, rutas, chunksize=tamano_lote))
+
+
+def buscar_archivos_java(rutas):
+    """Expande los directorios de rutas a sus archivos .java (en orden alfabético)."""
+    archivos = []
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            encontrados = []
+            for raiz, _, nombres in os.walk(ruta):
+                encontrados.extend(os.path.join(raiz, nombre) for nombre in nombres if nombre.endswith(".java"))
+            archivos.extend(sorted(encontrados))
+        else:
+            archivos.append(ruta)
+    return archivos
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Análisis léxico y sintáctico de varios archivos Java en paralelo.")
+    parser.add_argument("rutas", nargs="+", help="archivos .java o directorios que los contienen")
+    parser.add_argument("-j", "--trabajadores", type=int, default=None, help="cantidad de procesos (por defecto, todos los núcleos)")
+    opciones = parser.parse_args(argumentos)
+
+    resultados = procesar_archivos(buscar_archivos_java(opciones.rutas), opciones.trabajadores)
+    for resultado in resultados:
+        cantidad = len(resultado["tokens"]) if resultado["tokens"] is not None else 0
+        errores = resultado["errores"]
+        print(f"{resultado['ruta']}: {cantidad} tokens, {f'{len(errores)} errores' if errores else 'OK'}")
+        for error in errores:
+            print(f"    {error}")
+    return 1 if any(resultado["error"] for resultado in resultados) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
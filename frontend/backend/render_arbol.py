@@ -0,0 +1,196 @@
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .nodos_ast import etiqueta_nodo
+
+# Cambia cuando cambia cómo se dibuja el árbol, para no reutilizar imágenes viejas
+VERSION_RENDER = 1
+
+DIRECTORIO_POR_DEFECTO = os.path.join(tempfile.gettempdir(), "compilador_arboles")
+
+
+def estructura_arbol(ast):
+    """nodes y edges del árbol (como los arma ASTNode.graficar) y el hash de su estructura.
+
+    El hash cubre la forma del árbol y las etiquetas de sus nodos, que es lo único
+    que se dibuja: dos árboles con el mismo hash dan la misma imagen aunque sus
+    nodos estén en otras líneas.
+    """
+    nodes = []
+    edges = []
+    resumen = hashlib.sha256(f"render {VERSION_RENDER}\n".encode())
+    for nodo_id, padre_id, _, tipo, valor, _ in ast.recorrer():
+        etiqueta = etiqueta_nodo(tipo, valor)
+        nodes.append((nodo_id, etiqueta))
+        if padre_id is not None:
+            edges.append((padre_id, nodo_id))
+        resumen.update(f"{padre_id}\t{etiqueta}\n".encode("utf-8", "surrogatepass"))
+    return nodes, edges, resumen.hexdigest()
+
+
+class AlmacenImagenes:
+    """Directorio de imágenes de árboles nombradas por el hash de su estructura.
+
+    Guarda como máximo max_imagenes imágenes y max_bytes en total; al pasarse
+    borra las usadas hace más tiempo (cada uso actualiza la fecha de
+    modificación del archivo, así el orden sobrevive entre ejecuciones).
+    """
+
+    def __init__(self, directorio=DIRECTORIO_POR_DEFECTO, max_imagenes=64, max_bytes=256 * 1024 * 1024):
+        self.directorio = directorio
+        self.max_imagenes = max_imagenes
+        self.max_bytes = max_bytes
+
+    def ruta(self, clave):
+        os.makedirs(self.directorio, exist_ok=True)
+        return os.path.join(self.directorio, f"{clave}.png")
+
+    def obtener(self, clave):
+        """Ruta de la imagen de clave, marcándola como recién usada; None si no está."""
+        ruta = os.path.join(self.directorio, f"{clave}.png")
+        try:
+            os.utime(ruta)
+        except FileNotFoundError:
+            return None
+        return ruta
+
+    def podar(self):
+        """Borra las imágenes usadas hace más tiempo hasta respetar los límites."""
+        imagenes = []
+        for entrada in os.scandir(self.directorio):
+            if entrada.name.endswith(".png"):
+                try:
+                    estado = entrada.stat()
+                except FileNotFoundError:
+                    continue
+                imagenes.append((estado.st_mtime, estado.st_size, entrada.path))
+        imagenes.sort()
+
+        total = sum(tamano for _, tamano, _ in imagenes)
+        while imagenes and (len(imagenes) > self.max_imagenes or total > self.max_bytes):
+            _, tamano, ruta = imagenes.pop(0)
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+            total -= tamano
+
+
+def _renderizar(nodes, edges, ruta):
+    """Dibuja el árbol en ruta. Corre en el proceso del renderizador."""
+    import matplotlib
+    matplotlib.use("Agg")  # Sin ventanas: el proceso solo escribe archivos
+    from .visualizacion_ast import guardar_imagen_arbol
+
+    # Se escribe con otro nombre y se renombra, así nunca se lee una imagen a medio escribir
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    try:
+        guardar_imagen_arbol(nodes, edges, temporal)
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    return ruta
+
+
+class RenderizadorArbol:
+    """Genera las imágenes de los árboles en un proceso aparte, con un AlmacenImagenes como cache.
+
+    solicitar() retorna enseguida: si la imagen ya está en el almacén llama a
+    al_terminar en el momento; si no, la dibuja el proceso renderizador y
+    al_terminar se llama desde otro hilo cuando termina. Pedir otra vez un árbol
+    que se está dibujando no lo dibuja dos veces. Si el proceso renderizador
+    muere, el pedido falla con el error en al_terminar y el siguiente usa un
+    proceso nuevo.
+    """
+
+    def __init__(self, almacen=None):
+        self.almacen = almacen or AlmacenImagenes()
+        self._pool = None
+        self._pendientes = {}  # Clave -> Future de las imágenes que se están dibujando
+        self._lock = threading.Lock()
+
+    def solicitar(self, ast, al_terminar):
+        """Pide la imagen del árbol y retorna su clave.
+
+        al_terminar(clave, ruta, error) recibe la ruta de la imagen, o None y el
+        mensaje de error si no se pudo dibujar.
+        """
+        nodes, edges, clave = estructura_arbol(ast)
+        ruta = self.almacen.obtener(clave)
+        if ruta is not None:
+            al_terminar(clave, ruta, None)
+            return clave
+
+        error = None
+        with self._lock:
+            futuro = self._pendientes.get(clave)
+            nuevo = futuro is None
+            if nuevo:
+                try:
+                    futuro = self._enviar(nodes, edges, clave)
+                except BrokenProcessPool:
+                    # El proceso renderizador murió en un pedido anterior: se reemplaza el pool
+                    self._descartar_pool()
+                    try:
+                        futuro = self._enviar(nodes, edges, clave)
+                    except BrokenProcessPool as e:
+                        self._descartar_pool()
+                        error = f"{type(e).__name__}: {e}"
+                if error is None:
+                    self._pendientes[clave] = futuro
+
+        if error is not None:
+            al_terminar(clave, None, error)
+            return clave
+        # Fuera del lock: si el futuro ya terminó, el callback corre en este hilo
+        if nuevo:
+            pool = self._pool
+            futuro.add_done_callback(lambda futuro: self._terminado(futuro, clave, pool))
+        futuro.add_done_callback(lambda futuro: self._avisar(futuro, clave, al_terminar))
+        return clave
+
+    def _enviar(self, nodes, edges, clave):
+        if self._pool is None:
+            # Un solo proceso: los árboles se dibujan de a uno y en orden
+            self._pool = ProcessPoolExecutor(max_workers=1)
+        return self._pool.submit(_renderizar, nodes, edges, self.almacen.ruta(clave))
+
+    def _descartar_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _terminado(self, futuro, clave, pool):
+        with self._lock:
+            self._pendientes.pop(clave, None)
+            roto = not futuro.cancelled() and isinstance(futuro.exception(), BrokenProcessPool)
+            if roto and self._pool is pool:
+                # El proceso murió dibujando: el próximo pedido usa un pool nuevo
+                self._descartar_pool()
+        self.almacen.podar()
+
+    @staticmethod
+    def _avisar(futuro, clave, al_terminar):
+        if futuro.cancelled():
+            al_terminar(clave, None, "El pedido se canceló al reemplazar el proceso renderizador.")
+            return
+        error = futuro.exception()
+        if error is not None:
+            al_terminar(clave, None, f"{type(error).__name__}: {error}")
+        else:
+            al_terminar(clave, futuro.result(), None)
+
+    def cerrar(self):
+        """Termina el proceso renderizador (las imágenes pendientes se terminan de dibujar)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+# Instancia compartida por las páginas
+renderizador_arbol = RenderizadorArbol()
@@ -0,0 +1,28 @@
+import matplotlib.pyplot as plt
+import networkx as nx
+
+from .layout_arbol import calcular_layout_arbol
+
+# Dibujo del AST con matplotlib y networkx. Es el único módulo del backend que
+# los importa y nadie lo importa al cargarse: ASTNode.graficar_mpl y el proceso de
+# render_arbol lo cargan la primera vez que dibujan, así analizar y exportar
+# árboles no depende de estas bibliotecas ni paga su importación.
+
+
+def guardar_imagen_arbol(nodes, edges, output_filename):
+    """Dibuja el árbol de nodes y edges (como los arma ASTNode.graficar) en un PNG."""
+    G = nx.DiGraph()
+    for node_id, label in nodes:
+        G.add_node(node_id, label=label)
+    for start, end in edges:
+        G.add_edge(start, end)
+
+    pos = calcular_layout_arbol(nodes, edges)
+    labels = nx.get_node_attributes(G, 'label')
+
+    plt.figure(figsize=(20, 15))
+    nx.draw(G, pos, with_labels=True, labels=labels, node_size=2000, node_color='lightblue', font_size=7, font_weight='bold', arrows=True)
+    plt.title("Árbol Sintáctico Abstracto")
+    plt.tight_layout()
+    plt.savefig(output_filename, format="PNG")
+    plt.close()  # Sin cerrarla, pyplot guarda cada figura hasta que termina el proceso
@@ -108,4 +108,7 @@ def main(page: ft.Page):
     # Actualizar el diseño al iniciar la aplicación
     navigate_to("home")
 
-ft.app(target=main)
+# Sin la guarda, los procesos que se inician con spawn (Windows, macOS), como el
+# renderizador del árbol, vuelven a importar este módulo y abren otra aplicación
+if __name__ == "__main__":
+    ft.app(target=main)
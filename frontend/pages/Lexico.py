@@ -1,5 +1,6 @@
 import flet as ft
-from backend.analizador_lexico import lexer
+from backend.analizador_lexico import TokenBuffer, lexer_compacto, relexer_incremental, calcular_edicion
+from backend.cache_fases import cache_fases
 
 
 class Lexico_page():
@@ -10,8 +11,16 @@ class Lexico_page():
         self.table = ft.Column()  # Control para la tabla
 
     def update_code(self, code):
+        if not isinstance(self.tokens, TokenBuffer) or code != self.tokens.codigo:
+            self.tokens = cache_fases.tokens(code, lambda: self._analizar(code))  # Obtener los tokens
         self.code = code
-        self.tokens = lexer(self.code)  # Obtener los tokens
+
+    def _analizar(self, code):
+        if not isinstance(self.tokens, TokenBuffer):
+            return lexer_compacto(code)
+        # Solo se vuelve a analizar la zona que cambió desde el último análisis
+        offset, eliminados, insertado = calcular_edicion(self.tokens.codigo, code)
+        return relexer_incremental(self.tokens, offset, eliminados, insertado)
     
     def get_tokens(self):
         return self.tokens
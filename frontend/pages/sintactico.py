@@ -1,7 +1,8 @@
 import flet as ft
-import os
-import time
-from backend.analizador_sintactico import Parser
+from backend.cache_fases import cache_fases
+from backend.analizador_sintactico import parser_incremental
+from backend.render_arbol import renderizador_arbol
+from Components.arbolAST import ArbolAST
 
 class Sintactico_page():
     def __init__(self, page, lexico_page):
@@ -9,13 +10,15 @@ class Sintactico_page():
         self.ast = None  # ← AQUÍ guardas el AST
         self.lexico_page = lexico_page  # Instancia de Lexico_page
         self.result_text = ft.Text("", color="black")  # Mensaje de resultado del análisis
+        self.arbol = ArbolAST(page)  # El AST como árbol desplegable, con la posición de cada nodo
 
         # Variables para el desplazamiento
         self.offset_x = 0
         self.offset_y = 0
         self.zoom_factor = 1.0  # Factor de zoom inicial
 
-        # Imagen del árbol sintáctico
+        # Imagen del árbol sintáctico; se dibuja en segundo plano y se guarda en el
+        # almacén de renderizador_arbol, así un árbol que no cambió no se vuelve a dibujar
         self.image = None
         self.generated_image_path = None
 
@@ -42,14 +45,55 @@ class Sintactico_page():
         )
 
 
-    def limpiar_imagenes(self):
-        """Eliminar imágenes generadas cuando el usuario navega o cierra la página"""
-        if self.generated_image_path and os.path.exists(self.generated_image_path):
-            try:
-                os.remove(self.generated_image_path)
-                print(f"🗑 Imagen eliminada: {self.generated_image_path}")
-            except Exception as e:
-                print(f"❌ Error al eliminar la imagen: {e}")
+    def marco_imagen(self, contenido):
+        """Contenedor del Stack de la imagen, en la posición actual del desplazamiento"""
+        return ft.Container(
+            content=contenido,
+            left=self.offset_x,
+            top=self.offset_y,
+            alignment=ft.alignment.center,
+            border=ft.border.all(1, "gray"),
+            border_radius=10,
+            bgcolor="#f8f8f8",
+            clip_behavior=ft.ClipBehavior.HARD_EDGE,
+        )
+
+    def mostrar_cargando(self):
+        """Muestra un indicador en el lugar de la imagen mientras se dibuja el árbol"""
+        self.image_container.content.controls[0] = self.marco_imagen(
+            ft.Column(
+                controls=[ft.ProgressRing(), ft.Text("Generando el árbol...", color="gray")],
+                alignment=ft.MainAxisAlignment.CENTER,
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                width=500,
+                height=400,
+            )
+        )
+        self.image_container.update()
+
+    def imagen_lista(self, ast, ruta, error):
+        """Callback de renderizador_arbol; puede llegar desde otro hilo"""
+        if ast is not self.ast:
+            return  # El árbol se volvió a analizar mientras se dibujaba esta imagen
+
+        if ruta is not None:
+            self.generated_image_path = ruta
+            self.image = ft.Image(
+                src=ruta,
+                width=int(500 * self.zoom_factor),
+                height=int(400 * self.zoom_factor),
+                visible=True
+            )
+            self.image_container.content.controls[0] = self.marco_imagen(self.image)
+            self.image_container.update()
+
+            self.result_text.value = "✅ Análisis sintáctico exitoso. Árbol generado."
+            self.result_text.color = "green"
+        else:
+            print("❌ Error al generar la imagen del árbol:", error)
+            self.result_text.value = "⚠ Análisis completado, pero no se pudo generar la imagen."
+            self.result_text.color = "orange"
+        self.page.update()
 
     def analizar_codigo(self, e):
         """Función que se ejecuta cuando el usuario presiona 'Analizar Código'"""
@@ -58,47 +102,26 @@ class Sintactico_page():
 
         if tokens:
             try:
-                # Generar un nombre único para la imagen
-                timestamp = int(time.time())
-                image_path = f"arbol_sintactico_{timestamp}.png"
-
-                self.limpiar_imagenes()
-
-                parsear = Parser(tokens)  # Crear el analizador sintáctico
-                self.ast = parsear.parse()  # Asumimos que el parseo devuelve un AST
-
-                print("✅ Análisis sintáctico exitoso.")
-
-                # Verificar si la imagen fue creada y su ruta
-                self.generated_image_path = self.ast.graficar_mpl(output_filename=image_path)
-
-                if os.path.exists(self.generated_image_path):
-                    self.image = ft.Image(
-                        src=self.generated_image_path,
-                        width=int(500 * self.zoom_factor),
-                        height=int(400 * self.zoom_factor),
-                        visible=True
-                    )
-
-                    self.image_container.content.controls[0] = ft.Container(
-                        content=self.image,
-                        left=self.offset_x,
-                        top=self.offset_y,
-                        alignment=ft.alignment.center,
-                        border=ft.border.all(1, "gray"),
-                        border_radius=10,
-                        bgcolor="#f8f8f8",
-                        clip_behavior=ft.ClipBehavior.HARD_EDGE,
-                    )
-
-                    self.image_container.update()
-
-                    self.result_text.value = "✅ Análisis sintáctico exitoso. Árbol generado."
+                # El AST se reutiliza de la cache si el código no cambió; si cambió,
+                # el parser incremental solo analiza las clases y funciones editadas
+                self.ast = cache_fases.ast(
+                    self.lexico_page.code, tokens, lambda: parser_incremental.parse(tokens)
+                )
+                self.arbol.mostrar(self.ast)
+
+                if self.ast is not None:
+                    print("✅ Análisis sintáctico exitoso.")
+                    self.result_text.value = "✅ Análisis sintáctico exitoso. Generando el árbol..."
                     self.result_text.color = "green"
+
+                    # La imagen se dibuja en otro proceso; si ya estaba en el almacén,
+                    # imagen_lista la muestra antes de que solicitar retorne
+                    self.mostrar_cargando()
+                    ast = self.ast
+                    renderizador_arbol.solicitar(ast, lambda clave, ruta, error: self.imagen_lista(ast, ruta, error))
                 else:
-                    self.image.visible = False
-                    self.result_text.value = "⚠ Análisis completado, pero no se encontró la imagen."
-                    self.result_text.color = "orange"
+                    self.result_text.value = "❌ Error en el análisis sintáctico."
+                    self.result_text.color = "red"
 
             except Exception as ex:
                 print("❌ Error en el análisis sintáctico:", ex)
@@ -183,6 +206,11 @@ class Sintactico_page():
                     spacing=80,
                 ),
                 ft.Container(content=self.result_text, padding=ft.padding.only(top=20)),
+                ft.Container(
+                    content=ft.Text("Explorar el Árbol:", weight=ft.FontWeight.BOLD, color="black"),
+                    padding=ft.padding.only(top=20)
+                ),
+                self.arbol.arbolAST_component(),
             ],
             alignment=ft.MainAxisAlignment.CENTER,
             horizontal_alignment=ft.CrossAxisAlignment.CENTER,
@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import scrolledtext, font, filedialog
-from frontend.backend.analizador_lexico import lexer  
+from frontend.backend.analizador_lexico import lexer_compacto
 #from analizador_sintactico import Parser
 
 def analyze_code():
@@ -10,7 +10,7 @@ def analyze_code():
     try:
 
         # Analisis Lexico
-        tokens = lexer(code)  
+        tokens = lexer_compacto(code)
         output_text.delete("1.0", tk.END)  
 
         output_text.insert(tk.END, f"{'Tipos de Tokens':<40}  {'Valores':<30}    {'posiciones':<10} \n")
@@ -0,0 +1,60 @@
+import io
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "frontend"))
+
+from backend.analizador_lexico import iter_tokens  # noqa: E402
+
+
+def _segundos_por_mb(fuente, megabytes):
+    inicio = time.perf_counter()
+    for _ in iter_tokens(fuente):
+        pass
+    return (time.perf_counter() - inicio) / megabytes
+
+
+class PruebaLexicoStreaming(unittest.TestCase):
+    """iter_tokens sobre un archivo tiene que ser lineal, como sobre un str.
+
+    Un token que cruza muchos bloques (un comentario o string sin cerrar) se
+    reintenta cada vez que llega más texto; si cada reintento agregara un solo
+    bloque, el análisis sería cuadrático.
+    """
+
+    FRAGMENTOS = ("/* ", '\\"')
+    TAMANOS_MB = (0.25, 2)
+    # Lineal, el archivo tarda lo mismo por MB en ambos tamaños y unas 3 veces lo
+    # que tarda el str; con un reintento por bloque tardaba 5 veces más por MB a
+    # 2 MB y unas 18 veces lo del str
+    FACTOR_LINEALIDAD = 2.5
+    FACTOR_STR = 6.0
+
+    def test_mismos_tokens_que_str(self):
+        for fragmento in self.FRAGMENTOS + ('x = "/*', "int x = 1; // c\n"):
+            codigo = fragmento * 5000
+            for tamano_bloque in (1, 7, 4096):
+                with self.subTest(fragmento=fragmento, tamano_bloque=tamano_bloque):
+                    self.assertEqual(
+                        list(iter_tokens(io.StringIO(codigo), tamano_bloque=tamano_bloque)),
+                        list(iter_tokens(codigo)),
+                    )
+
+    def test_archivo_lineal_como_str(self):
+        for fragmento in self.FRAGMENTOS:
+            por_mb = {}
+            for megabytes in self.TAMANOS_MB:
+                codigo = fragmento * int(megabytes * 1024 * 1024 // len(fragmento))
+                por_mb[megabytes] = (_segundos_por_mb(io.StringIO(codigo), megabytes), _segundos_por_mb(codigo, megabytes))
+
+            archivo_menor, _ = por_mb[self.TAMANOS_MB[0]]
+            archivo_mayor, str_mayor = por_mb[self.TAMANOS_MB[-1]]
+            with self.subTest(fragmento=fragmento):
+                self.assertLessEqual(archivo_mayor, max(archivo_menor, 0.01) * self.FACTOR_LINEALIDAD)
+                self.assertLessEqual(archivo_mayor, max(str_mayor, 0.01) * self.FACTOR_STR)
+
+
+if __name__ == "__main__":
+    unittest.main()
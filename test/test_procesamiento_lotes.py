@@ -0,0 +1,48 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "frontend"))
+
+from backend.procesamiento_lotes import procesar_archivos  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@unittest.skipIf(resource is None, "necesita resource.setrlimit (POSIX)")
+class PruebaDescriptoresLotes(unittest.TestCase):
+    """Un lote en el proceso actual no puede retener un descriptor por archivo."""
+
+    LIMITE = 256
+
+    def setUp(self):
+        self.limites = resource.getrlimit(resource.RLIMIT_NOFILE)
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        resource.setrlimit(resource.RLIMIT_NOFILE, self.limites)
+        self.directorio.cleanup()
+
+    def test_mas_archivos_que_descriptores(self):
+        rutas = []
+        for i in range(self.LIMITE + 200):
+            ruta = os.path.join(self.directorio.name, f"Clase{i}.java")
+            with open(ruta, "w", encoding="ascii") as archivo:
+                archivo.write(f"class Clase{i} {{ int x = {i}; void f() {{ x = x + 1; }} }}\n")
+            rutas.append(ruta)
+
+        resource.setrlimit(resource.RLIMIT_NOFILE, (self.LIMITE, self.limites[1]))
+        resultados = procesar_archivos(rutas, trabajadores=1)
+
+        self.assertEqual([resultado["error"] for resultado in resultados], [None] * len(rutas))
+        # Los tokens siguen siendo legibles después de cerrar el mmap
+        tokens = resultados[-1]["tokens"]
+        self.assertEqual(tokens.valor(1), f"Clase{len(rutas) - 1}")
+
+
+if __name__ == "__main__":
+    unittest.main()